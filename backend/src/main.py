@@ -1,13 +1,15 @@
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, HTTPException, Request, status, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy import func
 from datetime import datetime, date, timedelta
 from typing import List, Optional
 import os
 import io
+import logging
+import time
 from dotenv import load_dotenv
 
 from services.database import get_db, engine, Base
@@ -18,6 +20,7 @@ from models.models import (
     UserSystemAssignment,
     ChecklistRecord,
     ChecklistRecordLog,
+    SchedulerJobRun,
 )
 from services.schemas import (
     UserLogin,
@@ -31,16 +34,44 @@ from services.schemas import (
     ConsoleStatsResponse,
     ConsoleFailItemResponse,
     ExcelExportRequest,
+    SchedulerJobRunResponse,
+    SlowQueryResponse,
 )
 from services.auth import (
     verify_password,
     get_password_hash,
     create_access_token,
+    employee_id_from_token,
     get_current_user,
 )
-from services.scheduler import init_scheduler, get_korea_today
+from services.scheduler import init_scheduler, shutdown_scheduler, get_korea_today
+from services.daily_slots import mark_slot, slot_status_counts, unchecked_items as find_unchecked_items
+from services.fail_history import group_status_history, summarize_fail_history
+from services.import_jobs import IMPORT_UPLOAD_PATH_PREFIX, upload_exceeds_limit, upload_too_large_message
+from services.logging_config import REQUEST_ID_HEADER, reset_request_id, setup_logging, start_request_id
+from services.query_stats import apply_headers, instrument_engine, reset_request, start_request, warn_repeated_queries
+from services.request_profiler import (
+    PROFILE_HEADER,
+    SamplingProfiler,
+    list_profiles,
+    profile_requested,
+    resolve_profile,
+    save_profile,
+)
+from services.metrics import (
+    METRICS_AVAILABLE,
+    CONTENT_TYPE_LATEST,
+    observe_export,
+    observe_request,
+    render_metrics,
+    route_label,
+    track_in_progress,
+)
 
 load_dotenv()
+setup_logging()
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(title="DX본부 시스템 체크리스트", version="1.0.0")
 
@@ -50,19 +81,51 @@ app = FastAPI(title="DX본부 시스템 체크리스트", version="1.0.0")
 async def startup_event():
     try:
         Base.metadata.create_all(bind=engine)
-        print("데이터베이스 연결 성공 및 테이블 생성 완료")
+        logger.info("데이터베이스 연결 성공 및 테이블 생성 완료")
+
+        from services.status_migration import legacy_status_tables
+
+        legacy_tables = legacy_status_tables(engine)
+        if legacy_tables:
+            logger.warning(
+                "%s 테이블의 상태 컬럼이 문자열로 저장되어 있습니다. "
+                "서버를 중지하고 python backend/src/utils/migrate_status_encoding.py 를 실행하세요.",
+                ", ".join(legacy_tables),
+            )
     except Exception as e:
-        print(f"데이터베이스 연결 오류: {e}")
-        print("데이터베이스가 설정되지 않았습니다. .env 파일을 확인하세요.")
+        logger.error("데이터베이스 연결 오류: %s (.env 파일의 DATABASE_URL을 확인하세요)", e)
     
     # 스케줄러 초기화 (startup 이벤트에서 실행)
     try:
         init_scheduler()
-        print("스케줄러 초기화 완료")
+        logger.info("스케줄러 초기화 완료")
+    except Exception:
+        logger.exception("스케줄러 초기화 오류")
+
+
+# 애플리케이션 종료 시 스케줄러 정리 (실행 중인 작업 완료 대기)
+@app.on_event("shutdown")
+async def shutdown_event():
+    try:
+        await shutdown_scheduler()
     except Exception as e:
-        print(f"스케줄러 초기화 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error("스케줄러 종료 오류: %s", e)
+
+
+# import 업로드 크기 제한 (multipart 파서가 본문을 임시 파일로 받기 전에 Content-Length로 거부)
+# CORS 미들웨어보다 먼저 등록하여 안쪽에서 실행되므로 413 응답에도 CORS 헤더가 붙습니다.
+@app.middleware("http")
+async def upload_size_limit_middleware(request: Request, call_next):
+    if (
+        request.method == "POST"
+        and request.url.path.startswith(IMPORT_UPLOAD_PATH_PREFIX)
+        and upload_exceeds_limit(request.headers.get("content-length"))
+    ):
+        return JSONResponse(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            content={"detail": upload_too_large_message()},
+        )
+    return await call_next(request)
 
 
 # CORS 설정
@@ -107,6 +170,63 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# 요청별 쿼리 수/DB 시간 측정 (X-Query-Count, Server-Timing 헤더, N+1 경고) 및 요청 메트릭 수집
+instrument_engine(engine)
+
+
+def profiling_employee_id(request: Request) -> Optional[str]:
+    """프로파일링을 요청한 console 사용자의 사번 (요청하지 않았거나 권한이 없으면 None)"""
+    if not profile_requested(request):
+        return None
+    scheme, _, credentials = request.headers.get("Authorization", "").partition(" ")
+    employee_id = employee_id_from_token(credentials) if scheme.lower() == "bearer" else None
+    return employee_id if employee_id in CONSOLE_ACCESS_EMPLOYEE_IDS else None
+
+
+@app.middleware("http")
+async def request_stats_middleware(request: Request, call_next):
+    request_id_token, request_id = start_request_id(request.headers.get(REQUEST_ID_HEADER))
+    try:
+        response = await handle_request(request, call_next)
+    finally:
+        reset_request_id(request_id_token)
+    response.headers[REQUEST_ID_HEADER] = request_id
+    return response
+
+
+async def handle_request(request: Request, call_next):
+    """요청 처리 및 쿼리 헤더, 메트릭, 프로파일 기록 (요청 ID가 설정된 상태에서 실행)"""
+    token, stats = start_request(f"{request.method} {request.url.path}")
+    profile_employee_id = profiling_employee_id(request)
+    profiler = SamplingProfiler().start() if profile_employee_id else None
+    started = time.perf_counter()
+    with track_in_progress(request.method):
+        try:
+            response = await call_next(request)
+        except Exception:
+            observe_request(request.method, route_label(request), 500, time.perf_counter() - started)
+            raise
+        finally:
+            reset_request(token)
+            if profiler:
+                profiler.stop()
+    observe_request(request.method, route_label(request), response.status_code, time.perf_counter() - started)
+    apply_headers(response, stats)
+    warn_repeated_queries(request.method, request.url.path, stats)
+    if profiler:
+        profile_path = save_profile(profiler, request.method, request.url.path, profile_employee_id)
+        response.headers[PROFILE_HEADER] = profile_path.name
+        logger.info(
+            "요청 프로파일 저장: %s %s (%s) 샘플 %d개 → %s",
+            request.method,
+            request.url.path,
+            profile_employee_id,
+            profiler.samples,
+            profile_path.name,
+        )
+    return response
+
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
 
@@ -115,14 +235,29 @@ async def root():
     return {"message": "DX본부 시스템 체크리스트 API"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus 메트릭 (요청/DB/스케줄러/메일/다운로드)"""
+    if not METRICS_AVAILABLE:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="메트릭 라이브러리(prometheus_client)가 설치되지 않았습니다. pip install prometheus_client",
+        )
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/api/scheduler/status")
-async def get_scheduler_status():
-    """스케줄러 상태 확인"""
+async def get_scheduler_status(db: Session = Depends(get_db)):
+    """스케줄러 상태 확인 (작업별 다음 실행 시간 및 마지막 실행 결과)"""
     from services.scheduler import scheduler
+    from services.job_runs import get_last_runs
+
+    last_runs = get_last_runs(db)
 
     jobs = []
     if scheduler.running:
         for job in scheduler.get_jobs():
+            last_run = last_runs.get(job.id)
             jobs.append(
                 {
                     "id": job.id,
@@ -131,12 +266,42 @@ async def get_scheduler_status():
                         job.next_run_time.isoformat() if job.next_run_time else None
                     ),
                     "trigger": str(job.trigger),
+                    "last_run": (
+                        SchedulerJobRunResponse.model_validate(last_run)
+                        if last_run
+                        else None
+                    ),
                 }
             )
 
     return {"running": scheduler.running, "jobs": jobs}
 
 
+@app.get("/api/scheduler/runs", response_model=List[SchedulerJobRunResponse])
+async def get_scheduler_runs(
+    job_id: Optional[str] = None,
+    status_filter: Optional[str] = None,
+    over_budget: Optional[bool] = None,
+    limit: int = 50,
+    db: Session = Depends(get_db),
+):
+    """스케줄러 작업 실행 이력 조회 (최신순)
+
+    - job_id: 특정 작업만 조회 (예: check_time_1)
+    - status_filter: RUNNING, SUCCESS, FAILED, MISSED, SKIPPED
+    - over_budget: true이면 시간 예산을 초과한 실행만 조회
+    """
+    query = db.query(SchedulerJobRun)
+    if job_id:
+        query = query.filter(SchedulerJobRun.job_id == job_id)
+    if status_filter:
+        query = query.filter(SchedulerJobRun.status == status_filter.upper())
+    if over_budget is not None:
+        query = query.filter(SchedulerJobRun.over_budget == over_budget)
+
+    return query.order_by(SchedulerJobRun.id.desc()).limit(min(limit, 500)).all()
+
+
 @app.delete("/api/scheduler/jobs/{job_id}")
 async def cancel_scheduled_job(job_id: str):
     """예약된 작업 취소 (개발자용)"""
@@ -174,14 +339,76 @@ async def cancel_scheduled_job(job_id: str):
         )
 
 
-@app.post("/api/scheduler/test")
+@app.get("/api/scheduler/runs/{run_id}", response_model=SchedulerJobRunResponse)
+async def get_scheduler_run(run_id: int, db: Session = Depends(get_db)):
+    """스케줄러 작업 실행 상태 조회 (수동 실행 요청 후 반환된 run_id로 조회)"""
+    run = db.query(SchedulerJobRun).filter(SchedulerJobRun.id == run_id).first()
+    if not run:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"실행 이력 ID '{run_id}'를 찾을 수 없습니다.",
+        )
+    return run
+
+
+async def _trigger_scheduler_job(job_key: str, message: str):
+    """스케줄러 작업 수동 실행 요청 공통 처리 (작업은 백그라운드에서 실행)"""
+    from services.scheduler import trigger_job_now
+
+    try:
+        run_id, coalesced = await trigger_job_now(job_key)
+    except RuntimeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
+
+    return {
+        "message": (
+            "이미 실행 대기/실행 중인 작업이 있어 해당 실행에 합쳐졌습니다."
+            if coalesced
+            else message
+        ),
+        "run_id": run_id,
+        "coalesced": coalesced,
+        "status_url": f"/api/scheduler/runs/{run_id}",
+    }
+
+
+@app.post("/api/scheduler/jobs/{job_key}/run", status_code=status.HTTP_202_ACCEPTED)
+async def run_scheduler_job_now(
+    job_key: str, current_user: User = Depends(get_current_user)
+):
+    """스케줄러 작업 즉시 실행 (console 권한 필요)
+
+    job_key: check_unchecked_items, send_test_email, compact_record_logs, archive_records 등
+    작업을 백그라운드에서 실행하고 실행 이력 ID를 즉시 반환합니다.
+    """
+    from services.scheduler import MANUAL_JOBS
+
+    check_console_access(current_user)
+
+    if job_key not in MANUAL_JOBS:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"작업 '{job_key}'를 찾을 수 없습니다. ({', '.join(MANUAL_JOBS)} 중 선택)",
+        )
+    return await _trigger_scheduler_job(job_key, f"작업 '{job_key}' 실행이 요청되었습니다.")
+
+
+@app.post("/api/scheduler/test", status_code=status.HTTP_202_ACCEPTED)
 async def test_scheduler():
-    """스케줄러 수동 테스트 (관리자용)"""
-    from services.scheduler import check_unchecked_items
+    """스케줄러 수동 테스트 (관리자용)
 
+    미체크 항목 확인 작업을 백그라운드에서 실행하고 실행 이력 ID를 즉시 반환합니다.
+    진행 상태는 GET /api/scheduler/runs/{run_id}로 확인합니다.
+    """
     try:
-        check_unchecked_items()
-        return {"message": "스케줄러 테스트가 성공적으로 실행되었습니다."}
+        return await _trigger_scheduler_job(
+            "check_unchecked_items", "스케줄러 테스트 실행이 요청되었습니다."
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -237,24 +464,23 @@ async def test_email_send(schedule: TestEmailSchedule):
         )
 
 
-@app.post("/api/scheduler/test-email-now")
+@app.post("/api/scheduler/test-email-now", status_code=status.HTTP_202_ACCEPTED)
 async def test_email_send_now():
     """테스트 메일 즉시 발송 (실제 DB의 담당자 이메일 주소 사용)
 
-    즉시 메일을 발송합니다. 스케줄링 없이 바로 전송됩니다.
+    메일 발송 작업을 백그라운드에서 바로 실행하고 실행 이력 ID를 즉시 반환합니다.
+    발송 결과는 GET /api/scheduler/runs/{run_id}로 확인합니다.
     실제 DB의 담당자 이메일 주소로 발송됩니다.
     """
-    from services.scheduler import send_test_email_scheduled
-
     try:
-        # 즉시 발송
-        send_test_email_scheduled()
-
-        return {
-            "message": "메일이 발송되었습니다.",
-            "sent_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "note": "실제 DB의 담당자 이메일 주소로 발송되었습니다.",
-        }
+        result = await _trigger_scheduler_job(
+            "send_test_email", "메일 발송이 요청되었습니다."
+        )
+        result["requested_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        result["note"] = "실제 DB의 담당자 이메일 주소로 발송됩니다."
+        return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -377,7 +603,7 @@ async def get_today_checklist(
     확인자가 여러 명인 경우, 한 명이 체크하면 다른 확인자들도 체크된 것으로 보임.
     따라서 user_id 필터 없이 check_item_id와 check_date만으로 조회.
     """
-    today = date.today()
+    today = get_korea_today()
 
     # 사용자가 담당하는 시스템의 체크 항목 ID 목록
     assignments = (
@@ -413,7 +639,7 @@ async def submit_checklist(
     db: Session = Depends(get_db),
 ):
     """체크리스트 제출 (PASS/FAIL 저장)"""
-    today = date.today()
+    today = get_korea_today()
 
     for item in checklist_data.items:
         # 체크 항목 권한 확인
@@ -447,12 +673,16 @@ async def submit_checklist(
             .first()
         )
 
+        checked_at = datetime.now()
+        # 오늘 슬롯 상태 갱신 (미체크 조회용)
+        mark_slot(db, item.check_item_id, today, item.status, current_user.id, checked_at)
+
         if existing_record:
             # 기존 기록이 있으면 업데이트 (누가 체크했는지는 기록)
             old_status = existing_record.status
             existing_record.status = item.status
             existing_record.notes = item.notes
-            existing_record.checked_at = datetime.now()
+            existing_record.checked_at = checked_at
             # 체크한 사람 정보도 업데이트 (같은 사람이 다시 체크한 경우)
             existing_record.user_id = current_user.id
 
@@ -474,6 +704,7 @@ async def submit_checklist(
                 check_date=today,
                 status=item.status,
                 notes=item.notes,
+                checked_at=checked_at,
             )
             db.add(new_record)
 
@@ -507,17 +738,42 @@ def check_console_access(current_user: User):
 
 @app.get("/api/console/stats", response_model=ConsoleStatsResponse)
 async def get_console_stats(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+    target_date: Optional[date] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
 ):
-    """console 페이지 통계 조회 (오늘 날짜 기준 pass/fail/미점검)"""
+    """console 페이지 통계 조회 (기본값: 오늘 날짜 기준 pass/fail/미점검)
+
+    - target_date: 조회할 날짜 (마감된 날짜는 일 마감 스냅샷 기준)
+    """
     check_console_access(current_user)
 
     today = get_korea_today()
+    if target_date and target_date != today:
+        from services.day_close import snapshot_status_counts
+
+        counts = snapshot_status_counts(db, target_date)
+        if counts is not None:
+            return ConsoleStatsResponse(
+                pass_count=counts["PASS"],
+                fail_count=counts["FAIL"],
+                unchecked_count=counts["UNCHECKED"],
+            )
+        today = target_date
+
+    # 오늘 슬롯이 있으면 상태별 count
+    counts = slot_status_counts(db, today)
+    if counts is not None:
+        return ConsoleStatsResponse(
+            pass_count=counts["PASS"],
+            fail_count=counts["FAIL"],
+            unchecked_count=counts["UNCHECKED"],
+        )
 
-    # 오늘 체크된 항목
-    checked_records = (
-        db.query(ChecklistRecord).filter(ChecklistRecord.check_date == today).all()
-    )
+    # 해당 날짜에 체크된 항목 (보관된 달은 보관 파일에서 함께 조회)
+    from services.record_archive import load_records
+
+    checked_records = load_records(db, today, today)
 
     pass_count = sum(1 for r in checked_records if r.status == "PASS")
     fail_count = sum(1 for r in checked_records if r.status == "FAIL")
@@ -557,22 +813,7 @@ async def get_console_fail_items(
     )
 
     # 각 check_item_id별로 상태 변경 추적 (시간순으로 정렬된 로그를 항목별로 그룹화)
-    item_status_history = (
-        {}
-    )  # {check_item_id: [(status, created_at, user_id, notes), ...]}
-
-    for log in all_logs:
-        if log.check_item_id not in item_status_history:
-            item_status_history[log.check_item_id] = []
-        item_status_history[log.check_item_id].append(
-            (log.status, log.created_at, log.user_id, log.notes)
-        )
-
-    # 각 항목의 로그를 시간순으로 정렬 (혹시 모를 정렬 문제 방지)
-    for check_item_id in item_status_history:
-        item_status_history[check_item_id].sort(
-            key=lambda x: x[1]
-        )  # created_at 기준 정렬
+    item_status_history = group_status_history(all_logs)
 
     result = []
 
@@ -587,69 +828,16 @@ async def get_console_fail_items(
         if not system:
             continue
 
-        # 최종 상태 확인 (시간순으로 정렬된 마지막 로그의 상태)
-        # history는 이미 시간순으로 정렬되어 있음
-        final_status = history[-1][0]  # 마지막 로그의 상태
-
-        # 최종 상태가 FAIL인 항목만 표시
-        if final_status != "FAIL":
-            continue
-
-        # 첫 번째 FAIL 로그 찾기 (PASS -> FAIL 또는 처음부터 FAIL)
-        first_fail_log = None
-        for status, created_at, user_id, notes in history:
-            if status == "FAIL":
-                first_fail_log = (status, created_at, user_id, notes)
-                break
-
-        if not first_fail_log:
+        # 최종 상태가 FAIL인 항목만 표시 (첫 FAIL 시간/기록자, 최신 FAIL 비고)
+        fail = summarize_fail_history(history)
+        if fail is None:
             continue
 
         # 사용자 정보 (첫 번째 FAIL을 기록한 사용자)
-        user = db.query(User).filter(User.id == first_fail_log[2]).first()
+        user = db.query(User).filter(User.id == fail["user_id"]).first()
         if not user:
             continue
 
-        # FAIL 이후에 PASS로 변경되었는지 확인
-        first_fail_time = first_fail_log[1]
-        pass_after_fail = None
-        for status, created_at, user_id, notes in history:
-            if status == "PASS" and created_at > first_fail_time:
-                pass_after_fail = (created_at, notes)
-                break
-
-        # PASS 이후에 다시 FAIL로 변경되었는지 확인
-        is_resolved = False
-        resolved_date = None
-        resolved_time = None
-
-        if pass_after_fail:
-            # PASS 이후에 다시 FAIL이 있는지 확인
-            pass_time = pass_after_fail[0]
-            fail_after_pass = None
-            for status, created_at, user_id, notes in history:
-                if status == "FAIL" and created_at > pass_time:
-                    fail_after_pass = (created_at, notes)
-                    break
-
-            if not fail_after_pass:
-                # PASS 이후에 FAIL이 없으면 해결된 것으로 간주
-                # 하지만 최종 상태가 FAIL이므로, 이 경우는 발생하지 않아야 함
-                # 최종 상태가 FAIL이면 미해결로 처리
-                is_resolved = False
-                resolved_date = None
-                resolved_time = None
-
-        # 최신 FAIL 로그 정보 (최종 FAIL 상태)
-        latest_fail_log = None
-        for status, created_at, user_id, notes in reversed(history):
-            if status == "FAIL":
-                latest_fail_log = (created_at, notes)
-                break
-
-        if not latest_fail_log:
-            latest_fail_log = (first_fail_log[1], first_fail_log[3])
-
         result.append(
             ConsoleFailItemResponse(
                 id=check_item_id,  # check_item_id를 id로 사용
@@ -657,24 +845,26 @@ async def get_console_fail_items(
                 system_name=system.system_name,
                 check_item_id=check_item_id,
                 item_name=check_item.item_name,
-                notes=latest_fail_log[1] if latest_fail_log else first_fail_log[3],
-                fail_time=first_fail_log[1],  # 첫 번째 FAIL 시간
+                notes=fail["notes"],
+                fail_time=fail["fail_time"],  # 첫 번째 FAIL 시간
                 user_id=user.id,
                 user_name=user.name,
                 employee_id=user.employee_id,
-                is_resolved=is_resolved,
-                resolved_date=resolved_date,
-                resolved_time=resolved_time,
+                is_resolved=fail["is_resolved"],
+                resolved_date=fail["resolved_date"],
+                resolved_time=fail["resolved_time"],
             )
         )
 
     # fail_time 기준으로 정렬 (최신순)
     result.sort(key=lambda x: x.fail_time, reverse=True)
 
-    print(f"[Console API] 오늘 FAIL 항목: {len(result)}개")
-    for item in result:
-        print(
-            f"  - {item.item_name}: is_resolved={item.is_resolved}, fail_time={item.fail_time}"
+    # console 화면이 주기적으로 호출하므로 DEBUG 레벨로만 기록
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "오늘 FAIL 항목 %d개: %s",
+            len(result),
+            ", ".join(f"{item.item_name}(is_resolved={item.is_resolved}, fail_time={item.fail_time})" for item in result),
         )
 
     return result
@@ -689,7 +879,7 @@ async def get_unchecked_items(
     확인자가 여러 명인 경우, 한 명이 체크하면 다른 사람도 체크된 것으로 보임.
     따라서 user_id 필터 없이 check_item_id와 check_date만으로 확인.
     """
-    today = date.today()
+    today = get_korea_today()
 
     # 사용자가 담당하는 시스템의 모든 체크 항목
     assignments = (
@@ -699,27 +889,19 @@ async def get_unchecked_items(
     )
 
     system_ids = [a.system_id for a in assignments]
-    all_items = db.query(CheckItem).filter(CheckItem.system_id.in_(system_ids)).all()
-
-    # 오늘 체크된 항목 (다른 사람이 체크한 것도 포함)
-    checked_records = (
-        db.query(ChecklistRecord).filter(ChecklistRecord.check_date == today).all()
+    system_map = dict(
+        db.query(System.id, System.system_name).filter(System.id.in_(system_ids)).all()
     )
-    checked_item_ids = {r.check_item_id for r in checked_records}
 
-    # 체크되지 않은 항목
+    # 체크되지 않은 항목 (오늘 슬롯에서 UNCHECKED 조회, 슬롯이 없으면 전체 항목 - 오늘 기록)
     unchecked_items = [
         {
             "check_item_id": item.id,
             "item_name": item.item_name,
             "system_id": item.system_id,
-            "system_name": db.query(System)
-            .filter(System.id == item.system_id)
-            .first()
-            .system_name,
+            "system_name": system_map[item.system_id],
         }
-        for item in all_items
-        if item.id not in checked_item_ids
+        for item in find_unchecked_items(db, today, system_ids)
     ]
 
     return unchecked_items
@@ -747,7 +929,8 @@ async def export_excel(
         )
     
     try:
-        
+        started = time.perf_counter()
+
         # 날짜 범위 검증
         if request.start_date > request.end_date:
             raise HTTPException(
@@ -755,47 +938,12 @@ async def export_excel(
                 detail="시작 날짜가 종료 날짜보다 늦을 수 없습니다.",
             )
         
-        # 날짜 범위 내의 모든 체크리스트 기록 조회
-        records = (
-            db.query(ChecklistRecord)
-            .filter(
-                and_(
-                    ChecklistRecord.check_date >= request.start_date,
-                    ChecklistRecord.check_date <= request.end_date,
-                )
-            )
-            .all()
-        )
-        
-        print(f"[엑셀 다운로드] 날짜 범위: {request.start_date} ~ {request.end_date}")
-        print(f"[엑셀 다운로드] 조회된 기록 수: {len(records)}")
-        
-        # 모든 체크 항목 조회 (담당자 정보 포함)
-        all_items = db.query(CheckItem).all()
-        all_systems = db.query(System).all()
-        all_assignments = db.query(UserSystemAssignment).all()
-        all_users = db.query(User).all()
-        
-        print(f"[엑셀 다운로드] 전체 체크 항목 수: {len(all_items)}")
-        print(f"[엑셀 다운로드] 전체 시스템 수: {len(all_systems)}")
-        print(f"[엑셀 다운로드] 전체 담당자 할당 수: {len(all_assignments)}")
-        
-        # 시스템, 항목, 담당자 매핑 생성
-        system_map = {s.id: s.system_name for s in all_systems}
-        item_map = {item.id: item for item in all_items}
-        assignment_map = {}
-        for assignment in all_assignments:
-            if assignment.system_id not in assignment_map:
-                assignment_map[assignment.system_id] = set()  # 중복 제거를 위해 set 사용
-            user = next((u for u in all_users if u.id == assignment.user_id), None)
-            if user:
-                assignment_map[assignment.system_id].add(user.name)  # 사번 제거, 이름만 사용
-        
-        # set을 리스트로 변환 (정렬하여 일관성 유지)
-        for system_id in assignment_map:
-            assignment_map[system_id] = sorted(list(assignment_map[system_id]))
+        # 날짜별 항목 최종 상태 조회 (마감된 날짜는 일 마감 스냅샷, 그 외 날짜는 체크 기록에서 계산)
+        from services.day_close import count_statuses_by_date, load_daily_results
+
+        daily_rows = load_daily_results(db, request.start_date, request.end_date)
         
-        user_map = {u.id: u.name for u in all_users}
+        logger.debug("엑셀 다운로드 %s ~ %s: 조회된 항목 행 %d개", request.start_date, request.end_date, len(daily_rows))
         
         # 엑셀 워크북 생성
         wb = Workbook()
@@ -818,69 +966,21 @@ async def export_excel(
             cell.alignment = center_alignment
             cell.border = border
         
-        # 데이터 작성 (중복 제거: 같은 check_item_id와 check_date에 대해 가장 최근 것만 사용)
-        # 먼저 (check_item_id, check_date)별로 그룹화하고, 가장 최근 checked_at을 가진 레코드만 선택
-        records_dict = {}
-        for record in records:
-            key = (record.check_item_id, record.check_date)
-            if key not in records_dict:
-                records_dict[key] = record
-            else:
-                # 같은 키가 있으면 checked_at이 더 최근인 것으로 교체
-                if record.checked_at > records_dict[key].checked_at:
-                    records_dict[key] = record
-        
-        # 실제로 기록이 있는 날짜만 추출
-        dates_with_records = set()
-        for record in records:
-            dates_with_records.add(record.check_date)
-        
-        # 날짜 범위 내의 모든 날짜 생성 (실제 기록이 있는 날짜만)
-        date_list = sorted(list(dates_with_records))
-        
-        # 실제 기록이 있는 날짜에 대해서만 데이터 생성
-        excel_data = []
-        for check_item in all_items:
-            for check_date in date_list:
-                key = (check_item.id, check_date)
-                if key in records_dict:
-                    # 체크된 기록이 있는 경우
-                    record = records_dict[key]
-                    excel_data.append({
-                        'date': check_date,
-                        'system_id': check_item.system_id,
-                        'item_name': check_item.item_name,
-                        'status': record.status,
-                        'notes': record.notes or "",
-                    })
-                else:
-                    # 해당 날짜에 체크되지 않은 항목 (미점검)
-                    excel_data.append({
-                        'date': check_date,
-                        'system_id': check_item.system_id,
-                        'item_name': check_item.item_name,
-                        'status': '미점검',
-                        'notes': "",
-                    })
-        
-        # 날짜, 시스템, 항목 순으로 정렬
-        excel_data.sort(key=lambda x: (x['date'], x['system_id'], x['item_name']))
-        
+        # 데이터 작성 (기록이 있는 날짜만, 체크되지 않은 항목은 미점검)
         row_idx = 2
-        for data in excel_data:
-            system_name = system_map.get(data['system_id'], "")
-            responsible_users = ", ".join(assignment_map.get(data['system_id'], []))
+        for data in daily_rows:
+            status_text = "미점검" if data["status"] == "UNCHECKED" else data["status"]
             
-            ws.cell(row=row_idx, column=1, value=data['date'].strftime("%Y-%m-%d")).border = border
-            ws.cell(row=row_idx, column=2, value=system_name).border = border
-            ws.cell(row=row_idx, column=3, value=data['item_name']).border = border
-            ws.cell(row=row_idx, column=4, value=responsible_users).border = border
-            ws.cell(row=row_idx, column=5, value=data['status']).border = border
-            ws.cell(row=row_idx, column=6, value=data['notes']).border = border
+            ws.cell(row=row_idx, column=1, value=data["snapshot_date"].strftime("%Y-%m-%d")).border = border
+            ws.cell(row=row_idx, column=2, value=data["system_name"]).border = border
+            ws.cell(row=row_idx, column=3, value=data["item_name"]).border = border
+            ws.cell(row=row_idx, column=4, value=data["assignees"]).border = border
+            ws.cell(row=row_idx, column=5, value=status_text).border = border
+            ws.cell(row=row_idx, column=6, value=data["notes"] or "").border = border
             
             row_idx += 1
         
-        print(f"[엑셀 다운로드] 엑셀에 작성된 행 수: {row_idx - 2}")
+        logger.debug("엑셀 다운로드: 작성한 행 %d개", row_idx - 2)
         
         # 열 너비 조정
         ws.column_dimensions["A"].width = 12
@@ -897,19 +997,7 @@ async def export_excel(
         stats_ws = wb.create_sheet("통계")
         
         # 날짜별 통계 계산
-        date_stats = {}
-        for record in records:
-            date_str = record.check_date.strftime("%Y-%m-%d")
-            if date_str not in date_stats:
-                date_stats[date_str] = {"PASS": 0, "FAIL": 0, "UNCHECKED": 0}
-            
-            if record.status == "PASS":
-                date_stats[date_str]["PASS"] += 1
-            elif record.status == "FAIL":
-                date_stats[date_str]["FAIL"] += 1
-        
-        # 전체 항목 수 계산
-        total_items = len(all_items)
+        date_stats = count_statuses_by_date(daily_rows)
         
         # 통계 헤더
         stats_headers = ["날짜", "PASS", "FAIL", "미점검", "전체"]
@@ -925,7 +1013,8 @@ async def export_excel(
         sorted_dates = sorted(date_stats.keys())
         for date_str in sorted_dates:
             stats = date_stats[date_str]
-            unchecked = total_items - stats["PASS"] - stats["FAIL"]
+            unchecked = stats["UNCHECKED"]
+            total_items = stats["PASS"] + stats["FAIL"] + stats["UNCHECKED"]
             
             stats_ws.cell(row=stats_row, column=1, value=date_str).border = border
             stats_ws.cell(row=stats_row, column=2, value=stats["PASS"]).border = border
@@ -962,6 +1051,7 @@ async def export_excel(
         output = io.BytesIO()
         wb.save(output)
         output.seek(0)
+        observe_export("excel", time.perf_counter() - started, output.getbuffer().nbytes)
         
         # 파일명 생성 (한글 인코딩 처리)
         filename = f"체크리스트_통계_{request.start_date}_{request.end_date}.xlsx"
@@ -978,16 +1068,149 @@ async def export_excel(
         )
     except Exception as e:
         # ImportError는 이미 함수 시작 부분에서 처리됨
-        import traceback
-        error_detail = traceback.format_exc()
-        print(f"[엑셀 다운로드] 오류 발생: {str(e)}")
-        print(f"[엑셀 다운로드] 상세 오류:\n{error_detail}")
+        logger.exception("엑셀 다운로드 오류: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"엑셀 파일 생성 중 오류 발생: {str(e)}",
         )
 
 
+@app.post("/api/console/import/{kind}", status_code=status.HTTP_202_ACCEPTED)
+async def upload_import_file(
+    kind: str,
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user),
+):
+    """체크리스트/사용자 데이터 파일 업로드 후 백그라운드 import (console 권한 필요)
+
+    - kind: checklist (체크리스트 항목/담당자) 또는 users (사용자)
+    - file: CSV 또는 XLSX 파일
+
+    파일을 저장한 뒤 import 작업을 등록하고 실행 이력 ID를 즉시 반환합니다.
+    IMPORT_MAX_UPLOAD_MB를 넘는 요청은 본문을 받기 전에 Content-Length로 거부합니다. (413, upload_size_limit_middleware)
+    진행 상황(처리한 행 수)과 결과는 GET /api/scheduler/runs/{run_id}로 확인합니다.
+    체크리스트는 변경분만 반영(sync)하며, 변경은 배치 단위로 커밋되어 import 중에도 체크리스트 제출이 가능합니다.
+    """
+    from services.import_jobs import (
+        IMPORT_KINDS,
+        UploadTooLargeError,
+        new_upload_path,
+        save_upload,
+        run_import_job,
+    )
+    from services.scheduler import submit_background_job
+    from functools import partial
+
+    check_console_access(current_user)
+
+    if kind not in IMPORT_KINDS:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"알 수 없는 import 종류입니다: {kind} ({', '.join(IMPORT_KINDS)} 중 선택)",
+        )
+
+    try:
+        upload_path = new_upload_path(file.filename)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    try:
+        size_bytes = await save_upload(file, upload_path)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    finally:
+        await file.close()
+
+    job_id, job_name = IMPORT_KINDS[kind]
+    try:
+        run_id = await submit_background_job(
+            job_id,
+            job_name,
+            partial(run_import_job, kind, str(upload_path), file.filename),
+            details={"kind": kind, "file_name": file.filename, "phase": "queued"},
+        )
+    except Exception as e:
+        upload_path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"import 작업 등록 중 오류 발생: {str(e)}",
+        )
+
+    logger.info(
+        "import 업로드: %s(%s) %s (%d bytes) → 실행 #%d",
+        current_user.name,
+        current_user.employee_id,
+        file.filename,
+        size_bytes,
+        run_id,
+    )
+    return {
+        "message": "파일이 업로드되었습니다. import가 백그라운드에서 진행됩니다.",
+        "run_id": run_id,
+        "kind": kind,
+        "file_name": file.filename,
+        "size_bytes": size_bytes,
+        "status_url": f"/api/scheduler/runs/{run_id}",
+    }
+
+
+@app.get("/api/console/slow-queries", response_model=List[SlowQueryResponse])
+async def get_slow_queries(
+    table: Optional[str] = None,
+    full_scan_only: bool = False,
+    limit: int = 50,
+    current_user: User = Depends(get_current_user),
+):
+    """느린 쿼리 기록 조회 (최신순, console 권한 필요)
+
+    SLOW_QUERY_THRESHOLD_MS 이상 걸린 쿼리를 실행 계획과 함께 최근 SLOW_QUERY_BUFFER_SIZE개까지 보관합니다.
+    - table: 이 테이블을 사용하는 쿼리만 조회 (예: checklist_records)
+    - full_scan_only: true이면 인덱스 없이 테이블 전체를 읽은 쿼리만 조회
+    """
+    from services.slow_queries import recent_slow_queries
+
+    check_console_access(current_user)
+    return recent_slow_queries(limit=min(limit, 500), table=table, full_scan_only=full_scan_only)
+
+
+@app.delete("/api/console/slow-queries")
+async def clear_slow_query_log(current_user: User = Depends(get_current_user)):
+    """느린 쿼리 기록 비우기 (console 권한 필요)"""
+    from services.slow_queries import clear_slow_queries
+
+    check_console_access(current_user)
+    return {"message": "느린 쿼리 기록을 비웠습니다.", "cleared": clear_slow_queries()}
+
+
+@app.get("/api/console/profiles")
+async def get_request_profiles(current_user: User = Depends(get_current_user)):
+    """요청 프로파일 파일 목록 (최신순, console 권한 필요)
+
+    console 사용자가 요청에 X-Profile: 1 헤더 또는 ?profile=1 쿼리를 붙이면 해당 요청을 프로파일링하고,
+    응답의 X-Profile 헤더로 파일 이름을 반환합니다.
+    """
+    check_console_access(current_user)
+    return [
+        {
+            "name": path.name,
+            "size_bytes": path.stat().st_size,
+            "created_at": datetime.fromtimestamp(path.stat().st_mtime),
+        }
+        for path in reversed(list_profiles())
+    ]
+
+
+@app.get("/api/console/profiles/{name}")
+async def download_request_profile(name: str, current_user: User = Depends(get_current_user)):
+    """요청 프로파일 파일 다운로드 (folded stack 형식, speedscope/flamegraph.pl로 확인)"""
+    check_console_access(current_user)
+    try:
+        path = resolve_profile(name)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return FileResponse(path, media_type="text/plain; charset=utf-8", filename=path.name)
+
+
 if __name__ == "__main__":
     import uvicorn
 
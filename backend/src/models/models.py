@@ -1,8 +1,50 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, Date, DateTime, ForeignKey, CheckConstraint
+from sqlalchemy import Column, Integer, SmallInteger, String, Text, Boolean, Date, DateTime, ForeignKey, CheckConstraint, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 from services.database import Base
 
+# 체크 기록/로그의 상태와 액션은 작은 정수로 저장 (코드에서는 문자열로 사용)
+RECORD_STATUS_CODES = {"PASS": 1, "FAIL": 2}
+LOG_ACTION_CODES = {"CREATE": 1, "UPDATE": 2, "DELETE": 3}
+
+
+class EncodedEnum(TypeDecorator):
+    """문자열 값을 SMALLINT 코드로 저장하는 컬럼 타입
+
+    조회/비교/INSERT 모두 문자열('PASS' 등)로 사용하며, DB에는 codes의 정수 값이 저장됩니다.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, codes: dict):
+        super().__init__()
+        self.codes = tuple(codes.items())
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return dict(self.codes)[value]
+        except KeyError:
+            raise ValueError(f"허용되지 않는 값입니다: {value!r} ({', '.join(dict(self.codes))} 중 하나)")
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        for name, code in self.codes:
+            if code == value:
+                return name
+        raise ValueError(
+            f"알 수 없는 코드입니다: {value!r} "
+            "(문자열로 저장된 기존 DB라면 utils/migrate_status_encoding.py를 실행하세요)"
+        )
+
+    def check_sql(self, column_name: str) -> str:
+        """CHECK 제약조건 SQL"""
+        return f"{column_name} IN ({', '.join(str(code) for _, code in self.codes)})"
+
+
 class User(Base):
     __tablename__ = "users"
     
@@ -55,12 +97,12 @@ class ChecklistRecord(Base):
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     check_item_id = Column(Integer, ForeignKey("check_items.id", ondelete="CASCADE"), nullable=False)
     check_date = Column(Date, nullable=False)
-    status = Column(String(10), nullable=False)
+    status = Column(EncodedEnum(RECORD_STATUS_CODES), nullable=False)  # PASS=1, FAIL=2
     notes = Column(Text)
     checked_at = Column(DateTime(timezone=True), server_default=func.now())
     
     __table_args__ = (
-        CheckConstraint("status IN ('PASS', 'FAIL')", name="check_status"),
+        CheckConstraint(EncodedEnum(RECORD_STATUS_CODES).check_sql("status"), name="check_status"),
     )
 
 class ChecklistRecordLog(Base):
@@ -71,14 +113,83 @@ class ChecklistRecordLog(Base):
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     check_item_id = Column(Integer, ForeignKey("check_items.id", ondelete="CASCADE"), nullable=False)
     check_date = Column(Date, nullable=False)
-    status = Column(String(10), nullable=False)  # PASS or FAIL
+    status = Column(EncodedEnum(RECORD_STATUS_CODES), nullable=False)  # PASS=1, FAIL=2
     notes = Column(Text)
-    action = Column(String(20), nullable=False)  # 'CREATE', 'UPDATE', 'DELETE'
+    action = Column(EncodedEnum(LOG_ACTION_CODES), nullable=False)  # CREATE=1, UPDATE=2, DELETE=3
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     __table_args__ = (
-        CheckConstraint("status IN ('PASS', 'FAIL')", name="check_log_status"),
-        CheckConstraint("action IN ('CREATE', 'UPDATE', 'DELETE')", name="check_log_action"),
+        CheckConstraint(EncodedEnum(RECORD_STATUS_CODES).check_sql("status"), name="check_log_status"),
+        CheckConstraint(EncodedEnum(LOG_ACTION_CODES).check_sql("action"), name="check_log_action"),
+    )
+
+class SchedulerJobRun(Base):
+    """스케줄러 작업 실행 이력 테이블 - 실행 시간, 처리량, 오류, misfire/coalesce 기록"""
+    __tablename__ = "scheduler_job_runs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(String(100), nullable=False, index=True)  # APScheduler 작업 ID (예: check_time_1)
+    job_name = Column(String(200))
+    trigger = Column(String(20), nullable=False, default="SCHEDULED")  # 'SCHEDULED', 'MANUAL'
+    status = Column(String(20), nullable=False)  # 'QUEUED', 'RUNNING', 'SUCCESS', 'FAILED', 'MISSED', 'SKIPPED'
+    started_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    finished_at = Column(DateTime(timezone=True))
+    duration_ms = Column(Integer)
+    rows_scanned = Column(Integer, default=0)  # 조회한 행 수
+    recipients = Column(Integer, default=0)  # 수신자 + 참조자 수
+    messages_enqueued = Column(Integer, default=0)  # 발송 요청한 메일 수
+    coalesced_runs = Column(Integer, default=0)  # 밀려서 합쳐진 실행 횟수
+    over_budget = Column(Boolean, default=False)  # 시간 예산 초과 여부
+    error = Column(Text)
+    details = Column(Text)  # 작업별 추가 정보 (JSON)
+
+class ChecklistDailySlot(Base):
+    """일별 체크 슬롯 테이블 - 업무 시작 전에 체크 항목마다 UNCHECKED로 미리 생성하고, 제출 시 상태를 갱신
+
+    미체크 항목 조회가 (check_date, status) 인덱스 조회가 되고, 하루 진행 현황은 상태별 count로 계산됩니다.
+    """
+    __tablename__ = "checklist_daily_slots"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    check_date = Column(Date, nullable=False)
+    check_item_id = Column(Integer, ForeignKey("check_items.id", ondelete="CASCADE"), nullable=False)
+    status = Column(String(10), nullable=False, default="UNCHECKED")  # 'UNCHECKED', 'PASS', 'FAIL'
+    checked_by = Column(Integer)  # 마지막으로 체크한 사용자 ID
+    checked_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        UniqueConstraint("check_date", "check_item_id", name="uq_daily_slot_item"),
+        Index("ix_daily_slot_date_status", "check_date", "status"),
+        CheckConstraint("status IN ('UNCHECKED', 'PASS', 'FAIL')", name="check_slot_status"),
+    )
+
+class ChecklistDailySnapshot(Base):
+    """일 마감 스냅샷 테이블 - 마감된 날의 항목별 최종 상태 (미점검 포함, 생성 후 변경하지 않음)
+
+    항목/시스템 이름과 담당자는 마감 시점 값을 그대로 저장하므로,
+    이후 체크 항목을 다시 import해도 과거 통계가 바뀌지 않습니다.
+    """
+    __tablename__ = "checklist_daily_snapshots"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    snapshot_date = Column(Date, nullable=False)
+    check_item_id = Column(Integer, nullable=False)  # 마감 시점의 체크 항목 ID (FK 없음, 항목 삭제 후에도 유지)
+    system_id = Column(Integer, nullable=False)
+    system_name = Column(String(100), nullable=False)
+    item_name = Column(String(200), nullable=False)
+    order_index = Column(Integer, default=0)
+    assignees = Column(Text)  # 담당자 이름 (쉼표 구분)
+    status = Column(String(10), nullable=False)  # 'PASS', 'FAIL', 'UNCHECKED'
+    notes = Column(Text)
+    checked_by = Column(Integer)  # 최종 상태를 기록한 사용자 ID
+    checked_at = Column(DateTime(timezone=True))
+    closed_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        UniqueConstraint("snapshot_date", "check_item_id", name="uq_daily_snapshot_item"),
+        Index("ix_daily_snapshot_date_status", "snapshot_date", "status"),
+        CheckConstraint("status IN ('PASS', 'FAIL', 'UNCHECKED')", name="check_snapshot_status"),
     )
 
 # SpecialNote 모델은 더 이상 사용하지 않습니다.
@@ -0,0 +1,663 @@
+"""체크리스트 데이터 import 엔진
+
+CSV/XLSX 파일을 일정 크기의 배치로 나눠 읽고, 시스템/체크 항목/담당자 할당을
+bulk INSERT로 한 트랜잭션 안에서 저장합니다.
+
+- 사용자 이름 → ID는 import 시작 시 한 번 조회한 맵으로 해석합니다.
+- 시스템은 이름으로 기존 행을 재사용하고, 없는 시스템만 추가합니다.
+- 체크 항목/할당 중복은 메모리의 키 집합으로 걸러내므로 행마다 DB를 조회하지 않습니다.
+
+import 방식:
+- sync (기본): 기존 체크 항목을 (시스템 이름, 항목 이름)으로 매칭해 변경분만
+  INSERT/UPDATE 합니다. 체크 항목 ID와 체크 기록이 유지됩니다.
+  파일에 없는 항목/할당은 delete_missing=True일 때만 삭제합니다. (항목 이름 오타나 변경으로
+  기존 항목과 체크 기록이 지워지지 않도록 기본값은 유지)
+- replace: 기존 체크 항목/할당을 모두 삭제하고 다시 INSERT 합니다.
+
+파일 형식 (CSV 또는 XLSX 첫 번째 시트, 첫 행은 헤더):
+user_name, id, system_id, item_name, description, order_index, created_at
+(system_id 컬럼에는 시스템 이름이 들어 있습니다)
+"""
+import time
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+
+from sqlalchemy import func, insert, update
+from sqlalchemy.orm import Session
+
+from models.models import (
+    System,
+    CheckItem,
+    User,
+    UserSystemAssignment,
+    ChecklistRecord,
+    ChecklistRecordLog,
+    ChecklistDailySlot,
+)
+from services.import_readers import iter_dict_rows
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+@dataclass
+class ChecklistRow:
+    """CSV 한 행 (사용자-체크 항목 관계)"""
+
+    row_number: int
+    system_name: str
+    item_name: str
+    description: Optional[str]
+    order_index: int
+    user_names: List[str]
+
+
+@dataclass
+class ImportResult:
+    """import 결과 요약"""
+
+    rows: int = 0
+    systems_created: int = 0
+    systems_reused: int = 0
+    items_created: int = 0
+    assignments_created: int = 0
+    assignments_skipped: int = 0
+    unknown_users: set = field(default_factory=set)
+    warnings: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class SyncResult(ImportResult):
+    """sync import 결과 (변경 내역 포함)
+
+    item_*/assignment_* 리스트에는 변경된 키가 (시스템 이름, 항목 이름[, 사용자 이름]) 형태로 들어갑니다.
+    DB에 같은 키로 중복된 항목/할당을 삭제할 때는 키 뒤에 "중복 ID n"이 붙습니다.
+    """
+
+    items_updated: int = 0
+    items_deleted: int = 0
+    items_unchanged: int = 0
+    assignments_deleted: int = 0
+    assignments_unchanged: int = 0
+    records_deleted: int = 0
+    item_inserts: list = field(default_factory=list)
+    item_updates: list = field(default_factory=list)
+    item_deletes: list = field(default_factory=list)
+    assignment_inserts: list = field(default_factory=list)
+    assignment_deletes: list = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(
+            self.item_inserts
+            or self.item_updates
+            or self.item_deletes
+            or self.assignment_inserts
+            or self.assignment_deletes
+        )
+
+
+@dataclass
+class ValidationResult:
+    """import 파일 검증 결과 (errors가 있으면 import하지 않음)"""
+
+    rows: int = 0
+    items: int = 0
+    assignments: int = 0
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    unknown_users: dict = field(default_factory=dict)  # {사용자 이름: [행 번호]}
+    new_systems: set = field(default_factory=set)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+class ImportValidationError(ValueError):
+    """import 파일 검증 실패 (DB를 변경하기 전에 발생)"""
+
+    def __init__(self, validation: ValidationResult, limit: int = 10):
+        self.validation = validation
+        lines = validation.errors[:limit]
+        if len(validation.errors) > limit:
+            lines.append(f"... 외 {len(validation.errors) - limit}건")
+        super().__init__(
+            f"import 파일 검증 실패 (오류 {len(validation.errors)}건, DB는 변경되지 않았습니다)\n"
+            + "\n".join(lines)
+        )
+
+
+def parse_row(row_number: int, row: dict) -> ChecklistRow:
+    """파일 행(dict)을 ChecklistRow로 변환 (형식 오류 시 ValueError)"""
+    user_names_str = (row.get("user_name") or "").strip()
+    system_name = (row.get("system_id") or "").strip()
+    item_name = (row.get("item_name") or "").strip()
+    description = (row.get("description") or "").strip()
+    order_index_str = (row.get("order_index") or "").strip()
+
+    if not system_name or not item_name:
+        raise ValueError("시스템명 또는 항목명이 비어있습니다")
+
+    try:
+        order_index = int(order_index_str) if order_index_str else 0
+    except ValueError:
+        raise ValueError(f"order_index가 정수가 아닙니다: '{order_index_str}'")
+    if order_index < 0:
+        raise ValueError(f"order_index는 0 이상이어야 합니다: {order_index}")
+
+    return ChecklistRow(
+        row_number=row_number,
+        system_name=system_name,
+        item_name=item_name,
+        description=description or None,
+        order_index=order_index,
+        user_names=[name.strip() for name in user_names_str.split(",") if name.strip()],
+    )
+
+
+def iter_row_batches(
+    file_path, batch_size: int = DEFAULT_BATCH_SIZE, warnings: list = None
+) -> Iterator[List[ChecklistRow]]:
+    """CSV/XLSX 파일을 batch_size 행씩 읽어 ChecklistRow 리스트로 반환 (파일 전체를 메모리에 올리지 않음)
+
+    형식이 잘못된 행은 건너뛰고 warnings 리스트에 사유를 추가합니다.
+    """
+    batch = []
+    for row_number, row in iter_dict_rows(file_path):
+        try:
+            batch.append(parse_row(row_number, row))
+        except ValueError as e:
+            if warnings is not None:
+                warnings.append(f"{row_number}행 - {e}. 건너뜁니다.")
+            continue
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def load_user_map(db: Session) -> dict:
+    """사용자 이름 → (id, name) 맵 (동명이인은 먼저 등록된 사용자 사용)"""
+    user_map = {}
+    for user_id, name in db.query(User.id, User.name).order_by(User.id):
+        user_map.setdefault(name, (user_id, name))
+    return user_map
+
+
+def validate_checklist(
+    db: Session, file_path, allow_unknown_users: bool = False
+) -> ValidationResult:
+    """import 파일 검증 (dry-run, DB를 변경하지 않음)
+
+    사용자/시스템 목록을 한 번만 조회해 메모리에 두고 파일 전체를 검사합니다.
+    - 오류: 형식이 잘못된 행(시스템명/항목명 누락, 잘못된 order_index),
+      같은 항목이 행마다 다른 설명/순서로 중복된 경우, 등록되지 않은 담당자
+    - 경고: 같은 담당자 할당 중복, 담당자가 없는 항목, 동명이인 담당자,
+      DB에 같은 이름으로 중복된 체크 항목 (sync에서 delete_missing=True일 때만 정리)
+
+    Args:
+        db: DB 세션 (조회만 함)
+        file_path: CSV 또는 XLSX 파일 경로
+        allow_unknown_users: True이면 등록되지 않은 담당자를 경고로 처리 (해당 할당은 건너뜀)
+
+    Returns:
+        ValidationResult
+    """
+    result = ValidationResult()
+    started = time.perf_counter()
+
+    user_names = set()
+    duplicate_names = set()
+    for (name,) in db.query(User.name):
+        if name in user_names:
+            duplicate_names.add(name)
+        user_names.add(name)
+    system_names = {name for (name,) in db.query(System.system_name)}
+
+    items = {}  # {(system_name, item_name): (행 번호, description, order_index)}
+    assignments = {}  # {(system_name, item_name, user_name): 행 번호}
+    ambiguous_users = set()
+
+    for row_number, raw in iter_dict_rows(file_path):
+        result.rows += 1
+        try:
+            row = parse_row(row_number, raw)
+        except ValueError as e:
+            result.errors.append(f"{row_number}행 - {e}")
+            continue
+
+        key = (row.system_name, row.item_name)
+        first = items.get(key)
+        if first is None:
+            items[key] = (row_number, row.description, row.order_index)
+        elif (first[1], first[2]) != (row.description, row.order_index):
+            result.errors.append(
+                f"{row_number}행 - '{row.system_name} / {row.item_name}' 항목이 {first[0]}행과 "
+                f"설명 또는 order_index가 다릅니다 ({first[2]} → {row.order_index})"
+            )
+        if row.system_name not in system_names:
+            result.new_systems.add(row.system_name)
+
+        if not row.user_names:
+            result.warnings.append(f"{row_number}행 - 담당자가 없습니다")
+        for user_name in row.user_names:
+            if user_name not in user_names:
+                result.unknown_users.setdefault(user_name, []).append(row_number)
+                continue
+            if user_name in duplicate_names:
+                ambiguous_users.add(user_name)
+            assignment_key = (*key, user_name)
+            if assignment_key in assignments:
+                result.warnings.append(
+                    f"{row_number}행 - 담당자 할당 중복: {row.system_name} / {row.item_name} / "
+                    f"{user_name} ({assignments[assignment_key]}행과 동일)"
+                )
+            else:
+                assignments[assignment_key] = row_number
+
+    for user_name, row_numbers in sorted(result.unknown_users.items()):
+        rows_text = ", ".join(str(n) for n in row_numbers[:10])
+        if len(row_numbers) > 10:
+            rows_text += f" 외 {len(row_numbers) - 10}건"
+        message = f"등록되지 않은 담당자: {user_name} ({rows_text}행)"
+        (result.warnings if allow_unknown_users else result.errors).append(message)
+    for user_name in sorted(ambiguous_users):
+        result.warnings.append(f"동명이인 담당자: {user_name} (먼저 등록된 사용자로 할당됩니다)")
+    for system_name, item_name, count in (
+        db.query(System.system_name, CheckItem.item_name, func.count(CheckItem.id))
+        .join(System, System.id == CheckItem.system_id)
+        .group_by(System.system_name, CheckItem.item_name)
+        .having(func.count(CheckItem.id) > 1)
+        .order_by(System.system_name, CheckItem.item_name)
+    ):
+        result.warnings.append(
+            f"DB 체크 항목 중복: {system_name} / {item_name} ({count}개, "
+            f"delete_missing sync 시 첫 항목만 남기고 삭제)"
+        )
+
+    result.items = len(items)
+    result.assignments = len(assignments)
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def _validate_or_raise(db: Session, file_path, allow_unknown_users: bool) -> ValidationResult:
+    validation = validate_checklist(db, file_path, allow_unknown_users)
+    if not validation.ok:
+        raise ImportValidationError(validation)
+    return validation
+
+
+def import_checklist(
+    db: Session,
+    file_path,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress=None,
+    allow_unknown_users: bool = False,
+) -> ImportResult:
+    """체크리스트 데이터 import (기존 체크 항목/할당을 모두 교체)
+
+    삭제 전에 파일 전체를 검증(validate_checklist)하여 오류가 있으면 DB를 변경하지 않고
+    ImportValidationError를 발생시킵니다. 삭제와 삽입은 하나의 트랜잭션에서 처리하므로,
+    중간에 오류가 나면 기존 데이터가 그대로 유지됩니다.
+
+    Args:
+        db: DB 세션
+        file_path: CSV 또는 XLSX 파일 경로
+        batch_size: 한 번에 읽고 INSERT할 행 수
+        progress: 배치 처리 후 호출되는 콜백 progress(처리한 행 수)
+        allow_unknown_users: True이면 등록되지 않은 담당자의 할당만 건너뛰고 계속 진행
+
+    Returns:
+        ImportResult
+
+    Raises:
+        ImportValidationError: 파일 검증 실패 (DB 변경 없음)
+    """
+    result = ImportResult()
+    started = time.perf_counter()
+    validation = _validate_or_raise(db, file_path, allow_unknown_users)
+    result.warnings.extend(validation.warnings)
+
+    try:
+        # 조회용 맵 (import 시작 시 한 번만 조회)
+        user_map = load_user_map(db)
+        system_map = {}  # {system_name: system_id}
+        for system_id, system_name in db.query(System.id, System.system_name).order_by(System.id):
+            system_map.setdefault(system_name, system_id)
+        existing_systems = set(system_map)
+
+        # 기존 체크 항목/할당 삭제 (커밋은 import가 끝난 뒤 한 번만)
+        db.query(UserSystemAssignment).delete(synchronize_session=False)
+        db.query(CheckItem).delete(synchronize_session=False)
+
+        used_systems = set()  # 이번 import에서 참조한 시스템 이름
+        item_keys = set()  # {(system_id, item_name)}
+        assignment_keys = set()  # {(user_id, system_id, item_name)}
+
+        for batch in iter_row_batches(file_path, batch_size, result.warnings):
+            result.rows += len(batch)
+
+            # 1. 새 시스템 bulk INSERT 후 ID 조회
+            new_system_names = list(
+                dict.fromkeys(r.system_name for r in batch if r.system_name not in system_map)
+            )
+            if new_system_names:
+                db.execute(insert(System), [{"system_name": name} for name in new_system_names])
+                for system_id, system_name in db.query(System.id, System.system_name).filter(
+                    System.system_name.in_(new_system_names)
+                ):
+                    system_map.setdefault(system_name, system_id)
+                result.systems_created += len(new_system_names)
+
+            # 2. 체크 항목 / 할당 수집
+            new_items = []
+            new_assignments = []
+            for row in batch:
+                used_systems.add(row.system_name)
+                system_id = system_map[row.system_name]
+                item_key = (system_id, row.item_name)
+                if item_key not in item_keys:
+                    item_keys.add(item_key)
+                    new_items.append(
+                        {
+                            "system_id": system_id,
+                            "item_name": row.item_name,
+                            "description": row.description,
+                            "order_index": row.order_index,
+                        }
+                    )
+
+                for user_name in row.user_names:
+                    user = user_map.get(user_name)
+                    if not user:
+                        result.unknown_users.add(user_name)
+                        result.assignments_skipped += 1
+                        continue
+                    assignment_key = (user[0], system_id, row.item_name)
+                    if assignment_key in assignment_keys:
+                        continue
+                    assignment_keys.add(assignment_key)
+                    new_assignments.append(
+                        {
+                            "user_id": user[0],
+                            "user_name": user[1],
+                            "system_id": system_id,
+                            "item_name": row.item_name,
+                        }
+                    )
+
+            # 3. bulk INSERT
+            if new_items:
+                db.execute(insert(CheckItem), new_items)
+                result.items_created += len(new_items)
+            if new_assignments:
+                db.execute(insert(UserSystemAssignment), new_assignments)
+                result.assignments_created += len(new_assignments)
+
+            if progress:
+                progress(result.rows)
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    result.systems_reused = len(existing_systems & used_systems)
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def sync_checklist(
+    db: Session,
+    file_path,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    delete_missing: bool = False,
+    progress=None,
+    commit_each_batch: bool = False,
+    allow_unknown_users: bool = False,
+) -> SyncResult:
+    """체크리스트 데이터 sync import (변경분만 반영)
+
+    기존 체크 항목을 (시스템 이름, 항목 이름)으로 매칭하여
+    - 파일에만 있는 항목/할당은 INSERT
+    - 설명(description)이나 순서(order_index)가 바뀐 항목은 UPDATE
+    - DB에만 있는 항목/할당과 DB에 같은 키로 중복된 항목/할당(첫 번째 제외)은
+      delete_missing=True일 때만 DELETE (기본값은 유지)
+    합니다. 바뀌지 않은 항목은 건드리지 않으므로 체크 항목 ID와 체크 기록이 그대로 유지됩니다.
+    체크 항목을 삭제할 때는 그 항목의 체크 기록/로그/일별 슬롯도 함께 삭제합니다.
+    (SQLite는 외래 키 CASCADE를 적용하지 않으므로 직접 삭제. 일 마감 스냅샷은 유지)
+    변경 전에 파일 전체를 검증(validate_checklist)하여 오류가 있으면 DB를 변경하지 않습니다.
+
+    commit_each_batch=True이면 batch_size개씩 변경할 때마다 커밋하여 쓰기 잠금을 짧게 유지합니다.
+    (업무 시간 중 import용. 중간에 실패하면 이미 커밋된 배치는 유지되며, 같은 파일로 다시
+    실행하면 남은 변경분만 반영됩니다.)
+
+    Args:
+        db: DB 세션
+        file_path: CSV 또는 XLSX 파일 경로
+        batch_size: 한 번에 읽을 행 수
+        delete_missing: 파일에 없는 항목/할당 삭제 여부 (기본값 False)
+        progress: 배치 처리 후 호출되는 콜백 progress(처리한 행 수, phase).
+            파일을 읽을 때는 phase="reading"(기본값), commit_each_batch=True이면 변경 배치를
+            커밋할 때마다 phase="writing"으로 지금까지 반영한 변경 건수를 넘깁니다.
+        commit_each_batch: 변경 배치마다 커밋 여부 (False이면 한 트랜잭션)
+        allow_unknown_users: True이면 등록되지 않은 담당자의 할당만 건너뛰고 계속 진행
+
+    Returns:
+        SyncResult
+
+    Raises:
+        ImportValidationError: 파일 검증 실패 (DB 변경 없음)
+    """
+    result = SyncResult()
+    started = time.perf_counter()
+    validation = _validate_or_raise(db, file_path, allow_unknown_users)
+    result.warnings.extend(validation.warnings)
+
+    try:
+        user_map = load_user_map(db)
+        user_names = {user_id: name for name, (user_id, _) in user_map.items()}
+
+        # 1. 파일의 목표 상태 수집
+        desired_items = {}  # {(system_name, item_name): (description, order_index)}
+        desired_assignments = set()  # {(system_name, item_name, user_id)}
+        for batch in iter_row_batches(file_path, batch_size, result.warnings):
+            result.rows += len(batch)
+            for row in batch:
+                key = (row.system_name, row.item_name)
+                desired_items.setdefault(key, (row.description, row.order_index))
+                for user_name in row.user_names:
+                    user = user_map.get(user_name)
+                    if not user:
+                        result.unknown_users.add(user_name)
+                        result.assignments_skipped += 1
+                        continue
+                    desired_assignments.add((row.system_name, row.item_name, user[0]))
+            if progress:
+                progress(result.rows)
+
+        # 2. 현재 DB 상태 조회
+        system_map = {}  # {system_name: system_id}
+        system_names = {}  # {system_id: system_name}
+        for system_id, system_name in db.query(System.id, System.system_name).order_by(System.id):
+            system_map.setdefault(system_name, system_id)
+            system_names[system_id] = system_name
+
+        existing_items = {}  # {(system_name, item_name): (id, description, order_index)}
+        duplicate_item_ids = []  # [(key, id)] 같은 키가 여러 번 있는 경우 첫 번째 외 나머지
+        for item_id, system_id, item_name, description, order_index in db.query(
+            CheckItem.id,
+            CheckItem.system_id,
+            CheckItem.item_name,
+            CheckItem.description,
+            CheckItem.order_index,
+        ).order_by(CheckItem.id):
+            key = (system_names.get(system_id), item_name)
+            if key in existing_items:
+                duplicate_item_ids.append((key, item_id))
+            else:
+                existing_items[key] = (item_id, description, order_index)
+
+        existing_assignments = {}  # {(system_name, item_name, user_id): id}
+        duplicate_assignment_ids = []
+        for assignment_id, user_id, system_id, item_name in db.query(
+            UserSystemAssignment.id,
+            UserSystemAssignment.user_id,
+            UserSystemAssignment.system_id,
+            UserSystemAssignment.item_name,
+        ).order_by(UserSystemAssignment.id):
+            key = (system_names.get(system_id), item_name, user_id)
+            if key in existing_assignments:
+                duplicate_assignment_ids.append((key, assignment_id))
+            else:
+                existing_assignments[key] = assignment_id
+
+        # 3. 새 시스템 추가
+        new_system_names = sorted({name for name, _ in desired_items} - set(system_map))
+        if new_system_names:
+            db.execute(insert(System), [{"system_name": name} for name in new_system_names])
+            for system_id, system_name in db.query(System.id, System.system_name).filter(
+                System.system_name.in_(new_system_names)
+            ):
+                system_map.setdefault(system_name, system_id)
+            result.systems_created = len(new_system_names)
+        result.systems_reused = len({name for name, _ in desired_items}) - result.systems_created
+
+        # 4. 체크 항목 diff
+        new_items, changed_items = [], []
+        for key, (description, order_index) in desired_items.items():
+            existing = existing_items.get(key)
+            if existing is None:
+                result.item_inserts.append(key)
+                new_items.append(
+                    {
+                        "system_id": system_map[key[0]],
+                        "item_name": key[1],
+                        "description": description,
+                        "order_index": order_index,
+                    }
+                )
+            elif (existing[1], existing[2]) != (description, order_index):
+                result.item_updates.append(key)
+                changed_items.append(
+                    {"id": existing[0], "description": description, "order_index": order_index}
+                )
+            else:
+                result.items_unchanged += 1
+
+        removed_item_ids = []
+        if delete_missing:
+            for key, item_id in duplicate_item_ids:
+                result.item_deletes.append((*key, f"중복 ID {item_id}"))
+                removed_item_ids.append(item_id)
+            for key, (item_id, _, _) in existing_items.items():
+                if key not in desired_items:
+                    result.item_deletes.append(key)
+                    removed_item_ids.append(item_id)
+
+        # 5. 할당 diff
+        new_assignments = []
+        for key in desired_assignments - set(existing_assignments):
+            system_name, item_name, user_id = key
+            result.assignment_inserts.append((system_name, item_name, user_names[user_id]))
+            new_assignments.append(
+                {
+                    "user_id": user_id,
+                    "user_name": user_names[user_id],
+                    "system_id": system_map[system_name],
+                    "item_name": item_name,
+                }
+            )
+        result.assignments_unchanged = len(desired_assignments & set(existing_assignments))
+
+        removed_assignment_ids = []
+        if delete_missing:
+            for (system_name, item_name, user_id), assignment_id in duplicate_assignment_ids:
+                result.assignment_deletes.append(
+                    (system_name, item_name, user_names.get(user_id, str(user_id)), f"중복 ID {assignment_id}")
+                )
+                removed_assignment_ids.append(assignment_id)
+            for key, assignment_id in existing_assignments.items():
+                if key not in desired_assignments:
+                    system_name, item_name, user_id = key
+                    result.assignment_deletes.append(
+                        (system_name, item_name, user_names.get(user_id, str(user_id)))
+                    )
+                    removed_assignment_ids.append(assignment_id)
+
+        # 6. 변경분만 반영
+        written = 0
+
+        def commit_batch(rows: int):
+            nonlocal written
+            _commit_batch(db, commit_each_batch)
+            written += rows
+            if progress and commit_each_batch:
+                progress(written, "writing")
+
+        if commit_each_batch:
+            db.commit()  # 새 시스템
+        for chunk in _chunks(removed_assignment_ids, batch_size):
+            db.query(UserSystemAssignment).filter(UserSystemAssignment.id.in_(chunk)).delete(
+                synchronize_session=False
+            )
+            commit_batch(len(chunk))
+        for chunk in _chunks(removed_item_ids, batch_size):
+            result.records_deleted += _delete_item_dependents(db, chunk)
+            db.query(CheckItem).filter(CheckItem.id.in_(chunk)).delete(synchronize_session=False)
+            commit_batch(len(chunk))
+        for chunk in _chunks(changed_items, batch_size):
+            db.execute(update(CheckItem), chunk)
+            commit_batch(len(chunk))
+        for chunk in _chunks(new_items, batch_size):
+            db.execute(insert(CheckItem), chunk)
+            commit_batch(len(chunk))
+        for chunk in _chunks(new_assignments, batch_size):
+            db.execute(insert(UserSystemAssignment), chunk)
+            commit_batch(len(chunk))
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    result.items_created = len(new_items)
+    result.items_updated = len(changed_items)
+    result.items_deleted = len(removed_item_ids)
+    result.assignments_created = len(new_assignments)
+    result.assignments_deleted = len(removed_assignment_ids)
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def _delete_item_dependents(db: Session, item_ids: list) -> int:
+    """삭제할 체크 항목의 체크 기록/로그/일별 슬롯 삭제, 삭제한 체크 기록 수 반환"""
+    db.query(ChecklistDailySlot).filter(ChecklistDailySlot.check_item_id.in_(item_ids)).delete(
+        synchronize_session=False
+    )
+    db.query(ChecklistRecordLog).filter(ChecklistRecordLog.check_item_id.in_(item_ids)).delete(
+        synchronize_session=False
+    )
+    return (
+        db.query(ChecklistRecord)
+        .filter(ChecklistRecord.check_item_id.in_(item_ids))
+        .delete(synchronize_session=False)
+    )
+
+
+def _commit_batch(db: Session, enabled: bool):
+    if enabled:
+        db.commit()
+
+
+def _chunks(values: list, size: int):
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
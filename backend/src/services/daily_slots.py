@@ -0,0 +1,199 @@
+"""일별 체크 슬롯 (checklist_daily_slots)
+
+매일 업무 시작 전(DAILY_SLOTS_TIME, 기본값 06:00) 그날의 체크 항목마다 UNCHECKED 슬롯을 미리 만들고,
+체크리스트 제출 시 슬롯의 상태를 PASS/FAIL로 갱신합니다.
+
+- 미체크 항목 조회: 전체 체크 항목과 오늘 기록을 비교하지 않고 (check_date, status='UNCHECKED') 인덱스 조회
+- 하루 진행 현황: 슬롯의 상태별 count
+- 오늘 슬롯이 아직 없으면 (스케줄러가 실행되지 않은 경우 등) 기존 방식(전체 항목 - 오늘 기록)으로 조회합니다.
+- 체크 항목을 import한 뒤에는 오늘 슬롯을 다시 맞춥니다. (추가된 항목 슬롯 생성, 삭제된 항목 슬롯 삭제)
+"""
+import logging
+import os
+from datetime import date, timedelta
+
+from dotenv import load_dotenv
+from sqlalchemy import func, insert, inspect, update
+from sqlalchemy.orm import Session
+
+from services.database import SessionLocal
+from models.models import CheckItem, ChecklistRecord, ChecklistDailySlot
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 슬롯 보관 기간 (일), 지난 날짜의 결과는 일 마감 스냅샷에 남음
+DAILY_SLOT_RETENTION_DAYS = int(os.getenv("DAILY_SLOT_RETENTION_DAYS", "7"))
+
+
+def has_slots(db: Session, target_date: date) -> bool:
+    return (
+        db.query(ChecklistDailySlot.id)
+        .filter(ChecklistDailySlot.check_date == target_date)
+        .first()
+        is not None
+    )
+
+
+def create_daily_slots(db: Session, target_date: date) -> dict:
+    """하루치 슬롯 생성 및 현재 체크 항목과 맞추기 (여러 번 실행해도 같은 결과)
+
+    이미 체크된 항목(해당 날짜 기록이 있는 항목)은 기록의 상태로 만듭니다.
+
+    Returns:
+        dict: {"created": n, "removed": n, "items": n}
+    """
+    items = {item_id for (item_id,) in db.query(CheckItem.id)}
+    existing = {
+        item_id
+        for (item_id,) in db.query(ChecklistDailySlot.check_item_id).filter(
+            ChecklistDailySlot.check_date == target_date
+        )
+    }
+
+    removed_ids = [item_id for item_id in existing if item_id not in items]
+    for start in range(0, len(removed_ids), 500):
+        db.query(ChecklistDailySlot).filter(
+            ChecklistDailySlot.check_date == target_date,
+            ChecklistDailySlot.check_item_id.in_(removed_ids[start : start + 500]),
+        ).delete(synchronize_session=False)
+
+    missing_ids = [item_id for item_id in items if item_id not in existing]
+    if missing_ids:
+        checked = {
+            record.check_item_id: record
+            for record in db.query(ChecklistRecord).filter(ChecklistRecord.check_date == target_date)
+        }
+        rows = []
+        for item_id in missing_ids:
+            record = checked.get(item_id)
+            rows.append(
+                {
+                    "check_date": target_date,
+                    "check_item_id": item_id,
+                    "status": record.status if record else "UNCHECKED",
+                    "checked_by": record.user_id if record else None,
+                    "checked_at": record.checked_at if record else None,
+                }
+            )
+        db.execute(insert(ChecklistDailySlot), rows)
+
+    db.commit()
+    return {"created": len(missing_ids), "removed": len(removed_ids), "items": len(items)}
+
+
+def refresh_slots(db: Session, target_date: date):
+    """체크 항목을 변경(import)한 뒤 해당 날짜 슬롯 다시 맞추기 (슬롯이 없는 날짜면 아무것도 하지 않음)"""
+    # 서버를 한 번도 실행하지 않은 DB(슬롯 테이블 없음)에서 import하는 경우
+    if not inspect(db.get_bind()).has_table(ChecklistDailySlot.__tablename__):
+        return
+    if has_slots(db, target_date):
+        create_daily_slots(db, target_date)
+
+
+def mark_slot(db: Session, check_item_id: int, target_date: date, status: str, user_id: int, checked_at):
+    """제출한 항목의 슬롯 상태 갱신 (커밋은 호출한 쪽에서)
+
+    슬롯이 없으면 (오늘 슬롯 생성 전 등) 아무것도 하지 않습니다.
+    """
+    db.execute(
+        update(ChecklistDailySlot)
+        .where(
+            ChecklistDailySlot.check_date == target_date,
+            ChecklistDailySlot.check_item_id == check_item_id,
+        )
+        .values(status=status, checked_by=user_id, checked_at=checked_at)
+    )
+
+
+def unchecked_items(db: Session, target_date: date, system_ids: list = None) -> list:
+    """미체크 항목 조회 (슬롯이 없으면 전체 항목 - 해당 날짜 기록으로 계산)
+
+    Args:
+        system_ids: 지정하면 해당 시스템의 항목만
+
+    Returns:
+        list: CheckItem 목록
+    """
+    if has_slots(db, target_date):
+        query = (
+            db.query(CheckItem)
+            .join(ChecklistDailySlot, ChecklistDailySlot.check_item_id == CheckItem.id)
+            .filter(
+                ChecklistDailySlot.check_date == target_date,
+                ChecklistDailySlot.status == "UNCHECKED",
+            )
+        )
+        if system_ids is not None:
+            query = query.filter(CheckItem.system_id.in_(system_ids))
+        return query.order_by(CheckItem.id).all()
+
+    # 확인자가 여러 명인 경우, 한 명이 체크하면 다른 사람도 체크된 것으로 보임.
+    checked_item_ids = (
+        db.query(ChecklistRecord.check_item_id).filter(ChecklistRecord.check_date == target_date)
+    )
+    query = db.query(CheckItem).filter(~CheckItem.id.in_(checked_item_ids))
+    if system_ids is not None:
+        query = query.filter(CheckItem.system_id.in_(system_ids))
+    return query.order_by(CheckItem.id).all()
+
+
+def slot_status_counts(db: Session, target_date: date) -> dict:
+    """하루 진행 현황 (슬롯이 없으면 None)
+
+    Returns:
+        dict: {"PASS": n, "FAIL": n, "UNCHECKED": n}
+    """
+    counts = dict(
+        db.query(ChecklistDailySlot.status, func.count(ChecklistDailySlot.id))
+        .filter(ChecklistDailySlot.check_date == target_date)
+        .group_by(ChecklistDailySlot.status)
+        .all()
+    )
+    if not counts:
+        return None
+    return {status: counts.get(status, 0) for status in ("PASS", "FAIL", "UNCHECKED")}
+
+
+def instantiate_daily_slots(today: date = None) -> dict:
+    """오늘 슬롯 생성 및 보관 기간이 지난 슬롯 삭제 (블로킹, 스케줄러 작업 스레드에서 실행)
+
+    Returns:
+        dict: 실행 이력에 기록할 통계
+    """
+    from services.scheduler import get_korea_today
+
+    today = today or get_korea_today()
+    cutoff = today - timedelta(days=max(DAILY_SLOT_RETENTION_DAYS, 1))
+
+    db = SessionLocal()
+    try:
+        result = create_daily_slots(db, today)
+        pruned = (
+            db.query(ChecklistDailySlot)
+            .filter(ChecklistDailySlot.check_date < cutoff)
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    logger.info(
+        "일별 슬롯 %s: 항목 %d개 (생성 %d, 삭제 %d), 지난 슬롯 %d건 정리",
+        today,
+        result["items"],
+        result["created"],
+        result["removed"],
+        pruned,
+    )
+    return {
+        "rows_scanned": result["items"],
+        "check_date": today.isoformat(),
+        "slots_created": result["created"],
+        "slots_removed": result["removed"],
+        "slots_pruned": pruned,
+    }
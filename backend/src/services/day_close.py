@@ -0,0 +1,233 @@
+"""일 마감 (체크리스트 일별 최종 상태 스냅샷)
+
+매일 DAY_CLOSE_TIME(기본값 00:10)에 전날을 마감하여, 체크 항목별 최종 상태(PASS/FAIL/UNCHECKED)를
+checklist_daily_snapshots 테이블에 기록합니다. 한 번 기록한 날짜는 다시 쓰지 않습니다.
+
+- 최종 상태: 해당 날짜의 체크 기록 중 checked_at이 가장 늦은 기록 (엑셀 다운로드와 같은 기준)
+- 체크 기록이 하나도 없는 날(주말/휴일)은 마감하지 않습니다.
+- 스케줄러가 멈춰 있던 날은 다음 실행 때 최대 DAY_CLOSE_CATCHUP_DAYS일까지 이어서 마감합니다.
+  (이때 체크 항목/담당자는 마감 시점 기준입니다)
+"""
+import logging
+import os
+from datetime import date, timedelta
+
+from dotenv import load_dotenv
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+
+from services.database import SessionLocal
+from services.record_archive import load_records
+from models.models import (
+    User,
+    System,
+    CheckItem,
+    UserSystemAssignment,
+    ChecklistDailySnapshot,
+)
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 마감이 밀렸을 때 이어서 마감할 최대 일수
+DAY_CLOSE_CATCHUP_DAYS = int(os.getenv("DAY_CLOSE_CATCHUP_DAYS", "7"))
+
+
+def load_item_catalog(db: Session) -> list:
+    """현재 체크 항목 목록 (시스템 이름, 담당자 포함)
+
+    Returns:
+        list: [{check_item_id, system_id, system_name, item_name, order_index, assignees}, ...]
+    """
+    system_map = {system_id: name for system_id, name in db.query(System.id, System.system_name)}
+    user_map = {user_id: name for user_id, name in db.query(User.id, User.name)}
+
+    # 담당자는 시스템 단위로 표시 (중복 제거 후 이름순)
+    assignee_map = {}
+    for system_id, user_id in db.query(UserSystemAssignment.system_id, UserSystemAssignment.user_id):
+        if user_id in user_map:
+            assignee_map.setdefault(system_id, set()).add(user_map[user_id])
+
+    return [
+        {
+            "check_item_id": item_id,
+            "system_id": system_id,
+            "system_name": system_map.get(system_id, ""),
+            "item_name": item_name,
+            "order_index": order_index or 0,
+            "assignees": ", ".join(sorted(assignee_map.get(system_id, []))),
+        }
+        for item_id, system_id, item_name, order_index in db.query(
+            CheckItem.id, CheckItem.system_id, CheckItem.item_name, CheckItem.order_index
+        )
+    ]
+
+
+def final_records(records) -> dict:
+    """(check_item_id, check_date)별 최종 기록 (checked_at이 가장 늦은 기록)"""
+    latest = {}
+    for record in records:
+        key = (record.check_item_id, record.check_date)
+        current = latest.get(key)
+        if current is None or (record.checked_at and current.checked_at and record.checked_at > current.checked_at):
+            latest[key] = record
+    return latest
+
+
+def build_day_rows(catalog: list, latest: dict, target_date: date) -> list:
+    """하루치 항목별 최종 상태 행 생성 (기록이 없는 항목은 UNCHECKED)"""
+    rows = []
+    for item in catalog:
+        record = latest.get((item["check_item_id"], target_date))
+        rows.append(
+            {
+                **item,
+                "snapshot_date": target_date,
+                "status": record.status if record else "UNCHECKED",
+                "notes": record.notes if record else None,
+                "checked_by": record.user_id if record else None,
+                "checked_at": record.checked_at if record else None,
+            }
+        )
+    return rows
+
+
+def is_closed(db: Session, target_date: date) -> bool:
+    return (
+        db.query(ChecklistDailySnapshot.id)
+        .filter(ChecklistDailySnapshot.snapshot_date == target_date)
+        .first()
+        is not None
+    )
+
+
+def close_day(db: Session, target_date: date) -> int:
+    """하루 마감 (이미 마감했거나 체크 기록이 없으면 0 반환)
+
+    Returns:
+        int: 기록한 스냅샷 행 수
+    """
+    if is_closed(db, target_date):
+        return 0
+    records = load_records(db, target_date, target_date)
+    if not records:
+        return 0
+
+    rows = build_day_rows(load_item_catalog(db), final_records(records), target_date)
+    if not rows:
+        return 0
+    db.execute(insert(ChecklistDailySnapshot), rows)
+    db.commit()
+    return len(rows)
+
+
+def close_pending_days(today: date = None) -> dict:
+    """마감되지 않은 지난 날짜 마감 (블로킹, 스케줄러 작업 스레드에서 실행)
+
+    마지막 마감일 다음 날부터 어제까지 (최대 DAY_CLOSE_CATCHUP_DAYS일) 마감합니다.
+
+    Returns:
+        dict: 실행 이력에 기록할 통계
+    """
+    from services.scheduler import get_korea_today
+
+    today = today or get_korea_today()
+    yesterday = today - timedelta(days=1)
+    start = yesterday - timedelta(days=max(DAY_CLOSE_CATCHUP_DAYS, 1) - 1)
+
+    stats = {"rows_scanned": 0, "closed_dates": [], "skipped_dates": []}
+    db = SessionLocal()
+    try:
+        last_closed = db.query(func.max(ChecklistDailySnapshot.snapshot_date)).scalar()
+        if isinstance(last_closed, str):
+            last_closed = date.fromisoformat(last_closed)
+        if last_closed and last_closed >= start:
+            start = last_closed + timedelta(days=1)
+
+        target = start
+        while target <= yesterday:
+            try:
+                count = close_day(db, target)
+            except Exception:
+                db.rollback()
+                raise
+            if count:
+                stats["closed_dates"].append(target.isoformat())
+                stats["rows_scanned"] += count
+            else:
+                stats["skipped_dates"].append(target.isoformat())
+            target += timedelta(days=1)
+    finally:
+        db.close()
+
+    logger.info(
+        "일 마감: %s (기록 없음: %d일)", ", ".join(stats["closed_dates"]) or "없음", len(stats["skipped_dates"])
+    )
+    return stats
+
+
+def load_daily_results(db: Session, start_date: date, end_date: date) -> list:
+    """날짜 범위의 항목별 일별 최종 상태 조회 (엑셀 다운로드용)
+
+    마감된 날짜는 스냅샷을 그대로 읽고, 아직 마감되지 않은 날짜(오늘 등)는
+    체크 기록과 현재 체크 항목으로 같은 형태의 행을 만듭니다. 체크 기록이 없는 날짜는 포함하지 않습니다.
+
+    Returns:
+        list: build_day_rows()와 같은 형태의 dict 목록 (날짜, 시스템, 항목 순 정렬)
+    """
+    columns = ChecklistDailySnapshot.__table__.columns
+    snapshot_rows = [
+        dict(row._mapping)
+        for row in db.query(*[column for column in columns if column.name not in ("id", "closed_at")])
+        .filter(
+            ChecklistDailySnapshot.snapshot_date >= start_date,
+            ChecklistDailySnapshot.snapshot_date <= end_date,
+        )
+    ]
+    closed_dates = {row["snapshot_date"] for row in snapshot_rows}
+
+    rows = snapshot_rows
+    open_records = [
+        record for record in load_records(db, start_date, end_date) if record.check_date not in closed_dates
+    ]
+    if open_records:
+        catalog = load_item_catalog(db)
+        latest = final_records(open_records)
+        for target_date in sorted({record.check_date for record in open_records}):
+            rows.extend(build_day_rows(catalog, latest, target_date))
+
+    rows.sort(key=lambda row: (row["snapshot_date"], row["system_id"], row["item_name"]))
+    return rows
+
+
+def count_statuses_by_date(rows: list) -> dict:
+    """load_daily_results() 행의 날짜별 상태 수 (엑셀 통계 시트용)
+
+    Returns:
+        dict: {"YYYY-MM-DD": {"PASS": n, "FAIL": n, "UNCHECKED": n}, ...}
+    """
+    date_stats = {}
+    for row in rows:
+        date_str = row["snapshot_date"].strftime("%Y-%m-%d")
+        if date_str not in date_stats:
+            date_stats[date_str] = {"PASS": 0, "FAIL": 0, "UNCHECKED": 0}
+        date_stats[date_str][row["status"]] += 1
+    return date_stats
+
+
+def snapshot_status_counts(db: Session, target_date: date) -> dict:
+    """마감된 날짜의 상태별 항목 수 (마감되지 않은 날짜면 None)
+
+    Returns:
+        dict: {"PASS": n, "FAIL": n, "UNCHECKED": n}
+    """
+    counts = dict(
+        db.query(ChecklistDailySnapshot.status, func.count(ChecklistDailySnapshot.id))
+        .filter(ChecklistDailySnapshot.snapshot_date == target_date)
+        .group_by(ChecklistDailySnapshot.status)
+        .all()
+    )
+    if not counts:
+        return None
+    return {status: counts.get(status, 0) for status in ("PASS", "FAIL", "UNCHECKED")}
@@ -0,0 +1,122 @@
+"""데이터베이스 유지보수 (통계 갱신, 빈 공간 정리)
+
+스케줄러가 매일 DB_MAINTENANCE_TIME(기본값 04:30, 업무 시간 외)에 실행합니다.
+
+SQLite
+- 통계 갱신: 통계가 없으면 ANALYZE, 있으면 PRAGMA optimize (필요한 테이블만 다시 분석)
+- 빈 공간 정리: auto_vacuum=INCREMENTAL이면 PRAGMA incremental_vacuum,
+  아니면 빈 페이지 비율이 DB_VACUUM_FREE_RATIO 이상일 때만 VACUUM
+  (VACUUM 전에 auto_vacuum=INCREMENTAL로 바꾸므로 이후에는 파일 전체를 다시 쓰지 않고 정리)
+PostgreSQL
+- VACUUM (ANALYZE) 테이블별 실행 (잠금이 긴 VACUUM FULL은 실행하지 않음)
+
+실행 이력에는 소요 시간과 함께 실행 전후 크기, 정리한 공간(bytes)이 기록됩니다.
+"""
+import logging
+import os
+import time
+
+from dotenv import load_dotenv
+from sqlalchemy import inspect
+
+from services.database import engine
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 빈 페이지 비율이 이 값 이상이면 VACUUM (0~1)
+DB_VACUUM_FREE_RATIO = float(os.getenv("DB_VACUUM_FREE_RATIO", "0.2"))
+
+
+def _sqlite_size(conn) -> dict:
+    page_size = conn.exec_driver_sql("PRAGMA page_size").scalar()
+    page_count = conn.exec_driver_sql("PRAGMA page_count").scalar()
+    freelist = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+    return {"bytes": page_size * page_count, "free_bytes": page_size * freelist, "pages": page_count, "free_pages": freelist}
+
+
+def _maintain_sqlite(stats: dict):
+    # VACUUM은 트랜잭션 안에서 실행할 수 없으므로 autocommit 연결 사용
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        before = _sqlite_size(conn)
+
+        started = time.perf_counter()
+        has_stats = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        ).first()
+        if has_stats:
+            conn.exec_driver_sql("PRAGMA optimize")
+            stats["operations"].append("PRAGMA optimize")
+        else:
+            conn.exec_driver_sql("ANALYZE")
+            stats["operations"].append("ANALYZE")
+        stats["analyze_ms"] = int((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        auto_vacuum = conn.exec_driver_sql("PRAGMA auto_vacuum").scalar()  # 0=NONE, 1=FULL, 2=INCREMENTAL
+        free_ratio = before["free_pages"] / before["pages"] if before["pages"] else 0
+        stats["free_ratio"] = round(free_ratio, 4)
+        if auto_vacuum == 2:
+            if before["free_pages"]:
+                # sqlite3 모듈의 execute()는 한 단계(한 페이지)만 실행하므로 executescript()로 끝까지 실행
+                conn.connection.driver_connection.executescript("PRAGMA incremental_vacuum;")
+                stats["operations"].append("PRAGMA incremental_vacuum")
+        elif free_ratio >= DB_VACUUM_FREE_RATIO:
+            conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.exec_driver_sql("VACUUM")
+            stats["operations"].append("VACUUM")
+        stats["vacuum_ms"] = int((time.perf_counter() - started) * 1000)
+
+        after = _sqlite_size(conn)
+
+    stats["bytes_before"] = before["bytes"]
+    stats["bytes_after"] = after["bytes"]
+
+
+def _postgres_size(conn, tables: list) -> int:
+    return sum(
+        conn.exec_driver_sql("SELECT pg_total_relation_size(%s)", (table,)).scalar() or 0 for table in tables
+    )
+
+
+def _maintain_postgresql(stats: dict):
+    tables = inspect(engine).get_table_names()
+    # VACUUM은 트랜잭션 안에서 실행할 수 없으므로 autocommit 연결 사용
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        before = _postgres_size(conn, tables)
+        started = time.perf_counter()
+        for table in tables:
+            conn.exec_driver_sql(f'VACUUM (ANALYZE) "{table}"')
+        stats["operations"].append(f"VACUUM (ANALYZE) {len(tables)}개 테이블")
+        stats["vacuum_ms"] = int((time.perf_counter() - started) * 1000)
+        after = _postgres_size(conn, tables)
+
+    stats["bytes_before"] = before
+    stats["bytes_after"] = after
+
+
+def run_db_maintenance() -> dict:
+    """DB 통계 갱신 및 빈 공간 정리 (블로킹, 스케줄러 작업 스레드에서 실행)
+
+    Returns:
+        dict: 실행 이력에 기록할 통계
+    """
+    stats = {"rows_scanned": 0, "dialect": engine.dialect.name, "operations": []}
+    if engine.dialect.name == "sqlite":
+        _maintain_sqlite(stats)
+    elif engine.dialect.name == "postgresql":
+        _maintain_postgresql(stats)
+    else:
+        logger.warning("DB 유지보수: 지원하지 않는 DB입니다: %s", engine.dialect.name)
+        return stats
+
+    stats["bytes_reclaimed"] = max(stats["bytes_before"] - stats["bytes_after"], 0)
+    logger.info(
+        "DB 유지보수 %s: %s → %s bytes (%s bytes 정리)",
+        ", ".join(stats["operations"]) or "변경 없음",
+        f"{stats['bytes_before']:,}",
+        f"{stats['bytes_after']:,}",
+        f"{stats['bytes_reclaimed']:,}",
+    )
+    return stats
@@ -0,0 +1,273 @@
+"""데이터베이스 스냅샷 (백업) 및 복원
+
+운영 DB 안에 백업 테이블을 만들지 않고, DB_SNAPSHOT_DIR에 별도 파일로 스냅샷을 만듭니다.
+
+SQLite
+- 스냅샷: sqlite3 백업 API로 DB_SNAPSHOT_PAGES_PER_STEP 페이지씩 복사하고 단계 사이에 잠금을 풀어 주므로,
+  복사 중에도 체크리스트 제출 등 쓰기가 막히지 않습니다. (복사 중 변경된 페이지는 백업 API가 다시 복사)
+- 전체 복원: 스냅샷 파일을 백업 API로 운영 DB에 한 번에 덮어씀
+- 테이블 복원: 스냅샷을 ATTACH하여 한 트랜잭션에서 테이블 내용만 교체
+- 컬럼 복원: 스냅샷의 값으로 특정 컬럼만 UPDATE (예: 테스트용으로 바꾼 users.email 되돌리기)
+PostgreSQL
+- 스냅샷: pg_dump -Fc, 복원: pg_restore (테이블 복원은 TRUNCATE 후 데이터만 복원)
+
+스케줄러가 매일 DB_SNAPSHOT_TIME(기본값 03:00)에 스냅샷을 만들고 최근 DB_SNAPSHOT_KEEP개만 남깁니다.
+"""
+import logging
+import os
+import sqlite3
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+
+from dotenv import load_dotenv
+from sqlalchemy import inspect
+
+from services.database import engine, project_root
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 파일 경로
+DB_SNAPSHOT_DIR = Path(os.getenv("DB_SNAPSHOT_DIR", str(project_root / "database" / "snapshots")))
+# 스케줄 스냅샷 보관 개수
+DB_SNAPSHOT_KEEP = int(os.getenv("DB_SNAPSHOT_KEEP", "7"))
+# 백업 API 한 단계에 복사할 페이지 수 (작을수록 쓰기 대기 시간이 짧아짐)
+DB_SNAPSHOT_PAGES_PER_STEP = int(os.getenv("DB_SNAPSHOT_PAGES_PER_STEP", "256"))
+
+SCHEDULED_LABEL = "scheduled"
+
+
+# 복사 중 원본이 변경되어 처음부터 다시 복사한 횟수가 이 값을 넘으면 한 번에 복사
+MAX_BACKUP_RESTARTS = 5
+
+
+class _TooManyRestarts(Exception):
+    pass
+
+
+class _RestartCounter:
+    """백업 API 진행 콜백: 남은 페이지 수가 다시 늘어나면(원본 변경으로 재시작) 횟수 계산"""
+
+    def __init__(self):
+        self.remaining = None
+        self.restarts = 0
+
+    def __call__(self, status, remaining, total):
+        if self.remaining is not None and remaining > self.remaining:
+            self.restarts += 1
+            if self.restarts > MAX_BACKUP_RESTARTS:
+                raise _TooManyRestarts()
+        self.remaining = remaining
+
+
+def _is_sqlite() -> bool:
+    return engine.dialect.name == "sqlite"
+
+
+def _sqlite_path() -> str:
+    return engine.url.database
+
+
+def _pg_url() -> str:
+    # pg_dump/pg_restore는 SQLAlchemy 드라이버 표기(postgresql+psycopg2)를 모름
+    return engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+def _suffix() -> str:
+    return ".db" if _is_sqlite() else ".dump"
+
+
+def list_snapshots() -> list:
+    """스냅샷 파일 목록 (오래된 순)"""
+    if not DB_SNAPSHOT_DIR.exists():
+        return []
+    return sorted(path for path in DB_SNAPSHOT_DIR.iterdir() if path.suffix in (".db", ".dump"))
+
+
+def resolve_snapshot(name) -> Path:
+    """스냅샷 이름 또는 경로를 파일 경로로 변환
+
+    Raises:
+        FileNotFoundError: 스냅샷 파일이 없는 경우
+    """
+    path = Path(name)
+    if not path.exists():
+        path = DB_SNAPSHOT_DIR / name
+    if not path.exists():
+        raise FileNotFoundError(f"스냅샷 파일을 찾을 수 없습니다: {name}")
+    return path
+
+
+def create_snapshot(label: str = None) -> Path:
+    """운영 DB 스냅샷 생성 (쓰기를 막지 않음), 스냅샷 파일 경로 반환"""
+    DB_SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+    name = f"{datetime.now():%Y%m%d_%H%M%S}" + (f"_{label}" if label else "") + _suffix()
+    path = DB_SNAPSHOT_DIR / name
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.unlink(missing_ok=True)
+
+    try:
+        if _is_sqlite():
+            source = sqlite3.connect(_sqlite_path())
+            target = sqlite3.connect(temp_path)
+            try:
+                try:
+                    # 단계 사이에 잠금을 풀어 다른 연결의 쓰기가 진행되도록 잠시 대기
+                    source.backup(
+                        target, pages=max(DB_SNAPSHOT_PAGES_PER_STEP, 1), progress=_RestartCounter(), sleep=0.005
+                    )
+                except _TooManyRestarts:
+                    # 쓰기가 계속 이어져 복사가 끝나지 않으면 한 번에 복사 (복사하는 동안만 쓰기 대기)
+                    logger.info("DB 스냅샷: 복사 중 변경이 계속되어 한 번에 복사합니다.")
+                    source.backup(target)
+                if target.execute("PRAGMA integrity_check").fetchone()[0] != "ok":
+                    raise RuntimeError("스냅샷 무결성 검사에 실패했습니다.")
+            finally:
+                target.close()
+                source.close()
+        else:
+            subprocess.run(
+                ["pg_dump", "--format=custom", f"--file={temp_path}", _pg_url()],
+                check=True,
+            )
+    except Exception:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    temp_path.replace(path)
+    return path
+
+
+def restore_snapshot(name):
+    """스냅샷으로 DB 전체 복원 (서버를 중지한 상태에서 실행)"""
+    path = resolve_snapshot(name)
+    engine.dispose()
+    if _is_sqlite():
+        source = sqlite3.connect(path)
+        target = sqlite3.connect(_sqlite_path())
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+    else:
+        subprocess.run(
+            ["pg_restore", "--clean", "--if-exists", "--no-owner", f"--dbname={_pg_url()}", str(path)],
+            check=True,
+        )
+
+
+def restore_tables(name, tables: list) -> dict:
+    """스냅샷에서 지정한 테이블 내용만 복원 (스키마는 그대로), 테이블별 복원한 행 수 반환"""
+    path = resolve_snapshot(name)
+    live_tables = set(inspect(engine).get_table_names())
+    unknown = [table for table in tables if table not in live_tables]
+    if unknown:
+        raise ValueError(f"운영 DB에 없는 테이블입니다: {', '.join(unknown)}")
+
+    restored = {}
+    if _is_sqlite():
+        conn = sqlite3.connect(_sqlite_path(), isolation_level=None)
+        try:
+            conn.execute("ATTACH DATABASE ? AS snapshot", (str(path),))
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for table in tables:
+                    columns = _common_columns(conn, table)
+                    conn.execute(f'DELETE FROM main."{table}"')
+                    conn.execute(
+                        f'INSERT INTO main."{table}" ({columns}) SELECT {columns} FROM snapshot."{table}"'
+                    )
+                    restored[table] = conn.execute(f'SELECT COUNT(*) FROM main."{table}"').fetchone()[0]
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("DETACH DATABASE snapshot")
+        finally:
+            conn.close()
+    else:
+        with engine.begin() as conn:
+            for table in tables:
+                conn.exec_driver_sql(f'TRUNCATE TABLE "{table}" CASCADE')
+        args = ["pg_restore", "--data-only", "--no-owner", f"--dbname={_pg_url()}"]
+        args += [f"--table={table}" for table in tables]
+        subprocess.run(args + [str(path)], check=True)
+        with engine.connect() as conn:
+            for table in tables:
+                restored[table] = conn.exec_driver_sql(f'SELECT COUNT(*) FROM "{table}"').scalar()
+    return restored
+
+
+def restore_columns(name, table: str, columns: list, key: str = "id") -> int:
+    """스냅샷의 값으로 테이블의 일부 컬럼만 복원 (key가 같은 행만), 변경한 행 수 반환
+
+    PostgreSQL은 스냅샷이 pg_dump 파일이므로 지원하지 않습니다. (restore_tables 사용)
+    """
+    if not _is_sqlite():
+        raise NotImplementedError("컬럼 단위 복원은 SQLite에서만 지원합니다.")
+    path = resolve_snapshot(name)
+    assignments = ", ".join(
+        f'"{column}" = (SELECT s."{column}" FROM snapshot."{table}" s WHERE s."{key}" = main."{table}"."{key}")'
+        for column in columns
+    )
+    conn = sqlite3.connect(_sqlite_path(), isolation_level=None)
+    try:
+        conn.execute("ATTACH DATABASE ? AS snapshot", (str(path),))
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.execute(
+                f'UPDATE main."{table}" SET {assignments} '
+                f'WHERE "{key}" IN (SELECT "{key}" FROM snapshot."{table}")'
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("DETACH DATABASE snapshot")
+        return cursor.rowcount
+    finally:
+        conn.close()
+
+
+def _common_columns(conn, table: str) -> str:
+    """운영 DB와 스냅샷에 모두 있는 컬럼 (스냅샷 이후 컬럼이 추가된 경우 대비)"""
+    live = [row[1] for row in conn.execute(f'PRAGMA main.table_info("{table}")')]
+    snapshot = {row[1] for row in conn.execute(f'PRAGMA snapshot.table_info("{table}")')}
+    if not snapshot:
+        raise ValueError(f"스냅샷에 {table} 테이블이 없습니다.")
+    return ", ".join(f'"{column}"' for column in live if column in snapshot)
+
+
+def snapshot_job() -> dict:
+    """스케줄 스냅샷 생성 및 오래된 스케줄 스냅샷 삭제 (블로킹, 스케줄러 작업 스레드에서 실행)
+
+    Returns:
+        dict: 실행 이력에 기록할 통계
+    """
+    started = time.perf_counter()
+    path = create_snapshot(SCHEDULED_LABEL)
+    elapsed = time.perf_counter() - started
+
+    scheduled = [snapshot for snapshot in list_snapshots() if snapshot.stem.endswith(f"_{SCHEDULED_LABEL}")]
+    removed = scheduled[: max(len(scheduled) - max(DB_SNAPSHOT_KEEP, 1), 0)]
+    for snapshot in removed:
+        snapshot.unlink(missing_ok=True)
+
+    logger.info(
+        "DB 스냅샷 %s (%s bytes, %.2f초), 오래된 스냅샷 %d개 삭제",
+        path.name,
+        f"{path.stat().st_size:,}",
+        elapsed,
+        len(removed),
+    )
+    return {
+        "rows_scanned": 0,
+        "snapshot": path.name,
+        "snapshot_bytes": path.stat().st_size,
+        "copy_seconds": round(elapsed, 3),
+        "snapshots_removed": [snapshot.name for snapshot in removed],
+    }
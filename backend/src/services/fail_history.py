@@ -0,0 +1,47 @@
+"""체크 항목별 하루 상태 변경 이력 분석 (console FAIL 항목 목록용)
+
+체크 기록 로그를 항목별 시간순 이력으로 묶고, 최종 상태가 FAIL인 항목의 첫 FAIL/최신 FAIL 정보를 계산합니다.
+- 처음부터 FAIL인 경우
+- PASS에서 FAIL로 변경된 경우
+- FAIL에서 PASS로 변경되었다가 다시 FAIL로 변경된 경우
+"""
+
+
+def group_status_history(logs) -> dict:
+    """로그를 항목별 시간순 이력으로 그룹화
+
+    Returns:
+        dict: {check_item_id: [(status, created_at, user_id, notes), ...]}
+    """
+    history = {}
+    for log in logs:
+        history.setdefault(log.check_item_id, []).append((log.status, log.created_at, log.user_id, log.notes))
+
+    # 각 항목의 로그를 시간순으로 정렬 (혹시 모를 정렬 문제 방지)
+    for entries in history.values():
+        entries.sort(key=lambda entry: entry[1])
+    return history
+
+
+def summarize_fail_history(history: list):
+    """최종 상태가 FAIL인 항목의 FAIL 정보 (최종 상태가 FAIL이 아니면 None)
+
+    최종 상태가 FAIL인 항목만 대상이므로 중간에 PASS로 바뀌었더라도 미해결(is_resolved=False)입니다.
+
+    Returns:
+        dict: {"user_id": 첫 FAIL을 기록한 사용자, "fail_time": 첫 FAIL 시간, "notes": 최신 FAIL 비고,
+               "is_resolved": False, "resolved_date": None, "resolved_time": None}
+    """
+    if not history or history[-1][0] != "FAIL":
+        return None
+
+    first_fail = next(entry for entry in history if entry[0] == "FAIL")
+    latest_fail = next(entry for entry in reversed(history) if entry[0] == "FAIL")
+    return {
+        "user_id": first_fail[2],
+        "fail_time": first_fail[1],
+        "notes": latest_fail[3],
+        "is_resolved": False,
+        "resolved_date": None,
+        "resolved_time": None,
+    }
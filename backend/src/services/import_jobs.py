@@ -0,0 +1,177 @@
+"""업로드한 파일로 체크리스트/사용자 데이터를 import하는 백그라운드 작업
+
+관리자 업로드 API(/api/console/import/{kind})에서 사용합니다.
+
+- 요청 본문은 Starlette multipart 파서가 먼저 임시 파일로 받은 뒤(1MB 초과분은 디스크),
+  청크 단위로 IMPORT_UPLOAD_DIR에 복사하므로 파일 전체를 메모리에 올리지 않습니다.
+- 크기 제한은 본문을 받기 전에 Content-Length로 먼저 검사합니다. (upload_exceeds_limit, main.py 미들웨어)
+  Content-Length가 없는 요청(chunked 전송)은 본문을 받은 뒤 복사하면서 검사합니다.
+- import는 스케줄러 작업 스레드에서 실행되며, 진행 상황(처리한 행 수)은
+  scheduler_job_runs 실행 이력에 기록됩니다. (GET /api/scheduler/runs/{run_id})
+- 변경은 IMPORT_COMMIT_BATCH_SIZE개씩 커밋하여 쓰기 잠금을 짧게 유지하므로,
+  업무 시간 중에도 체크리스트 제출을 막지 않습니다.
+- 체크리스트는 변경분만 반영하는 sync 방식으로만 import합니다.
+  (배치 커밋 중 전체 삭제 상태가 사용자에게 보이지 않도록)
+"""
+import os
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from services.database import SessionLocal, project_root
+from services.import_readers import SUPPORTED_EXTENSIONS
+from services.job_runs import update_job_progress
+
+load_dotenv()
+
+# 업로드 파일 저장 경로
+IMPORT_UPLOAD_DIR = Path(os.getenv("IMPORT_UPLOAD_DIR", str(project_root / "database" / "uploads")))
+# 업로드 파일 최대 크기 (MB)
+IMPORT_MAX_UPLOAD_MB = int(os.getenv("IMPORT_MAX_UPLOAD_MB", "50"))
+# 한 번에 커밋할 변경 행 수 (작을수록 잠금 유지 시간이 짧아짐)
+IMPORT_COMMIT_BATCH_SIZE = int(os.getenv("IMPORT_COMMIT_BATCH_SIZE", "200"))
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+# Content-Length 검사 시 파일 크기 외에 허용할 multipart 경계/헤더 크기
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# 업로드 API 경로 (/api/console/import/{kind})
+IMPORT_UPLOAD_PATH_PREFIX = "/api/console/import/"
+
+# import 종류 {kind: (작업 ID, 작업 이름)}
+IMPORT_KINDS = {
+    "checklist": ("import_checklist", "체크리스트 데이터 import (업로드)"),
+    "users": ("import_users", "사용자 데이터 import (업로드)"),
+}
+
+# import는 한 번에 하나씩 실행 (같은 테이블을 동시에 변경하지 않도록)
+_import_lock = threading.Lock()
+
+
+class UploadTooLargeError(ValueError):
+    """업로드 파일이 IMPORT_MAX_UPLOAD_MB를 초과한 경우"""
+
+
+def upload_exceeds_limit(content_length: str) -> bool:
+    """요청 Content-Length가 업로드 최대 크기를 넘는지 (본문을 받기 전 검사, 헤더가 없거나 잘못되면 False)"""
+    try:
+        length = int(content_length)
+    except (TypeError, ValueError):
+        return False
+    return length > IMPORT_MAX_UPLOAD_MB * 1024 * 1024 + MULTIPART_OVERHEAD_BYTES
+
+
+def upload_too_large_message() -> str:
+    return f"파일이 너무 큽니다. (최대 {IMPORT_MAX_UPLOAD_MB}MB)"
+
+
+def new_upload_path(filename: str) -> Path:
+    """업로드 파일을 저장할 경로 생성 (확장자 검사)
+
+    Raises:
+        ValueError: 지원하지 않는 확장자
+    """
+    suffix = Path(filename or "").suffix.lower()
+    if suffix not in SUPPORTED_EXTENSIONS:
+        raise ValueError(
+            f"지원하지 않는 파일 형식입니다: {suffix or '(확장자 없음)'} "
+            f"({', '.join(sorted(SUPPORTED_EXTENSIONS))}만 가능)"
+        )
+    IMPORT_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    return IMPORT_UPLOAD_DIR / f"{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:8]}{suffix}"
+
+
+async def save_upload(upload_file, dest: Path) -> int:
+    """UploadFile을 청크 단위로 디스크에 저장하고 저장한 바이트 수 반환
+
+    UploadFile은 multipart 파서가 이미 받아 둔 임시 파일이므로, 여기서의 크기 검사는
+    Content-Length 없이 들어온 요청을 위한 마지막 검사입니다.
+
+    Raises:
+        UploadTooLargeError: IMPORT_MAX_UPLOAD_MB 초과 (저장 중이던 파일은 삭제)
+    """
+    max_bytes = IMPORT_MAX_UPLOAD_MB * 1024 * 1024
+    size = 0
+    try:
+        with open(dest, "wb") as f:
+            while True:
+                chunk = await upload_file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(upload_too_large_message())
+                f.write(chunk)
+    except Exception:
+        dest.unlink(missing_ok=True)
+        raise
+    return size
+
+
+def run_import_job(kind: str, file_path, original_filename: str, run_id: int) -> dict:
+    """업로드한 파일 import (블로킹, 스케줄러 작업 스레드에서 실행)
+
+    처리가 끝나면 업로드 파일을 삭제하고, 실행 이력에 기록할 통계를 반환합니다.
+    """
+    from services.checklist_import import sync_checklist
+    from services.user_import import import_users
+
+    file_path = Path(file_path)
+    details = {"kind": kind, "file_name": original_filename}
+
+    def progress(rows, phase="reading"):
+        update_job_progress(run_id, rows, {**details, "phase": phase})
+
+    with _import_lock:
+        db = SessionLocal()
+        try:
+            if kind == "checklist":
+                result = sync_checklist(
+                    db,
+                    file_path,
+                    batch_size=IMPORT_COMMIT_BATCH_SIZE,
+                    progress=progress,
+                    commit_each_batch=True,
+                )
+                # 오늘 체크 슬롯을 바뀐 체크 항목에 맞춤
+                from services.daily_slots import refresh_slots
+                from services.scheduler import get_korea_today
+
+                refresh_slots(db, get_korea_today())
+                details.update(
+                    items_created=result.items_created,
+                    items_updated=result.items_updated,
+                    items_deleted=result.items_deleted,
+                    items_unchanged=result.items_unchanged,
+                    assignments_created=result.assignments_created,
+                    assignments_deleted=result.assignments_deleted,
+                    assignments_skipped=result.assignments_skipped,
+                    systems_created=result.systems_created,
+                    unknown_users=sorted(result.unknown_users),
+                )
+            elif kind == "users":
+                result = import_users(
+                    db,
+                    file_path,
+                    batch_size=IMPORT_COMMIT_BATCH_SIZE,
+                    commit_each_batch=True,
+                    progress=progress,
+                )
+                details.update(
+                    created=result.created,
+                    updated=result.updated,
+                    unchanged=result.unchanged,
+                    skipped=result.skipped,
+                )
+            else:
+                raise ValueError(f"알 수 없는 import 종류입니다: {kind}")
+        finally:
+            db.close()
+            file_path.unlink(missing_ok=True)
+
+    details["warnings"] = result.warnings[:100]
+    details["elapsed_seconds"] = round(result.elapsed, 3)
+    return {"rows_scanned": result.rows, **details}
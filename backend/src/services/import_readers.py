@@ -0,0 +1,106 @@
+"""import용 파일 리더 (CSV / XLSX)
+
+체크리스트/사용자 import가 같은 방식으로 파일을 읽을 수 있도록
+첫 행을 헤더로 하는 (행 번호, {헤더: 값}) 스트림을 제공합니다.
+
+- CSV: csv.DictReader로 한 행씩 읽습니다. (UTF-8, BOM 허용)
+- XLSX: openpyxl read-only 모드로 한 행씩 읽으므로 큰 파일도 메모리 사용량이 일정하며,
+  CSV로 변환한 중간 파일을 만들지 않습니다.
+- XLS(구 엑셀 형식)는 지원하지 않습니다. 엑셀에서 .xlsx로 다시 저장해 주세요.
+"""
+import csv
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+CSV_EXTENSIONS = {".csv"}
+XLSX_EXTENSIONS = {".xlsx", ".xlsm"}
+SUPPORTED_EXTENSIONS = CSV_EXTENSIONS | XLSX_EXTENSIONS
+
+# 구 엑셀(XLS) 등 OLE 복합 문서 파일 시그니처
+_OLE_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+
+def iter_dict_rows(file_path, sheet_name: Optional[str] = None) -> Iterator[Tuple[int, dict]]:
+    """파일을 한 행씩 읽어 (행 번호, {헤더: 값})로 반환 (확장자로 형식 판단)
+
+    Args:
+        file_path: CSV 또는 XLSX 파일 경로
+        sheet_name: XLSX 시트 이름 (없으면 첫 번째 시트)
+
+    Raises:
+        ValueError: 지원하지 않는 파일 형식
+    """
+    suffix = Path(file_path).suffix.lower()
+    if suffix in CSV_EXTENSIONS:
+        return _iter_csv_rows(file_path)
+    if suffix in XLSX_EXTENSIONS:
+        return _iter_xlsx_rows(file_path, sheet_name)
+    if suffix == ".xls":
+        raise ValueError("XLS(구 엑셀 형식) 파일은 지원하지 않습니다. 엑셀에서 .xlsx 형식으로 다시 저장해 주세요.")
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {suffix or '(확장자 없음)'} (CSV 또는 XLSX만 가능)")
+
+
+def _iter_csv_rows(file_path) -> Iterator[Tuple[int, dict]]:
+    with open(file_path, "r", encoding="utf-8-sig", newline="") as f:
+        for row_number, row in enumerate(csv.DictReader(f), start=2):
+            yield row_number, row
+
+
+def _iter_xlsx_rows(file_path, sheet_name: Optional[str] = None) -> Iterator[Tuple[int, dict]]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError as e:
+        raise ValueError(f"XLSX 파일을 읽으려면 openpyxl이 필요합니다. pip install openpyxl (오류: {e})")
+
+    with open(file_path, "rb") as f:
+        if f.read(len(_OLE_SIGNATURE)) == _OLE_SIGNATURE:
+            # 확장자만 .xlsx이고 실제로는 구 엑셀(XLS) 형식인 경우
+            raise ValueError(
+                "XLS(구 엑셀 형식) 파일입니다. 확장자만 .xlsx로 되어 있습니다. "
+                "엑셀에서 'Excel 통합 문서(.xlsx)' 형식으로 다시 저장해 주세요."
+            )
+
+    try:
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+    except Exception as e:
+        raise ValueError(f"XLSX 파일을 열 수 없습니다: {e}")
+
+    try:
+        if sheet_name:
+            if sheet_name not in workbook.sheetnames:
+                raise ValueError(f"시트를 찾을 수 없습니다: {sheet_name} (시트 목록: {', '.join(workbook.sheetnames)})")
+            sheet = workbook[sheet_name]
+        else:
+            sheet = workbook.worksheets[0]
+
+        headers = None
+        for row_number, values in enumerate(sheet.iter_rows(values_only=True), start=1):
+            if headers is None:
+                # 첫 번째 비어 있지 않은 행을 헤더로 사용
+                if any(value is not None and str(value).strip() for value in values):
+                    headers = [_cell_to_str(value).strip() for value in values]
+                continue
+            if all(value is None or not str(value).strip() for value in values):
+                continue
+            yield row_number, {
+                header: _cell_to_str(value)
+                for header, value in zip(headers, values)
+                if header
+            }
+    finally:
+        # read-only 모드는 파일 핸들을 열어 두므로 명시적으로 닫음
+        workbook.close()
+
+
+def _cell_to_str(value) -> str:
+    """엑셀 셀 값을 CSV와 같은 문자열로 변환 (사원번호 224147.0 → '224147')"""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
@@ -0,0 +1,272 @@
+"""스케줄러 작업 실행 이력 기록
+
+각 작업 실행의 시작/종료 시간, 소요 시간, 처리량(조회 행 수, 수신자 수, 발송 메일 수),
+오류, misfire/coalesce 이벤트를 scheduler_job_runs 테이블에 기록합니다.
+"""
+from datetime import datetime
+from functools import partial
+import asyncio
+import json
+import logging
+import os
+import time
+import traceback
+
+from sqlalchemy import func
+from apscheduler.events import (
+    EVENT_JOB_ADDED,
+    EVENT_JOB_MODIFIED,
+    EVENT_JOB_REMOVED,
+    EVENT_JOB_MISSED,
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_SUBMITTED,
+)
+
+from services.database import SessionLocal
+from services.metrics import observe_job
+from models.models import SchedulerJobRun
+
+logger = logging.getLogger(__name__)
+
+# 작업 1회 실행 시간 예산 (초). 초과하면 over_budget으로 기록하고 경고를 출력합니다.
+JOB_TIME_BUDGET_SECONDS = float(os.getenv("SCHEDULER_JOB_TIME_BUDGET_SECONDS", "300"))
+
+# 통계 필드 (작업 함수가 반환하는 dict의 키)
+STAT_FIELDS = ("rows_scanned", "recipients", "messages_enqueued")
+
+# EVENT_JOB_SUBMITTED에서 계산한 coalesce 횟수 (다음 실행 기록에 반영)
+_pending_coalesced = {}
+
+
+def start_job_run(
+    job_id: str, job_name: str = None, trigger: str = "SCHEDULED", status: str = "RUNNING"
+) -> int:
+    """실행 이력 생성 후 ID 반환 (수동 실행은 status=QUEUED로 먼저 생성)"""
+    db = SessionLocal()
+    try:
+        run = SchedulerJobRun(
+            job_id=job_id,
+            job_name=job_name,
+            trigger=trigger,
+            status=status,
+            started_at=datetime.now(),
+            coalesced_runs=_pending_coalesced.pop(job_id, 0),
+        )
+        db.add(run)
+        db.commit()
+        return run.id
+    finally:
+        db.close()
+
+
+def finish_job_run(run_id: int, status: str, duration: float, stats: dict = None, error: str = None):
+    """실행 이력 종료 처리 (소요 시간, 통계, 오류 기록)"""
+    stats = dict(stats or {})
+    db = SessionLocal()
+    try:
+        run = db.query(SchedulerJobRun).filter(SchedulerJobRun.id == run_id).first()
+        if not run:
+            return
+        run.status = status
+        run.finished_at = datetime.now()
+        run.duration_ms = int(duration * 1000)
+        run.over_budget = duration > JOB_TIME_BUDGET_SECONDS
+        run.error = error or stats.pop("error", None)
+        for field in STAT_FIELDS:
+            setattr(run, field, stats.pop(field, 0) or 0)
+        run.details = json.dumps(stats, ensure_ascii=False, default=str) if stats else None
+        db.commit()
+        observe_job(run.job_id, status, duration, run.messages_enqueued)
+
+        if run.over_budget:
+            logger.warning(
+                "작업 %s(실행 #%d)이 시간 예산을 초과했습니다 (%.1fs > %.0fs)",
+                run.job_id,
+                run_id,
+                duration,
+                JOB_TIME_BUDGET_SECONDS,
+            )
+    finally:
+        db.close()
+
+
+def update_job_progress(run_id: int, rows_scanned: int, details: dict = None):
+    """실행 중인 작업의 진행 상황 기록 (처리한 행 수, 추가 정보)"""
+    db = SessionLocal()
+    try:
+        run = db.query(SchedulerJobRun).filter(SchedulerJobRun.id == run_id).first()
+        if run:
+            run.rows_scanned = rows_scanned
+            if details is not None:
+                run.details = json.dumps(details, ensure_ascii=False, default=str)
+            db.commit()
+    finally:
+        db.close()
+
+
+def run_with_history(job_id: str, job_func, job_name: str = None, trigger: str = "SCHEDULED", run_id: int = None):
+    """작업 함수를 실행하고 실행 이력을 기록 (블로킹, 작업 스레드에서 호출)
+
+    작업 함수는 STAT_FIELDS 키를 가진 dict를 반환할 수 있으며,
+    dict에 'error' 키가 있으면 실패로 기록합니다.
+
+    Args:
+        job_id: 작업 ID
+        job_func: 실행할 함수 (인자 없음)
+        job_name: 작업 이름 (표시용)
+        trigger: 'SCHEDULED' 또는 'MANUAL'
+        run_id: 미리 생성한 실행 이력 ID (없으면 새로 생성)
+    """
+    if run_id is None:
+        run_id = start_job_run(job_id, job_name, trigger)
+    else:
+        _mark_running(run_id)
+
+    started = time.perf_counter()
+    stats, error = {}, None
+    try:
+        stats = job_func() or {}
+    except Exception as e:
+        error = f"{e}\n{traceback.format_exc()}"
+        logger.exception("작업 %s 실행 중 오류 발생: %s", job_id, e, extra={"run_id": run_id})
+    duration = time.perf_counter() - started
+
+    status = "FAILED" if error or stats.get("error") else "SUCCESS"
+    try:
+        finish_job_run(run_id, status, duration, stats, error)
+    except Exception as e:
+        logger.error("실행 이력 기록 실패 (작업 %s): %s", job_id, e, extra={"run_id": run_id})
+    return run_id
+
+
+def _mark_running(run_id: int):
+    db = SessionLocal()
+    try:
+        run = db.query(SchedulerJobRun).filter(SchedulerJobRun.id == run_id).first()
+        if run:
+            run.status = "RUNNING"
+            run.started_at = datetime.now()
+            db.commit()
+    finally:
+        db.close()
+
+
+def _record_event(job_id: str, status: str, detail: dict):
+    db = SessionLocal()
+    try:
+        now = datetime.now()
+        db.add(
+            SchedulerJobRun(
+                job_id=job_id,
+                trigger="SCHEDULED",
+                status=status,
+                started_at=now,
+                finished_at=now,
+                duration_ms=0,
+                details=json.dumps(detail, ensure_ascii=False, default=str),
+            )
+        )
+        db.commit()
+    except Exception as e:
+        logger.error("스케줄러 이벤트 기록 실패 (작업 %s): %s", job_id, e)
+    finally:
+        db.close()
+
+
+def _record_event_in_background(job_id: str, status: str, detail: dict):
+    """이벤트 기록을 스레드 풀에서 실행 (이벤트 루프에서 호출되면 DB 쓰기를 기다리지 않음)"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # 이벤트 루프 밖(스레드 기반 스케줄러 등)에서는 바로 기록
+        _record_event(job_id, status, detail)
+        return
+    loop.run_in_executor(None, partial(_record_event, job_id, status, detail))
+
+
+def count_coalesced_runs(trigger, expected_run_time, run_time) -> int:
+    """expected_run_time부터 run_time 전까지의 트리거 실행 시간 수 (coalesce로 건너뛴 실행 횟수)"""
+    count = 0
+    fire_time = expected_run_time
+    while fire_time is not None and fire_time < run_time:
+        count += 1
+        fire_time = trigger.get_next_fire_time(fire_time, run_time)
+    return count
+
+
+def create_job_event_listener(scheduler):
+    """APScheduler 이벤트 리스너 생성: misfire/coalesce/중복 실행 건너뜀 기록
+
+    APScheduler는 coalesce=True이면 밀린 실행 시간을 마지막 하나로 줄인 뒤, 작업의 다음 실행 시간까지
+    갱신하고 나서 EVENT_JOB_SUBMITTED를 보내므로 이벤트만으로는 합쳐진 횟수를 알 수 없습니다.
+    그래서 작업별 다음 예정 실행 시간을 기억해 두고(등록/변경/제출 시), 실제 실행 시간 전까지
+    트리거 실행 시간이 몇 번 지나갔는지 직접 셉니다.
+
+    AsyncIOScheduler에서는 이벤트 루프에서 호출되므로 DB 기록은 스레드 풀로 넘깁니다.
+    """
+    expected_run_times = {}  # {job_id: 다음 예정 실행 시간}
+
+    def remember_next_run(job_id: str, job):
+        if job is not None and job.next_run_time is not None:
+            expected_run_times[job_id] = job.next_run_time
+        else:
+            expected_run_times.pop(job_id, None)
+
+    def job_event_listener(event):
+        try:
+            if event.code in (EVENT_JOB_ADDED, EVENT_JOB_MODIFIED):
+                remember_next_run(event.job_id, scheduler.get_job(event.job_id, event.jobstore))
+            elif event.code == EVENT_JOB_REMOVED:
+                expected_run_times.pop(event.job_id, None)
+            elif event.code in (EVENT_JOB_SUBMITTED, EVENT_JOB_MAX_INSTANCES):
+                job = scheduler.get_job(event.job_id, event.jobstore)
+                expected = expected_run_times.get(event.job_id)
+                coalesced = (
+                    count_coalesced_runs(job.trigger, expected, event.scheduled_run_times[0])
+                    if job is not None and expected is not None
+                    else 0
+                )
+                remember_next_run(event.job_id, job)
+
+                if event.code == EVENT_JOB_SUBMITTED:
+                    # 밀린 실행이 여러 번이면 coalesce되어 한 번만 실행됨 (다음 실행 이력에 횟수 기록)
+                    if coalesced:
+                        _pending_coalesced[event.job_id] = coalesced
+                        logger.warning("작업 %s의 밀린 실행 %d회가 합쳐졌습니다", event.job_id, coalesced)
+                else:
+                    logger.warning("작업 %s이 이미 실행 중이어서 건너뜁니다", event.job_id)
+                    _record_event_in_background(
+                        event.job_id,
+                        "SKIPPED",
+                        {"scheduled_run_times": event.scheduled_run_times, "coalesced_runs": coalesced},
+                    )
+            elif event.code == EVENT_JOB_MISSED:
+                logger.warning("작업 %s 실행 시간을 놓쳤습니다 (%s)", event.job_id, event.scheduled_run_time)
+                _record_event_in_background(
+                    event.job_id, "MISSED", {"scheduled_run_time": event.scheduled_run_time}
+                )
+        except Exception as e:
+            logger.error("스케줄러 이벤트 기록 실패: %s", e)
+
+    return job_event_listener
+
+
+JOB_EVENT_MASK = (
+    EVENT_JOB_ADDED
+    | EVENT_JOB_MODIFIED
+    | EVENT_JOB_REMOVED
+    | EVENT_JOB_SUBMITTED
+    | EVENT_JOB_MISSED
+    | EVENT_JOB_MAX_INSTANCES
+)
+
+
+def get_last_runs(db) -> dict:
+    """작업별 마지막 실행 이력 {job_id: SchedulerJobRun}"""
+    latest_ids = (
+        db.query(func.max(SchedulerJobRun.id))
+        .filter(SchedulerJobRun.status.notin_(["MISSED", "SKIPPED"]))
+        .group_by(SchedulerJobRun.job_id)
+    )
+    runs = db.query(SchedulerJobRun).filter(SchedulerJobRun.id.in_(latest_ids)).all()
+    return {run.job_id: run for run in runs}
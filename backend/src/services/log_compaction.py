@@ -0,0 +1,181 @@
+"""체크리스트 기록 로그(checklist_records_logs) 압축 및 보관
+
+체크 기록 로그는 제출할 때마다 CREATE/UPDATE 행이 쌓이기만 하므로,
+보관 기간(LOG_COMPACTION_HORIZON_DAYS)이 지난 날짜의 로그를 항목/날짜별 상태 전이 지점만 남기고 정리합니다.
+
+남기는 로그 (항목 1개의 하루 이력 기준):
+- 첫 번째 로그
+- 상태가 바뀐 로그 (첫 FAIL, FAIL → PASS 해결, PASS → FAIL 재발생 등)
+- 마지막 로그 (최종 상태)
+같은 상태가 반복된 중간 로그만 삭제하므로, console fail 항목 계산(첫 FAIL 시간, 해결 여부,
+최신 FAIL 메모)과 최종 상태는 압축 전과 같습니다.
+
+삭제하기 전에 해당 항목/날짜의 원본 로그 전체를 gzip JSON Lines 파일로
+LOG_ARCHIVE_DIR에 보관합니다. (한 줄에 로그 1건)
+"""
+import gzip
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from dotenv import load_dotenv
+from sqlalchemy import distinct
+
+from services.database import SessionLocal, project_root
+from models.models import ChecklistRecordLog
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 이 기간(일)이 지난 날짜의 로그를 압축
+LOG_COMPACTION_HORIZON_DAYS = int(os.getenv("LOG_COMPACTION_HORIZON_DAYS", "30"))
+# 원본 로그 보관 경로
+LOG_ARCHIVE_DIR = Path(
+    os.getenv("LOG_ARCHIVE_DIR", str(project_root / "database" / "archive" / "checklist_records_logs"))
+)
+
+LOG_FIELDS = ("id", "user_id", "check_item_id", "check_date", "status", "notes", "action", "created_at")
+
+
+def select_transition_points(history: list) -> list:
+    """항목 1개의 하루 로그(시간순)에서 남길 로그 선택
+
+    Args:
+        history: 시간순으로 정렬된 로그 목록 (status 속성 필요)
+
+    Returns:
+        list: 남길 로그 목록 (첫 로그, 상태가 바뀐 로그, 마지막 로그)
+    """
+    keep = []
+    previous_status = None
+    for index, log in enumerate(history):
+        if index == 0 or log.status != previous_status or index == len(history) - 1:
+            keep.append(log)
+        previous_status = log.status
+    return keep
+
+
+def compact_record_logs(horizon_days: int = None, today=None, dry_run: bool = False) -> dict:
+    """보관 기간이 지난 체크 기록 로그 압축 (블로킹, 스케줄러 작업 스레드에서 실행)
+
+    날짜 하나씩 처리하며, 날짜별로 원본 보관 파일 기록 → 로그 삭제 커밋 순서로 진행합니다.
+    이미 압축된 날짜는 삭제할 로그가 없으므로 다시 실행해도 변경되지 않습니다.
+
+    Args:
+        horizon_days: 보관 기간 (기본값: LOG_COMPACTION_HORIZON_DAYS)
+        today: 기준 날짜 (기본값: 오늘, 한국 시간)
+        dry_run: True이면 삭제/보관하지 않고 집계만
+
+    Returns:
+        dict: 실행 이력에 기록할 통계
+    """
+    from services.scheduler import get_korea_today
+
+    horizon_days = LOG_COMPACTION_HORIZON_DAYS if horizon_days is None else horizon_days
+    today = today or get_korea_today()
+    cutoff = today - timedelta(days=horizon_days)
+
+    stats = {
+        "rows_scanned": 0,
+        "cutoff_date": cutoff.isoformat(),
+        "dates_compacted": 0,
+        "groups_compacted": 0,
+        "rows_archived": 0,
+        "rows_deleted": 0,
+        "archive_files": [],
+        "archive_bytes": 0,
+        "dry_run": dry_run,
+    }
+
+    db = SessionLocal()
+    try:
+        dates = [
+            row[0]
+            for row in db.query(distinct(ChecklistRecordLog.check_date))
+            .filter(ChecklistRecordLog.check_date < cutoff)
+            .order_by(ChecklistRecordLog.check_date)
+        ]
+
+        for check_date in dates:
+            logs = (
+                db.query(ChecklistRecordLog)
+                .filter(ChecklistRecordLog.check_date == check_date)
+                .order_by(ChecklistRecordLog.check_item_id, ChecklistRecordLog.created_at, ChecklistRecordLog.id)
+                .all()
+            )
+            stats["rows_scanned"] += len(logs)
+
+            histories = {}  # {check_item_id: [로그, ...]}
+            for log in logs:
+                histories.setdefault(log.check_item_id, []).append(log)
+
+            archived, removed_ids = [], []
+            for history in histories.values():
+                keep_ids = {log.id for log in select_transition_points(history)}
+                if len(keep_ids) == len(history):
+                    continue
+                stats["groups_compacted"] += 1
+                archived.extend(history)
+                removed_ids.extend(log.id for log in history if log.id not in keep_ids)
+
+            if not removed_ids:
+                continue
+
+            stats["dates_compacted"] += 1
+            stats["rows_archived"] += len(archived)
+            stats["rows_deleted"] += len(removed_ids)
+            if dry_run:
+                continue
+
+            archive_path = LOG_ARCHIVE_DIR / f"{check_date.isoformat()}_{datetime.now():%Y%m%d%H%M%S}.jsonl.gz"
+            temp_path = _write_archive(archive_path, archived)
+            try:
+                for start in range(0, len(removed_ids), 500):
+                    db.query(ChecklistRecordLog).filter(
+                        ChecklistRecordLog.id.in_(removed_ids[start : start + 500])
+                    ).delete(synchronize_session=False)
+                db.commit()
+            except Exception:
+                db.rollback()
+                temp_path.unlink(missing_ok=True)
+                raise
+            # 삭제가 커밋된 뒤에 보관 파일 확정
+            temp_path.replace(archive_path)
+            stats["archive_files"].append(archive_path.name)
+            stats["archive_bytes"] += archive_path.stat().st_size
+            db.expunge_all()
+    finally:
+        db.close()
+
+    logger.info(
+        "로그 압축 기준일 %s 이전: %d일, 항목 %d건, 로그 %d건 삭제 (원본 %d건 보관)%s",
+        cutoff,
+        stats["dates_compacted"],
+        stats["groups_compacted"],
+        stats["rows_deleted"],
+        stats["rows_archived"],
+        " [dry-run]" if dry_run else "",
+    )
+    return stats
+
+
+def _write_archive(archive_path: Path, logs: list) -> Path:
+    """원본 로그를 임시 gzip JSON Lines 파일로 기록하고 임시 파일 경로 반환"""
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = archive_path.with_name(archive_path.name + ".tmp")
+    with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+        for log in logs:
+            record = {name: getattr(log, name) for name in LOG_FIELDS}
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+    with open(temp_path, "rb") as f:
+        os.fsync(f.fileno())
+    return temp_path
+
+
+def read_archive(archive_path) -> list:
+    """보관 파일의 원본 로그 목록 읽기 (분석/복구용)"""
+    with gzip.open(archive_path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
@@ -0,0 +1,149 @@
+"""로깅 설정 (구조화 로그, 비동기 큐 출력, 요청 ID)
+
+로그 호출은 레코드를 큐에 넣기만 하고(QueueHandler), 출력(stdout 쓰기)은 별도 스레드(QueueListener)가 처리하므로
+요청 처리 중 로그를 남겨도 stdout 쓰기를 기다리지 않습니다.
+
+환경 변수
+- LOG_LEVEL: 기본 로그 레벨 (기본값 INFO)
+- LOG_LEVELS: 모듈별 로그 레벨 (예: "services.scheduler=DEBUG,main=WARNING")
+- LOG_FORMAT: json(기본값, 한 줄에 JSON 하나) 또는 text
+
+HTTP 요청 중 남긴 로그에는 request_id가 포함됩니다.
+(요청의 X-Request-ID 헤더 값, 없으면 새로 생성하여 응답 X-Request-ID 헤더로 반환)
+logger.info("...", extra={"run_id": 3})처럼 넘긴 값은 JSON 로그의 필드로 출력됩니다.
+"""
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import uuid
+from contextvars import ContextVar
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# 라이브러리 기본 로그 레벨 (LOG_LEVELS로 변경 가능)
+DEFAULT_LOG_LEVELS = {"apscheduler": "WARNING"}
+
+# 현재 요청 ID (요청 밖에서는 None)
+_request_id = ContextVar("request_id", default=None)
+
+# LogRecord 기본 속성 (이 외의 속성은 extra로 넘긴 값)
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+
+_listener = None
+
+
+def start_request_id(incoming: str = None):
+    """요청 ID 설정, (reset_request_id()에 넘길 토큰, 요청 ID) 반환"""
+    request_id = (incoming or "").strip()[:64] or uuid.uuid4().hex[:16]
+    return _request_id.set(request_id), request_id
+
+
+def reset_request_id(token):
+    _request_id.reset(token)
+
+
+class RequestIdFilter(logging.Filter):
+    """로그 레코드에 현재 요청 ID 추가 (로그를 남긴 스레드에서 실행되어야 하므로 QueueHandler에 등록)"""
+
+    def filter(self, record):
+        record.request_id = _request_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            entry["request_id"] = record.request_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s%(request)s: %(message)s", "%Y-%m-%d %H:%M:%S")
+
+    def format(self, record):
+        request_id = getattr(record, "request_id", None)
+        record.request = f" [{request_id}]" if request_id else ""
+        return super().format(record)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record):
+        # 메시지와 예외 정보는 로그를 남긴 스레드에서 문자열로 만들어 두고, 출력 포맷(JSON 등)은 출력 스레드에서 처리
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+def _parse_levels(value: str) -> dict:
+    levels = {}
+    for item in value.split(","):
+        name, _, level = item.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging(log_format: str = None):
+    """루트 로거에 큐 핸들러 등록 및 출력 스레드 시작 (여러 번 호출해도 한 번만 설정)
+
+    Args:
+        log_format: json 또는 text (없으면 LOG_FORMAT, 유틸리티 스크립트는 text 사용)
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(TextFormatter() if (log_format or LOG_FORMAT) == "text" else JsonFormatter())
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = _QueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+
+    root = logging.getLogger()
+    root.addHandler(queue_handler)
+    root.setLevel(LOG_LEVEL)
+    for name, level in {**DEFAULT_LOG_LEVELS, **_parse_levels(LOG_LEVELS)}.items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """큐에 남은 로그를 모두 출력하고 출력 스레드 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,154 @@
+"""Prometheus 메트릭 (/metrics)
+
+요청 지연 시간, 처리 중인 요청 수, DB 연결 풀/쿼리 시간, 스케줄러 작업 시간,
+메일 발송 시간, 엑셀 다운로드 크기/시간을 수집합니다.
+체크리스트 제출(POST /api/checklist/submit)과 console API의 SLO는
+http_request_duration_seconds의 route 라벨로 확인합니다.
+
+prometheus_client가 필요합니다. (pip install prometheus_client)
+설치되지 않은 경우 수집 함수는 아무것도 하지 않고, /metrics는 503을 반환합니다.
+메트릭은 프로세스별로 수집되므로 uvicorn 작업 프로세스를 여러 개 띄우는 경우 프로세스마다 따로 조회됩니다.
+"""
+import time
+from contextlib import contextmanager
+
+from services.database import engine
+
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+except ImportError:  # pragma: no cover - prometheus_client 미설치 환경
+    CONTENT_TYPE_LATEST = "text/plain"
+    generate_latest = None
+
+# 라우트와 매칭되지 않은 요청(404 등)의 route 라벨 (경로별 라벨이 무한히 늘어나지 않도록)
+UNMATCHED_ROUTE = "unmatched"
+
+# 쿼리 종류 라벨 (그 외는 OTHER)
+QUERY_OPERATIONS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+METRICS_AVAILABLE = generate_latest is not None
+
+if METRICS_AVAILABLE:
+    HTTP_REQUEST_SECONDS = Histogram(
+        "http_request_duration_seconds",
+        "HTTP 요청 처리 시간",
+        ["method", "route", "status"],
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+    )
+    HTTP_REQUESTS_IN_PROGRESS = Gauge(
+        "http_requests_in_progress", "처리 중인 HTTP 요청 수", ["method"]
+    )
+    DB_QUERY_SECONDS = Histogram(
+        "db_query_duration_seconds",
+        "SQL 쿼리 실행 시간",
+        ["operation"],
+        buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+    )
+    DB_POOL_SIZE = Gauge("db_pool_size", "DB 연결 풀 크기")
+    DB_POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "사용 중인 DB 연결 수")
+    DB_POOL_OVERFLOW = Gauge("db_pool_overflow", "풀 크기를 넘어 추가로 연 DB 연결 수")
+    SCHEDULER_JOB_SECONDS = Histogram(
+        "scheduler_job_duration_seconds",
+        "스케줄러 작업 실행 시간",
+        ["job_id", "status"],
+        buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600, 1800),
+    )
+    SCHEDULER_JOB_MESSAGES = Counter(
+        "scheduler_job_messages_total", "스케줄러 작업이 발송한 메일 수", ["job_id"]
+    )
+    EMAIL_SEND_SECONDS = Histogram(
+        "email_send_duration_seconds",
+        "SMTP 메일 발송 시간 (연결~발송 완료)",
+        ["result"],
+        buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+    )
+    EMAIL_SEND_IN_PROGRESS = Gauge("email_send_in_progress", "SMTP 서버로 발송 중인 메일 수")
+    EXPORT_SECONDS = Histogram(
+        "export_duration_seconds",
+        "다운로드 파일 생성 시간",
+        ["kind"],
+        buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+    )
+    EXPORT_BYTES = Histogram(
+        "export_size_bytes",
+        "다운로드 파일 크기",
+        ["kind"],
+        buckets=(10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000, 10_000_000, 50_000_000),
+    )
+
+    def _pool_value(name: str) -> float:
+        # StaticPool/NullPool 등 크기 정보가 없는 풀은 0
+        method = getattr(engine.pool, name, None)
+        return method() if callable(method) else 0
+
+    DB_POOL_SIZE.set_function(lambda: _pool_value("size"))
+    DB_POOL_CHECKED_OUT.set_function(lambda: _pool_value("checkedout"))
+    DB_POOL_OVERFLOW.set_function(lambda: max(_pool_value("overflow"), 0))
+
+
+def route_label(request) -> str:
+    """요청이 매칭된 라우트 경로 (예: /api/console/import/{kind})"""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+@contextmanager
+def track_in_progress(method: str):
+    if not METRICS_AVAILABLE:
+        yield
+        return
+    gauge = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+    gauge.inc()
+    try:
+        yield
+    finally:
+        gauge.dec()
+
+
+def observe_request(method: str, route: str, status_code: int, seconds: float):
+    if METRICS_AVAILABLE:
+        HTTP_REQUEST_SECONDS.labels(method, route, str(status_code)).observe(seconds)
+
+
+def observe_query(statement: str, seconds: float):
+    if METRICS_AVAILABLE:
+        operation = statement.lstrip()[:6].upper()
+        if operation not in QUERY_OPERATIONS:
+            operation = "OTHER"
+        DB_QUERY_SECONDS.labels(operation).observe(seconds)
+
+
+def observe_job(job_id: str, status: str, seconds: float, messages: int = 0):
+    if METRICS_AVAILABLE:
+        SCHEDULER_JOB_SECONDS.labels(job_id, status).observe(seconds)
+        if messages:
+            SCHEDULER_JOB_MESSAGES.labels(job_id).inc(messages)
+
+
+@contextmanager
+def track_email_send():
+    """메일 발송 시간 측정, yield한 dict의 'success'를 True로 바꾸면 성공으로 기록"""
+    if not METRICS_AVAILABLE:
+        yield {}
+        return
+    result = {"success": False}
+    EMAIL_SEND_IN_PROGRESS.inc()
+    started = time.perf_counter()
+    try:
+        yield result
+    finally:
+        EMAIL_SEND_IN_PROGRESS.dec()
+        EMAIL_SEND_SECONDS.labels("success" if result["success"] else "failure").observe(
+            time.perf_counter() - started
+        )
+
+
+def observe_export(kind: str, seconds: float, size_bytes: int):
+    if METRICS_AVAILABLE:
+        EXPORT_SECONDS.labels(kind).observe(seconds)
+        EXPORT_BYTES.labels(kind).observe(size_bytes)
+
+
+def render_metrics() -> bytes:
+    """Prometheus 텍스트 형식 메트릭"""
+    return generate_latest()
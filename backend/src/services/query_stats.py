@@ -0,0 +1,127 @@
+"""요청별 SQL 쿼리 수/DB 시간 측정 및 N+1 쿼리 감지
+
+SQLAlchemy 엔진 이벤트(before/after_cursor_execute)로 요청 하나에서 실행된 쿼리 수와 DB 시간을 합산하고,
+응답 헤더로 반환합니다.
+- X-Query-Count: 실행한 쿼리 수
+- Server-Timing: db;dur=<DB 시간 ms>;desc="<쿼리 수> queries" (브라우저 개발자 도구 Timing 탭에 표시)
+
+같은 형태의 쿼리(파라미터 값만 다른 쿼리)가 한 요청에서 QUERY_REPEAT_WARN_THRESHOLD회를 넘게 실행되면
+N+1 패턴으로 보고 경고를 출력합니다. (0이면 경고하지 않음)
+요청 밖(스케줄러 작업, 유틸리티 스크립트)에서 실행된 쿼리는 헤더/경고에는 집계하지 않고
+쿼리 시간 메트릭(db_query_duration_seconds)에만 기록합니다.
+느린 쿼리는 요청 여부와 관계없이 services.slow_queries에 실행 계획과 함께 기록합니다.
+"""
+import logging
+import os
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from dotenv import load_dotenv
+from sqlalchemy import event
+
+from services.metrics import observe_query
+from services.slow_queries import is_slow, record_slow_query
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 같은 형태의 쿼리가 한 요청에서 이 횟수를 넘게 실행되면 경고 (0이면 경고하지 않음)
+QUERY_REPEAT_WARN_THRESHOLD = int(os.getenv("QUERY_REPEAT_WARN_THRESHOLD", "10"))
+
+# 현재 요청의 집계 (요청 밖에서는 None)
+_current_stats = ContextVar("query_stats", default=None)
+
+# IN (?, ?, ?) 처럼 개수만 다른 파라미터 목록, 숫자/문자열 리터럴은 같은 형태로 취급
+_IN_LIST = re.compile(r"\((?:\s*(?:\?|%\([^)]*\)s|:\w+|%s)\s*,)+\s*(?:\?|%\([^)]*\)s|:\w+|%s)\s*\)")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryStats:
+    """요청 하나의 쿼리 집계"""
+
+    def __init__(self, route: str = None):
+        self.route = route
+        self.count = 0
+        self.db_seconds = 0.0
+        self.shapes = Counter()
+
+    def repeated_shapes(self, threshold: int) -> list:
+        """threshold회를 넘게 실행된 쿼리 형태 [(형태, 횟수), ...] (많은 순)"""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count > threshold]
+
+
+def statement_shape(statement: str) -> str:
+    """파라미터 값/개수와 공백을 제외한 쿼리 형태"""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _LITERAL.sub("?", shape)
+    return _IN_LIST.sub("(?)", shape)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("query_started")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    observe_query(statement, elapsed)
+
+    stats = _current_stats.get()
+    if is_slow(elapsed):
+        record_slow_query(conn, statement, parameters, executemany, elapsed, stats.route if stats else None)
+    if stats is None:
+        return
+    stats.db_seconds += elapsed
+    stats.count += 1
+    stats.shapes[statement_shape(statement)] += 1
+
+
+def instrument_engine(engine):
+    """엔진에 쿼리 측정 이벤트 등록 (여러 번 호출해도 한 번만 등록)"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def start_request(route: str = None):
+    """요청 집계 시작, reset_request()에 넘길 토큰과 집계 객체 반환
+
+    동기 엔드포인트/의존성은 스레드풀에서 실행되지만 컨텍스트가 복사되므로 같은 집계 객체에 누적됩니다.
+    """
+    stats = QueryStats(route)
+    return _current_stats.set(stats), stats
+
+
+def reset_request(token):
+    _current_stats.reset(token)
+
+
+def apply_headers(response, stats: QueryStats):
+    """응답에 X-Query-Count, Server-Timing 헤더 추가"""
+    db_ms = stats.db_seconds * 1000
+    response.headers["X-Query-Count"] = str(stats.count)
+    server_timing = f'db;dur={db_ms:.1f};desc="{stats.count} queries"'
+    if "Server-Timing" in response.headers:
+        server_timing = f"{response.headers['Server-Timing']}, {server_timing}"
+    response.headers["Server-Timing"] = server_timing
+
+
+def warn_repeated_queries(method: str, path: str, stats: QueryStats):
+    """같은 형태의 쿼리가 QUERY_REPEAT_WARN_THRESHOLD회를 넘게 실행되었으면 경고 출력"""
+    if QUERY_REPEAT_WARN_THRESHOLD <= 0:
+        return
+    for shape, count in stats.repeated_shapes(QUERY_REPEAT_WARN_THRESHOLD):
+        logger.warning(
+            "%s %s: 같은 형태의 쿼리 %d회 반복 (전체 %d회, N+1 의심) - %s",
+            method,
+            path,
+            count,
+            stats.count,
+            shape[:200],
+        )
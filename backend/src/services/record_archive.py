@@ -0,0 +1,255 @@
+"""체크리스트 기록(checklist_records) 월별 보관 (Parquet)
+
+운영 테이블에는 최근 RECORD_ARCHIVE_RETENTION_MONTHS개월의 기록만 두고,
+그 이전의 마감된 달은 월별 Parquet 파일(zstd 압축)로 RECORD_ARCHIVE_DIR에 옮깁니다.
+
+- 보관: archive_closed_months() (스케줄러가 매일 RECORD_ARCHIVE_TIME에 실행)
+  달 단위로 파일 기록 → 기록 행 수 확인 → 운영 테이블에서 삭제 커밋 순서로 진행합니다.
+  이미 보관된 달에 기록이 추가되면 기존 파일과 합쳐 다시 기록합니다.
+- 조회: load_records(db, start_date, end_date)
+  운영 테이블과 보관 파일을 함께 읽어 ChecklistRecord와 같은 속성을 가진 목록을 반환하므로,
+  엑셀 다운로드 등 보고서 API는 보관 여부와 관계없이 같은 코드로 처리합니다.
+
+pyarrow가 필요합니다. (pip install pyarrow)
+설치되어 있지 않으면 보관 작업은 건너뛰고, 보관 파일이 없는 한 조회도 운영 테이블만으로 동작합니다.
+"""
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session
+
+from services.database import SessionLocal, project_root
+from models.models import ChecklistRecord
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow 미설치 환경
+    pa = None
+    pq = None
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 운영 테이블에 남길 기간 (개월, 이번 달 제외)
+RECORD_ARCHIVE_RETENTION_MONTHS = int(os.getenv("RECORD_ARCHIVE_RETENTION_MONTHS", "12"))
+# 월별 보관 파일 경로
+RECORD_ARCHIVE_DIR = Path(
+    os.getenv("RECORD_ARCHIVE_DIR", str(project_root / "database" / "archive" / "checklist_records"))
+)
+
+RECORD_FIELDS = ("id", "user_id", "check_item_id", "check_date", "status", "notes", "checked_at")
+
+# 기록 식별 키 (보관 후 삭제된 ID는 SQLite에서 재사용될 수 있으므로 ID만으로 비교하지 않음)
+RECORD_KEY_FIELDS = ("id", "check_item_id", "check_date", "checked_at")
+
+
+@dataclass
+class ArchivedRecord:
+    """보관 파일에서 읽은 체크리스트 기록 (ChecklistRecord와 같은 속성)"""
+
+    id: int
+    user_id: int
+    check_item_id: int
+    check_date: date
+    status: str
+    notes: Optional[str]
+    checked_at: Optional[datetime]
+
+
+def _schema():
+    return pa.schema(
+        [
+            ("id", pa.int64()),
+            ("user_id", pa.int64()),
+            ("check_item_id", pa.int64()),
+            ("check_date", pa.date32()),
+            ("status", pa.string()),
+            ("notes", pa.string()),
+            ("checked_at", pa.timestamp("us")),
+        ]
+    )
+
+
+def _month_start(value: date, months_back: int = 0) -> date:
+    month_index = value.year * 12 + (value.month - 1) - months_back
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _archive_path(month: date) -> Path:
+    return RECORD_ARCHIVE_DIR / f"{month:%Y-%m}.parquet"
+
+
+def archived_months() -> List[date]:
+    """보관 파일이 있는 달 목록 (각 달의 1일)"""
+    if not RECORD_ARCHIVE_DIR.exists():
+        return []
+    months = []
+    for path in RECORD_ARCHIVE_DIR.glob("*.parquet"):
+        try:
+            months.append(datetime.strptime(path.stem, "%Y-%m").date())
+        except ValueError:
+            continue
+    return sorted(months)
+
+
+def _to_naive(value):
+    # 보관 파일은 timezone 없는 시각으로 저장 (SQLite와 같은 형태)
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.replace(tzinfo=None)
+    return value
+
+
+def _record_key(record) -> tuple:
+    return tuple(
+        _to_naive(getattr(record, name)) if name == "checked_at" else getattr(record, name)
+        for name in RECORD_KEY_FIELDS
+    )
+
+
+def _records_to_table(records: list):
+    columns = {name: [] for name in RECORD_FIELDS}
+    for record in records:
+        for name in RECORD_FIELDS:
+            value = getattr(record, name)
+            columns[name].append(_to_naive(value) if name == "checked_at" else value)
+    return pa.table(columns, schema=_schema())
+
+
+def _write_month(month: date, records: list) -> int:
+    """달 하나의 기록을 보관 파일에 기록 (기존 파일이 있으면 합침), 파일의 전체 행 수 반환
+
+    이전 실행이 파일 기록 후 삭제 커밋 전에 중단된 경우 같은 기록이 다시 들어오므로,
+    기존 파일에서 같은 기록(RECORD_KEY_FIELDS)은 제외하고 합칩니다.
+    """
+    path = _archive_path(month)
+    table = _records_to_table(records)
+    if path.exists():
+        existing = pq.read_table(path, schema=_schema())
+        new_keys = {_record_key(record) for record in records}
+        keep = [
+            tuple(row[name] for name in RECORD_KEY_FIELDS) not in new_keys
+            for row in existing.select(list(RECORD_KEY_FIELDS)).to_pylist()
+        ]
+        table = pa.concat_tables([existing.filter(pa.array(keep, type=pa.bool_())), table])
+    table = table.sort_by([("check_date", "ascending"), ("id", "ascending")])
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    pq.write_table(table, temp_path, compression="zstd")
+    written = pq.ParquetFile(temp_path).metadata.num_rows
+    if written != table.num_rows:
+        temp_path.unlink(missing_ok=True)
+        raise RuntimeError(f"보관 파일 행 수가 맞지 않습니다: {written} != {table.num_rows}")
+    temp_path.replace(path)
+    return written
+
+
+def archive_closed_months(retention_months: int = None, today: date = None) -> dict:
+    """보관 기간이 지난 달의 기록을 Parquet 파일로 옮김 (블로킹, 스케줄러 작업 스레드에서 실행)
+
+    Args:
+        retention_months: 운영 테이블에 남길 기간 (기본값: RECORD_ARCHIVE_RETENTION_MONTHS)
+        today: 기준 날짜 (기본값: 오늘, 한국 시간)
+
+    Returns:
+        dict: 실행 이력에 기록할 통계
+    """
+    from services.scheduler import get_korea_today
+
+    if pa is None:
+        logger.warning("기록 보관: pyarrow가 설치되지 않아 건너뜁니다. (pip install pyarrow)")
+        return {"error": "pyarrow가 설치되지 않았습니다."}
+
+    retention_months = RECORD_ARCHIVE_RETENTION_MONTHS if retention_months is None else retention_months
+    today = today or get_korea_today()
+    cutoff = _month_start(today, retention_months)
+
+    stats = {"rows_scanned": 0, "cutoff_date": cutoff.isoformat(), "months": [], "rows_archived": 0, "archive_bytes": 0}
+
+    db = SessionLocal()
+    try:
+        oldest = db.query(func.min(ChecklistRecord.check_date)).scalar()
+        if isinstance(oldest, str):
+            oldest = date.fromisoformat(oldest)
+        month = _month_start(oldest) if oldest else cutoff
+        while month < cutoff:
+            next_month = _month_start(month, -1)
+            records = (
+                db.query(ChecklistRecord)
+                .filter(and_(ChecklistRecord.check_date >= month, ChecklistRecord.check_date < next_month))
+                .order_by(ChecklistRecord.id)
+                .all()
+            )
+            stats["rows_scanned"] += len(records)
+            if records:
+                _write_month(month, records)
+                record_ids = [record.id for record in records]
+                try:
+                    for start in range(0, len(record_ids), 500):
+                        db.query(ChecklistRecord).filter(
+                            ChecklistRecord.id.in_(record_ids[start : start + 500])
+                        ).delete(synchronize_session=False)
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    raise
+                db.expunge_all()
+                stats["months"].append(f"{month:%Y-%m}")
+                stats["rows_archived"] += len(records)
+                stats["archive_bytes"] += _archive_path(month).stat().st_size
+            month = next_month
+    finally:
+        db.close()
+
+    logger.info("기록 보관 기준 %s 이전: %d개월, 기록 %d건 보관", cutoff, len(stats["months"]), stats["rows_archived"])
+    return stats
+
+
+def read_archived_records(start_date: date, end_date: date) -> List[ArchivedRecord]:
+    """보관 파일에서 날짜 범위의 기록 조회"""
+    months = [
+        month
+        for month in archived_months()
+        if _month_start(start_date) <= month <= _month_start(end_date)
+    ]
+    if not months:
+        return []
+    if pa is None:
+        raise RuntimeError("보관된 기록을 읽으려면 pyarrow가 필요합니다. (pip install pyarrow)")
+
+    records = []
+    for month in months:
+        table = pq.read_table(
+            _archive_path(month),
+            filters=[("check_date", ">=", start_date), ("check_date", "<=", end_date)],
+        )
+        for row in table.to_pylist():
+            records.append(ArchivedRecord(**{name: row[name] for name in RECORD_FIELDS}))
+    return records
+
+
+def load_records(db: Session, start_date: date, end_date: date) -> list:
+    """날짜 범위의 체크리스트 기록 조회 (운영 테이블 + 보관 파일)
+
+    같은 기록이 양쪽에 있으면(보관 파일 기록 후 삭제 전에 중단된 경우) 운영 테이블의 기록을 사용합니다.
+    """
+    live = (
+        db.query(ChecklistRecord)
+        .filter(and_(ChecklistRecord.check_date >= start_date, ChecklistRecord.check_date <= end_date))
+        .all()
+    )
+    live_keys = {_record_key(record) for record in live}
+    archived = [
+        record
+        for record in read_archived_records(start_date, end_date)
+        if _record_key(record) not in live_keys
+    ]
+    return live + archived
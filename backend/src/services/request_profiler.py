@@ -0,0 +1,125 @@
+"""요청 단위 샘플링 프로파일러 (console 사용자 전용)
+
+운영 환경에서만 느린 요청(특정 기간의 엑셀 다운로드, 특정 사용자의 제출 등)을 재배포 없이 분석하기 위해,
+console 권한 사용자가 요청에 X-Profile: 1 헤더 또는 ?profile=1 쿼리를 붙이면 그 요청 하나만 프로파일링합니다.
+
+요청을 처리하는 스레드의 호출 스택을 REQUEST_PROFILE_INTERVAL_MS마다 수집하여
+folded stack 형식(함수;함수;... 샘플 수) 파일로 REQUEST_PROFILE_DIR에 저장하고,
+응답의 X-Profile 헤더로 파일 이름을 알려 줍니다.
+파일은 GET /api/console/profiles/{이름}으로 내려받아 https://www.speedscope.app 또는 flamegraph.pl로 확인합니다.
+
+같은 이벤트 루프에서 동시에 처리된 다른 요청의 스택도 함께 수집될 수 있습니다.
+"""
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from services.database import project_root
+
+load_dotenv()
+
+# 프로파일 파일 경로
+REQUEST_PROFILE_DIR = Path(os.getenv("REQUEST_PROFILE_DIR", str(project_root / "database" / "profiles")))
+# 스택 수집 간격 (ms)
+REQUEST_PROFILE_INTERVAL_MS = float(os.getenv("REQUEST_PROFILE_INTERVAL_MS", "5"))
+# 보관할 프로파일 파일 수 (오래된 파일부터 삭제)
+REQUEST_PROFILE_KEEP = int(os.getenv("REQUEST_PROFILE_KEEP", "50"))
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_SUFFIX = ".folded"
+
+_SRC_DIR = str(Path(__file__).parent.parent)
+_UNSAFE_NAME = re.compile(r"[^0-9A-Za-z_-]+")
+
+
+def profile_requested(request) -> bool:
+    """X-Profile 헤더 또는 profile 쿼리 파라미터로 프로파일링을 요청했는지 확인"""
+    value = request.headers.get(PROFILE_HEADER) or request.query_params.get("profile")
+    return (value or "").lower() in ("1", "true", "yes")
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    if filename.startswith(_SRC_DIR):
+        filename = filename[len(_SRC_DIR) + 1:]
+    elif "site-packages" in filename:
+        filename = filename.split("site-packages", 1)[1].lstrip("/\\")
+    else:
+        filename = os.path.basename(filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """대상 스레드의 호출 스택을 주기적으로 수집 (별도 스레드에서 실행)"""
+
+    def __init__(self, thread_id: int = None, interval: float = None):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = (interval or REQUEST_PROFILE_INTERVAL_MS) / 1000
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def folded(self) -> str:
+        """folded stack 형식 (많이 수집된 스택 순)"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def save_profile(profiler: SamplingProfiler, method: str, path: str, employee_id: str) -> Path:
+    """프로파일 파일 저장 후 오래된 파일 정리, 저장한 파일 경로 반환"""
+    REQUEST_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    slug = _UNSAFE_NAME.sub("_", path).strip("_")[:60] or "root"
+    name = f"{datetime.now():%Y%m%d_%H%M%S_%f}_{method}_{slug}_{_UNSAFE_NAME.sub('_', employee_id)}{PROFILE_SUFFIX}"
+    profile_path = REQUEST_PROFILE_DIR / name
+    profile_path.write_text(profiler.folded(), encoding="utf-8")
+
+    profiles = list_profiles()
+    for old in profiles[: max(len(profiles) - max(REQUEST_PROFILE_KEEP, 1), 0)]:
+        old.unlink(missing_ok=True)
+    return profile_path
+
+
+def list_profiles() -> list:
+    """프로파일 파일 목록 (오래된 순)"""
+    if not REQUEST_PROFILE_DIR.exists():
+        return []
+    return sorted(path for path in REQUEST_PROFILE_DIR.iterdir() if path.suffix == PROFILE_SUFFIX)
+
+
+def resolve_profile(name: str) -> Path:
+    """프로파일 파일 이름을 경로로 변환 (디렉터리 밖 경로는 허용하지 않음)
+
+    Raises:
+        FileNotFoundError: 파일이 없는 경우
+    """
+    path = REQUEST_PROFILE_DIR / Path(name).name
+    if path.suffix != PROFILE_SUFFIX or not path.is_file():
+        raise FileNotFoundError(f"프로파일 파일을 찾을 수 없습니다: {name}")
+    return path
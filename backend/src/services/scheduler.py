@@ -1,8 +1,13 @@
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
 from sqlalchemy.orm import Session
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from functools import partial
+import asyncio
+import logging
 import pytz
 import smtplib
 from email.mime.text import MIMEText
@@ -12,11 +17,44 @@ import os
 from dotenv import load_dotenv
 
 from services.database import SessionLocal
-from models.models import User, CheckItem, ChecklistRecord, UserSystemAssignment, System
+from services.metrics import track_email_send
+from services.job_runs import (
+    run_with_history,
+    start_job_run,
+    update_job_progress,
+    create_job_event_listener,
+    JOB_EVENT_MASK,
+)
+from services.log_compaction import compact_record_logs
+from services.record_archive import archive_closed_months
+from services.day_close import close_pending_days
+from services.db_maintenance import run_db_maintenance
+from services.db_snapshot import snapshot_job
+from services.daily_slots import instantiate_daily_slots, unchecked_items as find_unchecked_items
+from models.models import User, UserSystemAssignment, System
 
 load_dotenv()
 
-scheduler = BackgroundScheduler()
+logger = logging.getLogger(__name__)
+
+# 스케줄러 작업(DB 조회, SMTP 발송)을 실행할 스레드 수
+# 앱의 요청 처리와 DB 커넥션/CPU를 나눠 쓰므로 작게 유지합니다.
+SCHEDULER_MAX_WORKERS = int(os.getenv("SCHEDULER_MAX_WORKERS", "2"))
+# 앱 종료 시 실행 중인 작업을 기다리는 최대 시간 (초)
+SCHEDULER_SHUTDOWN_TIMEOUT = float(os.getenv("SCHEDULER_SHUTDOWN_TIMEOUT", "30"))
+
+# 앱(uvicorn)의 이벤트 루프에서 동작하는 스케줄러
+# - 작업은 코루틴으로 등록되어 이벤트 루프에서 실행되고,
+#   블로킹 작업(DB, SMTP)은 run_blocking()을 통해 크기가 정해진 스레드 풀에서 실행됩니다.
+# - 같은 작업이 밀려 여러 번 실행되어야 하는 경우 한 번으로 합칩니다 (coalesce).
+scheduler = AsyncIOScheduler(
+    executors={"default": AsyncIOExecutor()},
+    job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": 600},
+    timezone="Asia/Seoul",
+)
+
+_job_executor = None  # 스케줄러 작업 전용 스레드 풀 (init_scheduler에서 생성)
+_inflight_jobs = set()  # 실행 중인 블로킹 작업 (graceful shutdown 대기용)
 
 
 def get_korea_today():
@@ -26,6 +64,30 @@ def get_korea_today():
     return kst_now.date()
 
 
+def _get_job_executor() -> ThreadPoolExecutor:
+    global _job_executor
+    if _job_executor is None:
+        _job_executor = ThreadPoolExecutor(
+            max_workers=SCHEDULER_MAX_WORKERS, thread_name_prefix="scheduler-job"
+        )
+    return _job_executor
+
+
+async def run_blocking(func, *args, **kwargs):
+    """블로킹 함수를 스케줄러 작업 스레드 풀에서 실행하고 결과를 기다림
+
+    이벤트 루프를 막지 않으면서, 동시에 실행되는 스케줄러 작업 수를
+    SCHEDULER_MAX_WORKERS로 제한합니다.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_get_job_executor(), partial(func, *args, **kwargs))
+    _inflight_jobs.add(future)
+    try:
+        return await future
+    finally:
+        _inflight_jobs.discard(future)
+
+
 def send_email(to_email: str, subject: str, body: str, cc_emails: list = None):
     """이메일 발송 함수
 
@@ -34,6 +96,9 @@ def send_email(to_email: str, subject: str, body: str, cc_emails: list = None):
         subject: 이메일 제목
         body: 이메일 본문 (HTML)
         cc_emails: CC 받을 이메일 주소 리스트 (선택사항)
+
+    Returns:
+        bool: 발송 성공 여부
     """
     smtp_host = os.getenv("SMTP_HOST", "smtp.gmail.com")
     smtp_port = int(os.getenv("SMTP_PORT", "587"))
@@ -41,6 +106,8 @@ def send_email(to_email: str, subject: str, body: str, cc_emails: list = None):
     smtp_password = os.getenv("SMTP_PASSWORD", "").strip()
     smtp_from = os.getenv("SMTP_FROM_EMAIL", smtp_user).strip()
     smtp_use_ssl = os.getenv("SMTP_USE_SSL", "false").lower() == "true"
+    # 로컬 SMTP 싱크(utils/smtp_sink.py) 등 TLS를 지원하지 않는 서버용
+    smtp_starttls = os.getenv("SMTP_STARTTLS", "true").lower() == "true"
 
     # 환경 변수에서 CC 이메일 읽기 (쉼표로 구분된 여러 이메일 지원)
     if cc_emails is None:
@@ -56,62 +123,151 @@ def send_email(to_email: str, subject: str, body: str, cc_emails: list = None):
     smtp_from = smtp_from.encode("ascii", "ignore").decode("ascii")
 
     if not smtp_user or not smtp_password:
-        print("SMTP 설정이 없어 이메일을 발송할 수 없습니다")
-        return
+        logger.warning("SMTP 설정이 없어 이메일을 발송할 수 없습니다")
+        return False
+
+    logger.debug(
+        "SMTP 연결 정보: 서버 %s:%s, 사용자 %s, 발신자 %s, 수신자 %s, CC %s, SSL 사용 %s",
+        smtp_host,
+        smtp_port,
+        smtp_user,
+        smtp_from,
+        to_email,
+        ", ".join(cc_emails) or "-",
+        smtp_use_ssl,
+    )
 
-    # 디버깅 정보 출력
-    print(f"SMTP 연결 정보:")
-    print(f"  서버: {smtp_host}:{smtp_port}")
-    print(f"  사용자: {smtp_user}")
-    print(f"  발신자: {smtp_from}")
-    print(f"  수신자: {to_email}")
-    if cc_emails:
-        print(f"  CC: {', '.join(cc_emails)}")
-    print(f"  SSL 사용: {smtp_use_ssl}")
+    with track_email_send() as send_result:
+        try:
+            msg = MIMEMultipart()
+            # 발신자를 회사 도메인으로 설정 (Gmail SMTP 사용 시에도 회사 도메인으로 표시)
+            # From 헤더에 이름과 이메일 주소 모두 포함
+            from_name = os.getenv("SMTP_FROM_NAME", "DX본부 시스템 체크리스트").strip()
+            msg["From"] = f"{from_name} <{smtp_from}>"
+            msg["To"] = to_email
+            # CC 설정
+            if cc_emails:
+                msg["Cc"] = ", ".join(cc_emails)
+            # Reply-To를 회사 도메인으로 설정 (회신 시 회사 도메인으로 보내짐)
+            msg["Reply-To"] = smtp_from
+            # 제목을 UTF-8로 인코딩
+            msg["Subject"] = str(Header(subject, "utf-8"))
+            msg.attach(MIMEText(body, "html", "utf-8"))
+
+            # SSL 사용 여부에 따라 다른 방식으로 연결
+            if smtp_use_ssl:
+                # SSL 사용 (포트 465 등)
+                import ssl
+
+                context = ssl.create_default_context()
+                server = smtplib.SMTP_SSL(smtp_host, smtp_port, context=context)
+            else:
+                # TLS 사용 (포트 587 등)
+                server = smtplib.SMTP(smtp_host, smtp_port)
+                if smtp_starttls:
+                    server.starttls()
+
+            server.login(smtp_user, smtp_password)
+            # 수신자와 CC를 모두 포함하여 발송
+            recipients = [to_email]
+            if cc_emails:
+                recipients.extend(cc_emails)
+            server.send_message(msg, to_addrs=recipients)
+            server.quit()
 
-    try:
-        msg = MIMEMultipart()
-        # 발신자를 회사 도메인으로 설정 (Gmail SMTP 사용 시에도 회사 도메인으로 표시)
-        # From 헤더에 이름과 이메일 주소 모두 포함
-        from_name = os.getenv("SMTP_FROM_NAME", "DX본부 시스템 체크리스트").strip()
-        msg["From"] = f"{from_name} <{smtp_from}>"
-        msg["To"] = to_email
-        # CC 설정
-        if cc_emails:
-            msg["Cc"] = ", ".join(cc_emails)
-        # Reply-To를 회사 도메인으로 설정 (회신 시 회사 도메인으로 보내짐)
-        msg["Reply-To"] = smtp_from
-        # 제목을 UTF-8로 인코딩
-        msg["Subject"] = str(Header(subject, "utf-8"))
-        msg.attach(MIMEText(body, "html", "utf-8"))
-
-        # SSL 사용 여부에 따라 다른 방식으로 연결
-        if smtp_use_ssl:
-            # SSL 사용 (포트 465 등)
-            import ssl
-
-            context = ssl.create_default_context()
-            server = smtplib.SMTP_SSL(smtp_host, smtp_port, context=context)
-        else:
-            # TLS 사용 (포트 587 등)
-            server = smtplib.SMTP(smtp_host, smtp_port)
-            server.starttls()
+            logger.info("이메일 발송 완료: %s (CC %d명)", to_email, len(cc_emails))
+            send_result["success"] = True
+            return True
+        except Exception as e:
+            logger.exception("이메일 발송 실패: %s", e)
+            return False
 
-        server.login(smtp_user, smtp_password)
-        # 수신자와 CC를 모두 포함하여 발송
-        recipients = [to_email]
-        if cc_emails:
-            recipients.extend(cc_emails)
-        server.send_message(msg, to_addrs=recipients)
-        server.quit()
 
-        cc_info = f" (CC: {', '.join(cc_emails)})" if cc_emails else ""
-        print(f"이메일 발송 완료: {to_email}{cc_info}")
-    except Exception as e:
-        print(f"이메일 발송 실패: {e}")
-        import traceback
+def build_unchecked_email_body(
+    system_items: dict, recipient_info: str = "", cc_info: str = ""
+) -> str:
+    """미체크 항목 통합 메일 본문(HTML) 생성
+
+    Args:
+        system_items: {system_name: [item_name, ...]}
+        recipient_info: 본문 상단에 표시할 수신인 정보 HTML (선택사항)
+        cc_info: 본문 상단에 표시할 참조자 정보 HTML (선택사항)
+    """
+    rows = []
+    for system_name, items in system_items.items():
+        for idx, item_name in enumerate(items):
+            if idx == 0:
+                # 첫 번째 항목: 시스템명과 항목명 모두 표시
+                rows.append(f"""
+                            <tr>
+                                <td style="padding: 8px; border: 1px solid #ddd; font-size: 14px; font-weight: bold; vertical-align: top;" rowspan="{len(items)}">{system_name}</td>
+                                <td style="padding: 8px; border: 1px solid #ddd; font-size: 14px;">{item_name}</td>
+                            </tr>
+                    """)
+            else:
+                # 두 번째 항목부터: 항목명만 표시
+                rows.append(f"""
+                            <tr>
+                                <td style="padding: 8px; border: 1px solid #ddd; font-size: 14px;">{item_name}</td>
+                            </tr>
+                    """)
+
+    return f"""
+            <html>
+                <body>
+                    <h3>시스템 체크리스트 미체크 항목 알림</h3> 
+                    <p style="color: #d10000; font-size: 12px; font-weight:bold;">&#8251; 해당 메일은 시스템 체크리스트 미수행 담당자에게 발송하는 건입니다.</p>
+                    {recipient_info}
+                    {cc_info}
+                    <p>안녕하세요. DX본부 시스템 체크리스트 안내입니다.</p> 
+                    <p>주요 기능의 장애 예방을 위해 본 메일 수신 시 각 담당자분들께서는 미점검 상태로 남아 있는 시스템 체크리스트 항목을 확인하여 작성 부탁드립니다.</p>
+                    <p style="margin-bottom: 40px;">또한 정/부 담당자 모두 부재 예정인 경우에는, 점검이 누락되지 않도록 사전에 대체 담당자를 지정하여 점검을 진행해 주시기 바랍니다.</p>
+                    <h3>[미점검 항목]</h3>
+                    <table style="width: 100%; border-collapse: collapse; margin-top: 10px; margin-bottom: 20px;">
+                        <thead>
+                            <tr style="background-color: #f5f5f5;">
+                                <th style="padding: 10px; text-align: left; border: 1px solid #ddd; font-size: 14px; font-weight: bold;">시스템</th>
+                                <th style="padding: 10px; text-align: left; border: 1px solid #ddd; font-size: 14px; font-weight: bold;">항목</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+            {"".join(rows)}
+                        </tbody>
+                    </table>
+                    <br> 
+            <p>바쁘신 와중에 협조해 주셔서 감사합니다.</p> 
+            <p style="color: #888; font-size: 12px; margin-top: 20px;">시스템 장애/오류 문의: QA혁신팀 김희수 사원</p> 
+        </body>
+        </html>
+        """
+
+
+def group_unchecked_items(db: Session, unchecked_items: list):
+    """미체크 항목의 담당자 수집 및 시스템별 항목 이름 그룹화
+
+    시스템과 담당자는 미체크 항목의 시스템 ID로 한 번에 조회하므로 항목 수와 관계없이 쿼리 2개로 처리합니다.
+
+    Returns:
+        tuple: (담당자 User 집합, {system_name: [item_name, ...]})
+    """
+    system_ids = {item.system_id for item in unchecked_items}
+    if not system_ids:
+        return set(), {}
 
-        traceback.print_exc()
+    # 담당자 정보 수집 (메일 발송용, 메일 본문에는 표시하지 않음)
+    assigned_user_ids = db.query(UserSystemAssignment.user_id).filter(
+        UserSystemAssignment.system_id.in_(system_ids)
+    )
+    responsible_users = set(db.query(User).filter(User.id.in_(assigned_user_ids)).all())
+
+    # 시스템별로 그룹화 (항목 이름만 저장, 담당자 정보 제외)
+    system_names = dict(db.query(System.id, System.system_name).filter(System.id.in_(system_ids)))
+    system_items = {}  # {system_name: [item_name, ...]}
+    for item in unchecked_items:
+        if item.system_id in system_names:
+            system_items.setdefault(system_names[item.system_id], []).append(item.item_name.strip())
+
+    return responsible_users, system_items
 
 
 def check_unchecked_items():
@@ -122,71 +278,40 @@ def check_unchecked_items():
 
     테스트 모드: .env 파일에 SCHEDULER_TEST_EMAIL이 설정되어 있으면
     해당 이메일로만 발송합니다.
+
+    Returns:
+        dict: 실행 통계 (rows_scanned, recipients, messages_enqueued, unchecked_items, error)
     """
+    stats = {"rows_scanned": 0, "recipients": 0, "messages_enqueued": 0, "unchecked_items": 0}
     db: Session = SessionLocal()
     try:
         # 한국 시간 기준 오늘 날짜 사용
         today = get_korea_today()
-        print(f"[스케줄러] 한국 시간 기준 오늘 날짜: {today}")
+        logger.info("미체크 항목 확인: %s (한국 시간 기준)", today)
 
         # 테스트 모드 확인
         test_email = os.getenv("SCHEDULER_TEST_EMAIL", "").strip()
         is_test_mode = bool(test_email)
 
         if is_test_mode:
-            print(
-                f"[스케줄러] 테스트 모드 활성화 - 모든 이메일을 {test_email}로 발송합니다"
-            )
+            logger.info("테스트 모드 활성화 - 모든 이메일을 %s로 발송합니다", test_email)
 
-        # 오늘 체크된 항목 (다른 사람이 체크한 것도 포함)
+        # 체크되지 않은 항목 (오늘 슬롯에서 UNCHECKED 조회, 슬롯이 없으면 전체 항목 - 오늘 기록)
         # 확인자가 여러 명인 경우, 한 명이 체크하면 다른 사람도 체크된 것으로 보임.
-        checked_records = (
-            db.query(ChecklistRecord).filter(ChecklistRecord.check_date == today).all()
-        )
-        checked_item_ids = {r.check_item_id for r in checked_records}
-
-        # 모든 체크 항목 조회
-        all_check_items = db.query(CheckItem).all()
-
-        # 체크되지 않은 항목 필터링
-        unchecked_items = [
-            item for item in all_check_items if item.id not in checked_item_ids
-        ]
+        unchecked_items = find_unchecked_items(db, today)
+        stats["rows_scanned"] = len(unchecked_items)
+        stats["unchecked_items"] = len(unchecked_items)
 
         if not unchecked_items:
-            print(f"[스케줄러] 오늘 체크되지 않은 항목이 없습니다.")
-            return
-
-        # 미체크 항목의 담당자 수집
-        responsible_users = set()
-        system_items = {}  # {system_name: [item_name, ...]}
-
-        for item in unchecked_items:
-            # 해당 항목의 담당자 조회
-            assignments = (
-                db.query(UserSystemAssignment)
-                .filter(UserSystemAssignment.system_id == item.system_id)
-                .all()
-            )
+            logger.info("오늘 체크되지 않은 항목이 없습니다.")
+            return stats
 
-            # 담당자 정보 수집 (메일 발송용, 메일 본문에는 표시하지 않음)
-            for assignment in assignments:
-                user = db.query(User).filter(User.id == assignment.user_id).first()
-                if user:
-                    responsible_users.add(user)
-
-            # 시스템별로 그룹화 (담당자 정보는 저장하지 않음)
-            system = db.query(System).filter(System.id == item.system_id).first()
-            if system:
-                system_name = system.system_name
-                if system_name not in system_items:
-                    system_items[system_name] = []
-                # 항목 이름만 저장 (담당자 정보 제외)
-                system_items[system_name].append(item.item_name.strip())
+        # 미체크 항목의 담당자 수집 및 시스템별 그룹화
+        responsible_users, system_items = group_unchecked_items(db, unchecked_items)
 
         if not responsible_users:
-            print(f"[스케줄러] 미체크 항목의 담당자가 없습니다.")
-            return
+            logger.info("미체크 항목의 담당자가 없습니다.")
+            return stats
 
         subject = f"[요청] 시스템 체크리스트 미점검 항목 확인 요청 ({today})"
 
@@ -196,14 +321,15 @@ def check_unchecked_items():
         if is_test_mode:
             recipient_emails = [test_email]
             recipient_names = ["테스트 이메일"]
-            print(f"  [테스트 모드] 통합 메일을 {test_email}로 발송합니다")
+            logger.info("[테스트 모드] 통합 메일을 %s로 발송합니다", test_email)
         else:
             recipient_emails = [user.email for user in responsible_users if user.email]
             recipient_names = [user.name for user in responsible_users if user.email]
-            print(
-                f"  [스케줄러] 통합 메일을 {len(recipient_emails)}명의 담당자에게 발송합니다"
+            logger.info("통합 메일을 %d명의 담당자에게 발송합니다", len(recipient_emails))
+            logger.debug(
+                "수신인: %s",
+                ", ".join(f"{name}({email})" for name, email in zip(recipient_names, recipient_emails)),
             )
-            print(f"    수신인: {', '.join([f'{name}({email})' for name, email in zip(recipient_names, recipient_emails)])}")
 
         # 참조: 담당자들의 팀장 및 DX본부 본부장
         cc_emails = []
@@ -233,11 +359,12 @@ def check_unchecked_items():
                     if tl.general_headquarters and tl.general_headquarters in responsible_general_headquarters:
                         filtered_team_leaders.append(tl)
                 team_leaders = filtered_team_leaders
-                print(f"    [참조] 담당자의 총괄본부: {responsible_general_headquarters}")
-                print(f"    [참조] 매칭된 팀장: {len(team_leaders)}명")
+                logger.debug(
+                    "참조: 담당자의 총괄본부 %s, 매칭된 팀장 %d명", responsible_general_headquarters, len(team_leaders)
+                )
             else:
                 # 담당자의 총괄본부 정보가 없으면 모든 팀장 포함
-                print(f"    [참고] 담당자의 총괄본부 정보가 없어 모든 팀장을 참조자로 추가합니다.")
+                logger.info("담당자의 총괄본부 정보가 없어 모든 팀장을 참조자로 추가합니다.")
                 team_leaders = all_team_leaders
             
             # DX본부 본부장 찾기: division에 DX가 포함된 본부장
@@ -269,13 +396,15 @@ def check_unchecked_items():
                     # 본부장은 무조건 참조자로 포함 (팀장과 같은 이메일이어도 포함)
                     cc_emails.append(director.email)
                     cc_names.append(director.name)
-                    print(f"    [참조] 본부장 추가: {director.name} ({director.email})")
+                    logger.debug("참조: 본부장 추가 %s (%s)", director.name, director.email)
             
-            print(
-                f"  [스케줄러] CC: {len(cc_emails)}명 (팀장 {len(team_leaders)}명, DX본부 본부장 {len(dx_directors)}명)"
+            logger.info(
+                "CC: %d명 (팀장 %d명, DX본부 본부장 %d명)", len(cc_emails), len(team_leaders), len(dx_directors)
             )
             if cc_emails:
-                print(f"    참조: {', '.join([f'{name}({email})' for name, email in zip(cc_names, cc_emails)])}")
+                logger.debug(
+                    "참조: %s", ", ".join(f"{name}({email})" for name, email in zip(cc_names, cc_emails))
+                )
 
         # 수신인 및 참조자 정보 (메일 본문용)
         recipient_info = ""
@@ -292,55 +421,7 @@ def check_unchecked_items():
             #     print(f"    [디버깅] 참조자가 없어 메일 본문에 참조자 정보를 표시하지 않습니다. (cc_emails={len(cc_emails)}, cc_names={len(cc_names)})")
         
         # 통합 이메일 본문 생성
-        email_body = f"""
-            <html>
-                <body>
-                    <h3>시스템 체크리스트 미체크 항목 알림</h3> 
-                    <p style="color: #d10000; font-size: 12px; font-weight:bold;">&#8251; 해당 메일은 시스템 체크리스트 미수행 담당자에게 발송하는 건입니다.</p>
-                    {recipient_info if recipient_info else ''}
-                    {cc_info if cc_info else ''}
-                    <p>안녕하세요. DX본부 시스템 체크리스트 안내입니다.</p> 
-                    <p>주요 기능의 장애 예방을 위해 본 메일 수신 시 각 담당자분들께서는 미점검 상태로 남아 있는 시스템 체크리스트 항목을 확인하여 작성 부탁드립니다.</p>
-                    <p style="margin-bottom: 40px;">또한 정/부 담당자 모두 부재 예정인 경우에는, 점검이 누락되지 않도록 사전에 대체 담당자를 지정하여 점검을 진행해 주시기 바랍니다.</p>
-                    <h3>[미점검 항목]</h3>
-                    <table style="width: 100%; border-collapse: collapse; margin-top: 10px; margin-bottom: 20px;">
-                        <thead>
-                            <tr style="background-color: #f5f5f5;">
-                                <th style="padding: 10px; text-align: left; border: 1px solid #ddd; font-size: 14px; font-weight: bold;">시스템</th>
-                                <th style="padding: 10px; text-align: left; border: 1px solid #ddd; font-size: 14px; font-weight: bold;">항목</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-            """
-        for system_name, items in system_items.items():
-            for idx, item_name in enumerate(items):
-                if idx == 0:
-                    # 첫 번째 항목: 시스템명과 항목명 모두 표시
-                    email_body += f"""
-                            <tr>
-                                <td style="padding: 8px; border: 1px solid #ddd; font-size: 14px; font-weight: bold; vertical-align: top;" rowspan="{len(items)}">{system_name}</td>
-                                <td style="padding: 8px; border: 1px solid #ddd; font-size: 14px;">{item_name}</td>
-                            </tr>
-                    """
-                else:
-                    # 두 번째 항목부터: 항목명만 표시
-                    email_body += f"""
-                            <tr>
-                                <td style="padding: 8px; border: 1px solid #ddd; font-size: 14px;">{item_name}</td>
-                            </tr>
-                    """
-
-        email_body += (
-            """
-                        </tbody>
-                    </table>
-                    <br> 
-            <p>바쁘신 와중에 협조해 주셔서 감사합니다.</p> 
-            <p style="color: #888; font-size: 12px; margin-top: 20px;">시스템 장애/오류 문의: QA혁신팀 김희수 사원</p> 
-        </body>
-        </html>
-        """
-        )
+        email_body = build_unchecked_email_body(system_items, recipient_info, cc_info)
 
         if recipient_emails:
             # 첫 번째 담당자 이메일을 To로, 나머지 담당자는 CC에 추가
@@ -349,22 +430,27 @@ def check_unchecked_items():
             remaining_recipients = recipient_emails[1:] if len(recipient_emails) > 1 else []
             all_cc_emails = list(set(remaining_recipients + cc_emails))  # 중복 제거
 
-            send_email(to_email, subject, email_body, cc_emails=all_cc_emails)
+            stats["recipients"] = 1 + len(all_cc_emails)
+            if send_email(to_email, subject, email_body, cc_emails=all_cc_emails):
+                stats["messages_enqueued"] += 1
 
     except Exception as e:
-        print(f"미체크 항목 확인 중 오류 발생: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("미체크 항목 확인 중 오류 발생: %s", e)
+        stats["error"] = str(e)
     finally:
         db.close()
+    return stats
 
 
 def send_test_email_scheduled():
     """스케줄된 테스트 메일 발송 함수
 
     실제 DB에서 미체크 항목을 읽어서 실제 메일과 동일한 형식으로 발송합니다.
+
+    Returns:
+        dict: 실행 통계 (rows_scanned, recipients, messages_enqueued, unchecked_items, error)
     """
+    stats = {"rows_scanned": 0, "recipients": 0, "messages_enqueued": 0, "unchecked_items": 0}
     db: Session = SessionLocal()
     try:
         # 한국 시간 기준 오늘 날짜 사용
@@ -372,73 +458,42 @@ def send_test_email_scheduled():
         kst = pytz.timezone("Asia/Seoul")
         now = datetime.now(kst)
 
-        print(f"[테스트 메일] 한국 시간 기준 오늘 날짜: {today}")
+        logger.info("테스트 메일: %s 미체크 항목 확인 (한국 시간 기준)", today)
 
-        # 오늘 체크된 항목 (다른 사람이 체크한 것도 포함)
+        # 체크되지 않은 항목 (오늘 슬롯에서 UNCHECKED 조회, 슬롯이 없으면 전체 항목 - 오늘 기록)
         # 확인자가 여러 명인 경우, 한 명이 체크하면 다른 사람도 체크된 것으로 보임.
-        checked_records = (
-            db.query(ChecklistRecord).filter(ChecklistRecord.check_date == today).all()
-        )
-        checked_item_ids = {r.check_item_id for r in checked_records}
-
-        # 모든 체크 항목 조회
-        all_check_items = db.query(CheckItem).all()
-
-        # 체크되지 않은 항목 필터링
-        unchecked_items = [
-            item for item in all_check_items if item.id not in checked_item_ids
-        ]
+        unchecked_items = find_unchecked_items(db, today)
+        stats["rows_scanned"] = len(unchecked_items)
+        stats["unchecked_items"] = len(unchecked_items)
 
         if not unchecked_items:
-            print(f"[테스트 메일] 오늘 체크되지 않은 항목이 없습니다.")
-            return
-        else:
-            # 미체크 항목의 담당자 수집
-            responsible_users = set()
-            system_items = {}  # {system_name: [item_name, ...]}
-
-            for item in unchecked_items:
-                # 해당 항목의 담당자 조회
-                assignments = (
-                    db.query(UserSystemAssignment)
-                    .filter(UserSystemAssignment.system_id == item.system_id)
-                    .all()
-                )
+            logger.info("테스트 메일: 오늘 체크되지 않은 항목이 없습니다.")
+            return stats
 
-                # 담당자 정보 수집 (메일 발송용, 메일 본문에는 표시하지 않음)
-                for assignment in assignments:
-                    user = db.query(User).filter(User.id == assignment.user_id).first()
-                    if user:
-                        responsible_users.add(user)
-
-                # 시스템별로 그룹화 (담당자 정보는 저장하지 않음)
-                system = db.query(System).filter(System.id == item.system_id).first()
-                if system:
-                    system_name = system.system_name
-                    if system_name not in system_items:
-                        system_items[system_name] = []
-                    # 항목 이름만 저장 (담당자 정보 제외)
-                    system_items[system_name].append(item.item_name.strip())
+        # 미체크 항목의 담당자 수집 및 시스템별 그룹화
+        responsible_users, system_items = group_unchecked_items(db, unchecked_items)
 
         subject = f"[요청] 시스템 체크리스트 미점검 항목 확인 요청 ({today})"
 
         # 실제 담당자 이메일 주소 사용
         if not responsible_users:
-            print(f"[테스트 메일] 미체크 항목의 담당자가 없습니다.")
-            return
+            logger.info("테스트 메일: 미체크 항목의 담당자가 없습니다.")
+            return stats
 
         # 수신인: 미점검 담당자 모두
         recipient_emails = [user.email for user in responsible_users if user.email]
         
         if not recipient_emails:
-            print(f"[테스트 메일] 담당자의 이메일 주소가 없습니다.")
-            return
+            logger.info("테스트 메일: 담당자의 이메일 주소가 없습니다.")
+            return stats
 
         # 수신인 이름 수집
         recipient_names = [user.name for user in responsible_users if user.email]
         
-        print(f"[테스트 메일] 통합 메일을 {len(recipient_emails)}명의 담당자에게 발송합니다")
-        print(f"  수신인: {', '.join([f'{name}({email})' for name, email in zip(recipient_names, recipient_emails)])}")
+        logger.info("테스트 메일: 통합 메일을 %d명의 담당자에게 발송합니다", len(recipient_emails))
+        logger.debug(
+            "수신인: %s", ", ".join(f"{name}({email})" for name, email in zip(recipient_names, recipient_emails))
+        )
 
         # 참조: 담당자들의 팀장 및 DX본부 본부장
         # 담당자들의 총괄본부 정보 수집 (팀장 찾기용)
@@ -465,11 +520,12 @@ def send_test_email_scheduled():
                 if tl.general_headquarters and tl.general_headquarters in responsible_general_headquarters:
                     filtered_team_leaders.append(tl)
             team_leaders = filtered_team_leaders
-            print(f"    [참조] 담당자의 총괄본부: {responsible_general_headquarters}")
-            print(f"    [참조] 매칭된 팀장: {len(team_leaders)}명")
+            logger.debug(
+                "참조: 담당자의 총괄본부 %s, 매칭된 팀장 %d명", responsible_general_headquarters, len(team_leaders)
+            )
         else:
             # 담당자의 총괄본부 정보가 없으면 모든 팀장 포함
-            print(f"    [참고] 담당자의 총괄본부 정보가 없어 모든 팀장을 참조자로 추가합니다.")
+            logger.info("담당자의 총괄본부 정보가 없어 모든 팀장을 참조자로 추가합니다.")
             team_leaders = all_team_leaders
         
         # DX본부 본부장 찾기: division에 DX가 포함된 본부장
@@ -501,11 +557,13 @@ def send_test_email_scheduled():
                 # 본부장은 무조건 참조자로 포함 (팀장과 같은 이메일이어도 포함)
                 cc_emails.append(director.email)
                 cc_names.append(director.name)
-                print(f"    [참조] 본부장 추가: {director.name} ({director.email})")
+                logger.debug("참조: 본부장 추가 %s (%s)", director.name, director.email)
         
-        print(f"[테스트 메일] CC: {len(cc_emails)}명 (팀장 {len(team_leaders)}명, DX본부 본부장 {len(dx_directors)}명)")
+        logger.info(
+            "테스트 메일: CC %d명 (팀장 %d명, DX본부 본부장 %d명)", len(cc_emails), len(team_leaders), len(dx_directors)
+        )
         if cc_emails:
-            print(f"  참조: {', '.join([f'{name}({email})' for name, email in zip(cc_names, cc_emails)])}")
+            logger.debug("참조: %s", ", ".join(f"{name}({email})" for name, email in zip(cc_names, cc_emails)))
 
         # 수신인 및 참조자 정보 (메일 본문용)
         recipient_info = f"<p style='color: #666; font-size: 11px; margin-bottom: 10px;'><strong>수신인:</strong> {', '.join(recipient_names)}</p>"
@@ -513,80 +571,205 @@ def send_test_email_scheduled():
         if cc_names:
             cc_info = f"<p style='color: #666; font-size: 11px; margin-bottom: 10px;'><strong>참조:</strong> {', '.join(cc_names)}</p>"
         else:
-            # 디버깅: 참조자가 없는 경우 로그 출력
-            print(f"    [참고] 참조자가 없어 메일 본문에 참조자 정보를 표시하지 않습니다.")
+            logger.debug("참조자가 없어 메일 본문에 참조자 정보를 표시하지 않습니다.")
 
         # 실제 메일과 동일한 형식의 이메일 본문 생성
-        email_body = f"""
-            <html>
-                <body>
-                    <h3>시스템 체크리스트 미체크 항목 알림</h3> 
-                    <p style="color: #d10000; font-size: 12px; font-weight:bold;">&#8251; 해당 메일은 시스템 체크리스트 미수행 담당자에게 발송하는 건입니다.</p>
-                    {recipient_info}
-                    {cc_info}
-                    <p>안녕하세요. DX본부 시스템 체크리스트 안내입니다.</p> 
-                    <p>주요 기능의 장애 예방을 위해 본 메일 수신 시 각 담당자분들께서는 미점검 상태로 남아 있는 시스템 체크리스트 항목을 확인하여 작성 부탁드립니다.</p>
-                    <p style="margin-bottom: 40px;">또한 정/부 담당자 모두 부재 예정인 경우에는, 점검이 누락되지 않도록 사전에 대체 담당자를 지정하여 점검을 진행해 주시기 바랍니다.</p>
-                    <h3>[미점검 항목]</h3>
-                    <table style="width: 100%; border-collapse: collapse; margin-top: 10px; margin-bottom: 20px;">
-                        <thead>
-                            <tr style="background-color: #f5f5f5;">
-                                <th style="padding: 10px; text-align: left; border: 1px solid #ddd; font-size: 14px; font-weight: bold;">시스템</th>
-                                <th style="padding: 10px; text-align: left; border: 1px solid #ddd; font-size: 14px; font-weight: bold;">항목</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-            """
-
-        for system_name, items in system_items.items():
-            for idx, item_name in enumerate(items):
-                if idx == 0:
-                    # 첫 번째 항목: 시스템명과 항목명 모두 표시
-                    email_body += f"""
-                            <tr>
-                                <td style="padding: 8px; border: 1px solid #ddd; font-size: 14px; font-weight: bold; vertical-align: top;" rowspan="{len(items)}">{system_name}</td>
-                                <td style="padding: 8px; border: 1px solid #ddd; font-size: 14px;">{item_name}</td>
-                            </tr>
-                    """
-                else:
-                    # 두 번째 항목부터: 항목명만 표시
-                    email_body += f"""
-                            <tr>
-                                <td style="padding: 8px; border: 1px solid #ddd; font-size: 14px;">{item_name}</td>
-                            </tr>
-                    """
-
-        email_body += (
-            """
-                        </tbody>
-                    </table>
-                    <br>
-            <p>바쁘신 와중에 협조해 주셔서 감사합니다.</p> 
-            <p style="color: #888; font-size: 12px; margin-top: 20px;">시스템 장애/오류 문의: QA혁신팀 김희수 사원</p>
-        </body>
-        </html>
-        """
-        )
+        email_body = build_unchecked_email_body(system_items, recipient_info, cc_info)
 
         # 첫 번째 담당자 이메일을 To로, 나머지 담당자와 팀장/본부장은 CC로 설정
         to_email = recipient_emails[0]
         remaining_recipients = recipient_emails[1:] if len(recipient_emails) > 1 else []
         all_cc_emails = list(set(remaining_recipients + cc_emails))  # 중복 제거
 
-        send_email(
+        stats["recipients"] = 1 + len(all_cc_emails)
+        if send_email(
             to_email=to_email,
             subject=subject,
             body=email_body,
             cc_emails=all_cc_emails,
-        )
+        ):
+            stats["messages_enqueued"] += 1
 
     except Exception as e:
-        print(f"[테스트 메일] 오류 발생: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("테스트 메일 오류 발생: %s", e)
+        stats["error"] = str(e)
     finally:
         db.close()
+    return stats
+
+
+async def check_unchecked_items_job(job_id: str = "check_unchecked_items"):
+    """스케줄러 작업: 미체크 항목 확인 및 통합 메일 발송 (실행 이력 기록)"""
+    return await run_blocking(
+        run_with_history, job_id, check_unchecked_items, job_name="체크리스트 확인"
+    )
+
+
+async def send_test_email_job(job_id: str = "send_test_email"):
+    """스케줄러 작업: 테스트 메일 발송 (실행 이력 기록)"""
+    return await run_blocking(
+        run_with_history, job_id, send_test_email_scheduled, job_name="테스트 메일 발송"
+    )
+
+
+async def compact_record_logs_job(job_id: str = "compact_record_logs"):
+    """스케줄러 작업: 보관 기간이 지난 체크 기록 로그 압축 및 원본 보관 (실행 이력 기록)"""
+    return await run_blocking(
+        run_with_history, job_id, compact_record_logs, job_name="체크 기록 로그 압축"
+    )
+
+
+async def archive_records_job(job_id: str = "archive_records"):
+    """스케줄러 작업: 보관 기간이 지난 달의 체크 기록을 Parquet 파일로 이동 (실행 이력 기록)"""
+    return await run_blocking(
+        run_with_history, job_id, archive_closed_months, job_name="체크 기록 월별 보관"
+    )
+
+
+async def day_close_job(job_id: str = "day_close"):
+    """스케줄러 작업: 지난 날짜의 항목별 최종 상태 스냅샷 기록 (실행 이력 기록)"""
+    return await run_blocking(
+        run_with_history, job_id, close_pending_days, job_name="일 마감"
+    )
+
+
+async def daily_slots_job(job_id: str = "daily_slots"):
+    """스케줄러 작업: 오늘 체크 항목별 UNCHECKED 슬롯 생성 (실행 이력 기록)"""
+    return await run_blocking(
+        run_with_history, job_id, instantiate_daily_slots, job_name="일별 체크 슬롯 생성"
+    )
+
+
+async def db_maintenance_job(job_id: str = "db_maintenance"):
+    """스케줄러 작업: DB 통계 갱신 및 빈 공간 정리 (실행 이력 기록)"""
+    return await run_blocking(
+        run_with_history, job_id, run_db_maintenance, job_name="DB 유지보수"
+    )
+
+
+async def db_snapshot_job(job_id: str = "db_snapshot"):
+    """스케줄러 작업: DB 스냅샷 생성 및 오래된 스냅샷 삭제 (실행 이력 기록)"""
+    return await run_blocking(
+        run_with_history, job_id, snapshot_job, job_name="DB 스냅샷"
+    )
+
+
+# 수동 실행 가능한 작업 {job_key: (함수, 작업 이름)}
+MANUAL_JOBS = {
+    "check_unchecked_items": (check_unchecked_items, "체크리스트 확인 (수동)"),
+    "send_test_email": (send_test_email_scheduled, "테스트 메일 발송 (수동)"),
+    "compact_record_logs": (compact_record_logs, "체크 기록 로그 압축 (수동)"),
+    "archive_records": (archive_closed_months, "체크 기록 월별 보관 (수동)"),
+    "day_close": (close_pending_days, "일 마감 (수동)"),
+    "daily_slots": (instantiate_daily_slots, "일별 체크 슬롯 생성 (수동)"),
+    "db_maintenance": (run_db_maintenance, "DB 유지보수 (수동)"),
+    "db_snapshot": (snapshot_job, "DB 스냅샷 (수동)"),
+}
+
+# 대기/실행 중인 수동 실행 {job_key: 실행 이력 ID Future}
+# 같은 작업의 수동 실행 요청이 동시에 들어오면 하나의 실행으로 합칩니다.
+_active_manual_runs = {}
+
+
+async def trigger_job_now(job_key: str):
+    """작업을 스케줄러에 즉시 실행으로 등록하고 실행 이력 ID를 바로 반환
+
+    같은 작업이 이미 대기/실행 중이면 새로 실행하지 않고 기존 실행 이력 ID를 반환합니다.
+    이벤트 루프에서 호출해야 합니다.
+
+    Args:
+        job_key: MANUAL_JOBS의 키
+
+    Returns:
+        tuple: (실행 이력 ID, 기존 실행에 합쳐졌는지 여부)
+    """
+    if job_key not in MANUAL_JOBS:
+        raise ValueError(f"알 수 없는 작업입니다: {job_key}")
+    if not scheduler.running:
+        raise RuntimeError("스케줄러가 실행되지 않았습니다.")
+
+    existing = _active_manual_runs.get(job_key)
+    if existing is not None:
+        return await asyncio.shield(existing), True
+
+    # 실행 이력 생성 전에 자리를 잡아 두어 동시 요청이 중복 실행되지 않도록 함
+    loop = asyncio.get_running_loop()
+    handle = loop.create_future()
+    _active_manual_runs[job_key] = handle
+    _, job_name = MANUAL_JOBS[job_key]
+    try:
+        run_id = await loop.run_in_executor(
+            None, partial(start_job_run, job_key, job_name, "MANUAL", "QUEUED")
+        )
+        scheduler.add_job(
+            _run_manual_job,
+            kwargs={"job_key": job_key, "run_id": run_id},
+            id=f"manual_{job_key}_{run_id}",
+            name=job_name,
+            misfire_grace_time=None,
+        )
+    except Exception as e:
+        _active_manual_runs.pop(job_key, None)
+        handle.set_exception(e)
+        handle.exception()  # 대기 중인 요청이 없어도 경고가 남지 않도록 조회
+        raise
+
+    handle.set_result(run_id)
+    return run_id, False
+
+
+async def _run_manual_job(job_key: str, run_id: int):
+    """수동 실행 작업 (trigger_job_now에서 등록)"""
+    func, job_name = MANUAL_JOBS[job_key]
+    try:
+        await run_blocking(
+            run_with_history, job_key, func, job_name=job_name, trigger="MANUAL", run_id=run_id
+        )
+    finally:
+        _active_manual_runs.pop(job_key, None)
+
+
+async def submit_background_job(job_id: str, job_name: str, job_func, details: dict = None) -> int:
+    """일회성 작업을 스케줄러에 즉시 실행으로 등록하고 실행 이력 ID를 바로 반환
+
+    수동 실행(trigger_job_now)과 달리 요청마다 별도로 실행되며, 합쳐지지 않습니다.
+    (예: 업로드한 파일 import)
+
+    Args:
+        job_id: 실행 이력에 기록할 작업 ID
+        job_name: 작업 이름 (표시용)
+        job_func: 실행할 함수 job_func(run_id) (블로킹, 작업 스레드에서 실행)
+        details: 대기 중 실행 이력에 기록할 추가 정보
+    """
+    if not scheduler.running:
+        raise RuntimeError("스케줄러가 실행되지 않았습니다.")
+
+    loop = asyncio.get_running_loop()
+    run_id = await loop.run_in_executor(
+        None, partial(start_job_run, job_id, job_name, "MANUAL", "QUEUED")
+    )
+    if details:
+        await loop.run_in_executor(None, partial(update_job_progress, run_id, 0, details))
+    scheduler.add_job(
+        _run_background_job,
+        kwargs={"job_id": job_id, "job_name": job_name, "job_func": job_func, "run_id": run_id},
+        id=f"{job_id}_{run_id}",
+        name=job_name,
+        misfire_grace_time=None,
+    )
+    return run_id
+
+
+async def _run_background_job(job_id: str, job_name: str, job_func, run_id: int):
+    """일회성 작업 실행 (submit_background_job에서 등록)"""
+    await run_blocking(
+        run_with_history,
+        job_id,
+        partial(job_func, run_id),
+        job_name=job_name,
+        trigger="MANUAL",
+        run_id=run_id,
+    )
 
 
 def schedule_test_email(hour: int, minute: int):
@@ -623,8 +806,9 @@ def schedule_test_email(hour: int, minute: int):
 
     # 새 작업 추가
     scheduler.add_job(
-        send_test_email_scheduled,
+        send_test_email_job,
         trigger=DateTrigger(run_date=scheduled_time),
+        kwargs={"job_id": job_id},
         id=job_id,
         name=f"테스트 메일 발송 - {scheduled_time.strftime('%Y-%m-%d %H:%M')}",
         replace_existing=True,
@@ -633,6 +817,47 @@ def schedule_test_email(hour: int, minute: int):
     return job_id, scheduled_time
 
 
+def parse_time(time_str):
+    """HH:MM 형식의 시간 문자열을 파싱하여 (hour, minute) 튜플 반환"""
+    try:
+        parts = time_str.split(":")
+        if len(parts) != 2:
+            raise ValueError("시간 형식이 올바르지 않습니다. HH:MM 형식을 사용하세요.")
+        hour = int(parts[0])
+        minute = int(parts[1])
+        if not (0 <= hour <= 23 and 0 <= minute <= 59):
+            raise ValueError("시간 범위가 올바르지 않습니다. (00:00 ~ 23:59)")
+        return hour, minute
+    except (ValueError, IndexError) as e:
+        logger.warning("시간 파싱 오류: %s - %s", time_str, e)
+        return None, None
+
+
+def add_daily_job(job_id: str, name: str, job_func, env_name: str, default_time: str):
+    """매일 정해진 시간에 실행할 유지보수 작업 등록
+
+    실행 시간은 환경 변수 env_name(HH:MM)에서 읽으며, 값이 'off'이거나 비어 있으면 등록하지 않습니다.
+    """
+    time_str = os.getenv(env_name, default_time).strip()
+    if time_str.lower() in ("", "off"):
+        logger.info("스케줄 미등록: %s (%s=off)", name, env_name)
+        return
+    hour, minute = parse_time(time_str)
+    if hour is None:
+        logger.warning("%s (%s) 파싱 실패, 기본값 %s 사용", env_name, time_str, default_time)
+        time_str = default_time
+        hour, minute = parse_time(default_time)
+    scheduler.add_job(
+        job_func,
+        trigger=CronTrigger(hour=hour, minute=minute, timezone="Asia/Seoul"),
+        kwargs={"job_id": job_id},
+        id=job_id,
+        name=f"{name} ({time_str})",
+        replace_existing=True,
+    )
+    logger.info("스케줄 등록: 매일 %s에 %s", time_str, name)
+
+
 def init_scheduler():
     """스케줄러 초기화 및 작업 등록"""
     if scheduler.running:
@@ -642,38 +867,24 @@ def init_scheduler():
     check_time_1 = os.getenv("CHECK_TIME_1", "09:00").strip()
     check_time_2 = os.getenv("CHECK_TIME_2", "12:00").strip()
     
-    # 시간 파싱 함수
-    def parse_time(time_str):
-        """HH:MM 형식의 시간 문자열을 파싱하여 (hour, minute) 튜플 반환"""
-        try:
-            parts = time_str.split(":")
-            if len(parts) != 2:
-                raise ValueError("시간 형식이 올바르지 않습니다. HH:MM 형식을 사용하세요.")
-            hour = int(parts[0])
-            minute = int(parts[1])
-            if not (0 <= hour <= 23 and 0 <= minute <= 59):
-                raise ValueError("시간 범위가 올바르지 않습니다. (00:00 ~ 23:59)")
-            return hour, minute
-        except (ValueError, IndexError) as e:
-            print(f"시간 파싱 오류: {time_str} - {e}")
-            return None, None
-    
     # 첫 번째 스케줄 시간 파싱 및 등록
     hour1, minute1 = parse_time(check_time_1)
     if hour1 is not None and minute1 is not None:
         scheduler.add_job(
-            check_unchecked_items,
+            check_unchecked_items_job,
             trigger=CronTrigger(hour=hour1, minute=minute1, timezone="Asia/Seoul"),
+            kwargs={"job_id": "check_time_1"},
             id="check_time_1",
             name=f"체크리스트 확인 ({check_time_1})",
             replace_existing=True,
         )
-        print(f"스케줄 등록: 매일 {check_time_1}에 체크리스트 확인")
+        logger.info("스케줄 등록: 매일 %s에 체크리스트 확인", check_time_1)
     else:
-        print(f"경고: CHECK_TIME_1 ({check_time_1}) 파싱 실패, 기본값 09:00 사용")
+        logger.warning("CHECK_TIME_1 (%s) 파싱 실패, 기본값 09:00 사용", check_time_1)
         scheduler.add_job(
-            check_unchecked_items,
+            check_unchecked_items_job,
             trigger=CronTrigger(hour=9, minute=0, timezone="Asia/Seoul"),
+            kwargs={"job_id": "check_time_1"},
             id="check_time_1",
             name="체크리스트 확인 (09:00)",
             replace_existing=True,
@@ -683,22 +894,75 @@ def init_scheduler():
     hour2, minute2 = parse_time(check_time_2)
     if hour2 is not None and minute2 is not None:
         scheduler.add_job(
-            check_unchecked_items,
+            check_unchecked_items_job,
             trigger=CronTrigger(hour=hour2, minute=minute2, timezone="Asia/Seoul"),
+            kwargs={"job_id": "check_time_2"},
             id="check_time_2",
             name=f"체크리스트 확인 ({check_time_2})",
             replace_existing=True,
         )
-        print(f"스케줄 등록: 매일 {check_time_2}에 체크리스트 확인")
+        logger.info("스케줄 등록: 매일 %s에 체크리스트 확인", check_time_2)
     else:
-        print(f"경고: CHECK_TIME_2 ({check_time_2}) 파싱 실패, 기본값 12:00 사용")
+        logger.warning("CHECK_TIME_2 (%s) 파싱 실패, 기본값 12:00 사용", check_time_2)
         scheduler.add_job(
-            check_unchecked_items,
+            check_unchecked_items_job,
             trigger=CronTrigger(hour=12, minute=0, timezone="Asia/Seoul"),
+            kwargs={"job_id": "check_time_2"},
             id="check_time_2",
             name="체크리스트 확인 (12:00)",
             replace_existing=True,
         )
 
+    # 일 마감 (전날 항목별 최종 상태 스냅샷)
+    add_daily_job("day_close", "일 마감", day_close_job, "DAY_CLOSE_TIME", "00:10")
+
+    # 오늘 체크 슬롯 생성 (업무 시작 전)
+    add_daily_job("daily_slots", "일별 체크 슬롯 생성", daily_slots_job, "DAILY_SLOTS_TIME", "06:00")
+
+    # 유지보수 작업 (스냅샷을 먼저 만든 뒤 로그 압축/보관)
+    add_daily_job("db_snapshot", "DB 스냅샷", db_snapshot_job, "DB_SNAPSHOT_TIME", "03:00")
+    add_daily_job(
+        "compact_record_logs", "체크 기록 로그 압축", compact_record_logs_job, "LOG_COMPACTION_TIME", "03:30"
+    )
+    add_daily_job(
+        "archive_records", "체크 기록 월별 보관", archive_records_job, "RECORD_ARCHIVE_TIME", "04:00"
+    )
+    # 로그 압축/기록 보관 뒤에 실행 (정리된 공간 회수, 통계 갱신)
+    add_daily_job("db_maintenance", "DB 유지보수", db_maintenance_job, "DB_MAINTENANCE_TIME", "04:30")
+
+    # misfire/coalesce/중복 실행 이벤트를 실행 이력에 기록
+    scheduler.add_listener(create_job_event_listener(scheduler), JOB_EVENT_MASK)
+
+    # 앱의 이벤트 루프에서 시작 (startup 이벤트 안에서 호출되어야 함)
     scheduler.start()
-    print(f"스케줄러가 시작되었습니다. 매일 {check_time_1}, {check_time_2}에 미체크 항목을 확인합니다.")
+    logger.info(
+        "스케줄러가 시작되었습니다. 매일 %s, %s에 미체크 항목을 확인합니다. (작업 스레드 수: %d)",
+        check_time_1,
+        check_time_2,
+        SCHEDULER_MAX_WORKERS,
+    )
+
+
+async def shutdown_scheduler(timeout: float = None):
+    """스케줄러 종료 (앱 shutdown 이벤트에서 호출)
+
+    새 작업 실행을 멈추고, 실행 중인 작업이 끝날 때까지 최대 timeout초 기다린 뒤
+    스케줄러와 작업 스레드 풀을 종료합니다.
+    """
+    global _job_executor
+    if timeout is None:
+        timeout = SCHEDULER_SHUTDOWN_TIMEOUT
+
+    if scheduler.running:
+        scheduler.pause()
+        if _inflight_jobs:
+            logger.info("스케줄러 종료 대기: 실행 중인 작업 %d개", len(_inflight_jobs))
+            _, pending = await asyncio.wait(set(_inflight_jobs), timeout=timeout)
+            if pending:
+                logger.warning("%s초 안에 끝나지 않은 작업 %d개를 남기고 종료합니다.", timeout, len(pending))
+        scheduler.shutdown(wait=False)
+
+    if _job_executor is not None:
+        _job_executor.shutdown(wait=False, cancel_futures=True)
+        _job_executor = None
+    logger.info("스케줄러가 종료되었습니다.")
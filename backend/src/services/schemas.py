@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr
-from typing import List, Optional
+from typing import List, Optional, Union
 from datetime import date, datetime
 
 class UserLogin(BaseModel):
@@ -91,3 +91,32 @@ class ExcelExportRequest(BaseModel):
     start_date: date
     end_date: date
 
+class SchedulerJobRunResponse(BaseModel):
+    id: int
+    job_id: str
+    job_name: Optional[str] = None
+    trigger: str
+    status: str
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    duration_ms: Optional[int] = None
+    rows_scanned: Optional[int] = None
+    recipients: Optional[int] = None
+    messages_enqueued: Optional[int] = None
+    coalesced_runs: Optional[int] = None
+    over_budget: Optional[bool] = None
+    error: Optional[str] = None
+    details: Optional[str] = None
+    
+    class Config:
+        from_attributes = True
+
+class SlowQueryResponse(BaseModel):
+    id: int
+    recorded_at: datetime
+    duration_ms: float
+    route: Optional[str] = None  # 호출한 API (예: GET /api/console/fail-items), 스케줄러 작업 등은 None
+    statement: str
+    parameters: Union[list, dict]  # 파라미터 타입 이름 (값은 저장하지 않음)
+    plan: List[str]
+    full_scan_tables: List[str]
@@ -0,0 +1,198 @@
+"""느린 쿼리 기록 (실행 계획 포함)
+
+SLOW_QUERY_THRESHOLD_MS 이상 걸린 쿼리의 SQL, 파라미터 형태(값은 저장하지 않음), 소요 시간, 호출한 API와
+실행 계획(SQLite: EXPLAIN QUERY PLAN, PostgreSQL: EXPLAIN)을 메모리의 링 버퍼에 최근 SLOW_QUERY_BUFFER_SIZE개까지 보관합니다.
+console 관리자는 GET /api/console/slow-queries로 조회합니다. (서버를 재시작하면 비워짐)
+
+실행 계획에 인덱스 없이 테이블 전체를 읽는 단계(SQLite: SCAN 테이블, PostgreSQL: Seq Scan)가 있으면
+full_scan_tables에 테이블 이름을 기록하므로 checklist_records 등의 인덱스 누락을 찾을 수 있습니다.
+"""
+import logging
+import os
+import re
+import threading
+from collections import deque
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 이 시간(ms) 이상 걸린 쿼리를 기록 (0이면 기록하지 않음)
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+# 보관할 최근 느린 쿼리 수
+SLOW_QUERY_BUFFER_SIZE = int(os.getenv("SLOW_QUERY_BUFFER_SIZE", "100"))
+
+# 실행 계획을 조회할 쿼리 종류
+EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+# SQLite 3.36 이후는 "SCAN 별칭", 이전 버전은 "SCAN TABLE 테이블 AS 별칭" 형식
+_SQLITE_FULL_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?:\s|$)")
+_SQLITE_SUBQUERY = re.compile(r"^(?:CO-ROUTINE|MATERIALIZE) (\w+)")
+_POSTGRES_FULL_SCAN = re.compile(r"Seq Scan on (\w+)")
+_TABLE_ALIAS = re.compile(r'\b(?:FROM|JOIN)\s+"?(\w+)"?(?:\s+(?:AS\s+)?"?(\w+)"?)?', re.IGNORECASE)
+# FROM/JOIN 테이블 뒤에 올 수 있는 키워드 (별칭이 아님)
+_NOT_ALIAS = {
+    "WHERE", "JOIN", "INNER", "LEFT", "RIGHT", "FULL", "CROSS", "NATURAL", "OUTER", "ON", "USING",
+    "GROUP", "ORDER", "HAVING", "LIMIT", "OFFSET", "UNION", "EXCEPT", "INTERSECT", "WINDOW", "RETURNING",
+}
+
+_buffer = deque(maxlen=max(SLOW_QUERY_BUFFER_SIZE, 1))
+_lock = threading.Lock()
+_next_id = 0
+
+
+def is_slow(seconds: float) -> bool:
+    return SLOW_QUERY_THRESHOLD_MS > 0 and seconds * 1000 >= SLOW_QUERY_THRESHOLD_MS
+
+
+def _value_type(value) -> str:
+    return "NULL" if value is None else type(value).__name__
+
+
+def parameter_shape(parameters, executemany: bool = False):
+    """바인딩 파라미터의 형태 (값 대신 타입 이름만, 개인정보가 남지 않도록)"""
+    if executemany:
+        rows = list(parameters or [])
+        return {"rows": len(rows), "row": parameter_shape(rows[0]) if rows else None}
+    if isinstance(parameters, dict):
+        return {key: _value_type(value) for key, value in parameters.items()}
+    return [_value_type(value) for value in parameters or ()]
+
+
+def _sqlite_plan(cursor, statement, parameters) -> list:
+    rows = cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ()).fetchall()
+    depth = {0: -1}
+    plan = []
+    for node_id, parent_id, _, detail in rows:
+        depth[node_id] = depth.get(parent_id, -1) + 1
+        plan.append("  " * depth[node_id] + detail)
+    return plan
+
+
+def _postgres_plan(cursor, statement, parameters) -> list:
+    # EXPLAIN이 실패해도 요청의 트랜잭션이 중단되지 않도록 SAVEPOINT 안에서 실행
+    cursor.execute("SAVEPOINT slow_query_explain")
+    try:
+        cursor.execute(f"EXPLAIN {statement}", parameters)
+        plan = [row[0] for row in cursor.fetchall()]
+    except Exception:
+        cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+        raise
+    finally:
+        cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+    return plan
+
+
+def explain(conn, statement: str, parameters, executemany: bool = False) -> list:
+    """쿼리를 실행했던 연결에서 실행 계획 조회 (쿼리를 다시 실행하지 않음)"""
+    if executemany or not statement.lstrip()[:6].upper().startswith(EXPLAINABLE):
+        return []
+    cursor = conn.connection.cursor()
+    try:
+        if conn.dialect.name == "sqlite":
+            return _sqlite_plan(cursor, statement, parameters)
+        if conn.dialect.name == "postgresql":
+            return _postgres_plan(cursor, statement, parameters)
+        return []
+    except Exception as e:
+        return [f"실행 계획 조회 실패: {e}"]
+    finally:
+        cursor.close()
+
+
+def table_aliases(statement: str) -> dict:
+    """SQL의 FROM/JOIN 절에서 {별칭: 테이블 이름} (별칭이 없는 테이블은 자기 자신)"""
+    aliases = {}
+    for table, alias in _TABLE_ALIAS.findall(statement or ""):
+        aliases.setdefault(table, table)
+        if alias and alias.upper() not in _NOT_ALIAS:
+            aliases.setdefault(alias, table)
+    return aliases
+
+
+def full_scan_tables(plan: list, statement: str = None) -> list:
+    """실행 계획에서 인덱스 없이 전체를 읽는 테이블 이름
+
+    SQLite 실행 계획에는 별칭이 나오므로 statement의 FROM/JOIN 절로 테이블 이름을 찾고,
+    찾지 못하면 실행 계획의 이름을 그대로 기록합니다. 서브쿼리 결과를 읽는 SCAN은 제외합니다.
+    """
+    aliases = table_aliases(statement)
+    subqueries = set()
+    for line in plan:
+        match = _SQLITE_SUBQUERY.match(line.strip())
+        if match:
+            subqueries.add(match.group(1))
+
+    tables = []
+    for line in plan:
+        line = line.strip()
+        match = _SQLITE_FULL_SCAN.match(line)
+        if match:
+            name = match.group(1)
+            if "USING" in line[match.end():] or name in subqueries or line == "SCAN CONSTANT ROW":
+                continue
+            table = aliases.get(name, name)
+        else:
+            match = _POSTGRES_FULL_SCAN.search(line)
+            if not match:
+                continue
+            table = match.group(1)
+        if table not in tables:
+            tables.append(table)
+    return tables
+
+
+def record_slow_query(conn, statement: str, parameters, executemany: bool, seconds: float, route: str = None):
+    """느린 쿼리를 실행 계획과 함께 링 버퍼에 기록"""
+    global _next_id
+    plan = explain(conn, statement, parameters, executemany)
+    entry = {
+        "recorded_at": datetime.now(),
+        "duration_ms": round(seconds * 1000, 1),
+        "route": route,
+        "statement": statement,
+        "parameters": parameter_shape(parameters, executemany),
+        "plan": plan,
+        "full_scan_tables": full_scan_tables(plan, statement),
+    }
+    with _lock:
+        _next_id += 1
+        entry["id"] = _next_id
+        _buffer.append(entry)
+
+    logger.warning(
+        "느린 쿼리 %sms (%s)%s - %s",
+        entry["duration_ms"],
+        route or "요청 외",
+        f" 전체 스캔: {', '.join(entry['full_scan_tables'])}" if entry["full_scan_tables"] else "",
+        " ".join(statement.split())[:200],
+        extra={"slow_query_id": entry["id"]},
+    )
+
+
+def recent_slow_queries(limit: int = None, table: str = None, full_scan_only: bool = False) -> list:
+    """기록된 느린 쿼리 (최신순)
+
+    Args:
+        table: 이 테이블을 사용하는 쿼리만
+        full_scan_only: True이면 전체 스캔이 있는 쿼리만
+    """
+    with _lock:
+        entries = list(reversed(_buffer))
+    if table:
+        pattern = re.compile(rf'\b"?{re.escape(table)}"?\b')
+        entries = [entry for entry in entries if pattern.search(entry["statement"])]
+    if full_scan_only:
+        entries = [entry for entry in entries if entry["full_scan_tables"]]
+    return entries[:limit] if limit else entries
+
+
+def clear_slow_queries() -> int:
+    """기록 비우기, 삭제한 개수 반환"""
+    with _lock:
+        count = len(_buffer)
+        _buffer.clear()
+    return count
@@ -0,0 +1,131 @@
+"""체크 기록/로그 상태 컬럼 인코딩 변경 (문자열 → SMALLINT)
+
+checklist_records.status, checklist_records_logs.status/action을 문자열(VARCHAR)에서
+작은 정수 코드(models.RECORD_STATUS_CODES, models.LOG_ACTION_CODES)로 바꿉니다.
+API/코드에서는 계속 'PASS', 'CREATE' 같은 문자열로 사용합니다.
+
+- SQLite: 컬럼 타입을 바꿀 수 없으므로 새 테이블을 만들어 변환한 값을 복사한 뒤 기존 테이블을 삭제합니다.
+- PostgreSQL: ALTER COLUMN ... TYPE SMALLINT USING CASE ...
+테이블 하나를 한 트랜잭션에서 변환하므로, 중간에 실패하면 해당 테이블은 변경되지 않습니다.
+상태 컬럼을 참조하는 VIEW(checklist_records_view)는 삭제되므로 utils/create_views.py로 다시 생성합니다.
+"""
+from sqlalchemy import CheckConstraint, inspect
+from sqlalchemy.types import Integer
+
+from models.models import ChecklistRecord, ChecklistRecordLog, RECORD_STATUS_CODES, LOG_ACTION_CODES
+
+# {모델: {컬럼: 코드}}
+ENCODED_COLUMNS = {
+    ChecklistRecord: {"status": RECORD_STATUS_CODES},
+    ChecklistRecordLog: {"status": RECORD_STATUS_CODES, "action": LOG_ACTION_CODES},
+}
+
+# 상태 컬럼을 참조하는 VIEW (변환 전에 삭제)
+DEPENDENT_VIEWS = ("checklist_records_view",)
+
+
+def legacy_status_tables(engine) -> list:
+    """상태가 아직 문자열로 저장된 테이블 이름 목록"""
+    inspector = inspect(engine)
+    tables = []
+    for model, columns in ENCODED_COLUMNS.items():
+        table_name = model.__tablename__
+        if not inspector.has_table(table_name):
+            continue
+        column_types = {column["name"]: column["type"] for column in inspector.get_columns(table_name)}
+        if any(not isinstance(column_types.get(name), Integer) for name in columns):
+            tables.append(table_name)
+    return tables
+
+
+def _case_sql(column_name: str, codes: dict) -> str:
+    whens = " ".join(f"WHEN '{name}' THEN {code}" for name, code in codes.items())
+    return f"CASE {column_name} {whens} END"
+
+
+def _migrate_sqlite(conn, model, columns: dict) -> int:
+    table = model.__table__
+    legacy_name = f"{table.name}_legacy"
+    inspector = inspect(conn)
+
+    # pysqlite는 DDL을 트랜잭션 밖에서 실행하므로, 테이블 변환 전체를 명시적 트랜잭션으로 묶음
+    conn.exec_driver_sql("BEGIN")
+
+    # 인덱스 이름이 새 테이블과 겹치지 않도록 기존 인덱스 삭제 (모델에 없는 인덱스는 변환 후 다시 생성)
+    old_indexes = inspector.get_indexes(table.name)
+    for index in old_indexes:
+        conn.exec_driver_sql(f'DROP INDEX IF EXISTS "{index["name"]}"')
+
+    conn.exec_driver_sql(f'ALTER TABLE "{table.name}" RENAME TO "{legacy_name}"')
+    table.create(conn)
+
+    column_names = [column.name for column in table.columns]
+    select_sql = ", ".join(
+        _case_sql(f'"{name}"', columns[name]) if name in columns else f'"{name}"' for name in column_names
+    )
+    quoted = ", ".join(f'"{name}"' for name in column_names)
+    conn.exec_driver_sql(f'INSERT INTO "{table.name}" ({quoted}) SELECT {select_sql} FROM "{legacy_name}"')
+
+    copied = conn.exec_driver_sql(f'SELECT COUNT(*) FROM "{table.name}"').scalar()
+    original = conn.exec_driver_sql(f'SELECT COUNT(*) FROM "{legacy_name}"').scalar()
+    if copied != original:
+        raise RuntimeError(f"{table.name}: 복사한 행 수가 맞지 않습니다 ({copied} != {original})")
+    conn.exec_driver_sql(f'DROP TABLE "{legacy_name}"')
+
+    model_indexes = {index.name for index in table.indexes}
+    for index in old_indexes:
+        if index["name"] in model_indexes:
+            continue
+        unique = "UNIQUE " if index.get("unique") else ""
+        index_columns = ", ".join(f'"{name}"' for name in index["column_names"])
+        conn.exec_driver_sql(f'CREATE {unique}INDEX "{index["name"]}" ON "{table.name}" ({index_columns})')
+    return copied
+
+
+def _migrate_postgresql(conn, model, columns: dict) -> int:
+    table = model.__table__
+    inspector = inspect(conn)
+
+    # 문자열 값을 검사하는 기존 CHECK 제약조건 삭제 후 타입 변경, 모델의 제약조건 다시 생성
+    for constraint in inspector.get_check_constraints(table.name):
+        if any(name in constraint["sqltext"] for name in columns):
+            conn.exec_driver_sql(f'ALTER TABLE "{table.name}" DROP CONSTRAINT "{constraint["name"]}"')
+    for name, codes in columns.items():
+        conn.exec_driver_sql(
+            f'ALTER TABLE "{table.name}" ALTER COLUMN "{name}" TYPE SMALLINT USING {_case_sql(f"{name}", codes)}'
+        )
+    for constraint in table.constraints:
+        if isinstance(constraint, CheckConstraint):
+            conn.exec_driver_sql(
+                f'ALTER TABLE "{table.name}" ADD CONSTRAINT "{constraint.name}" CHECK ({constraint.sqltext})'
+            )
+    return conn.exec_driver_sql(f'SELECT COUNT(*) FROM "{table.name}"').scalar()
+
+
+def migrate_status_encoding(engine, dry_run: bool = False) -> dict:
+    """문자열로 저장된 상태 컬럼을 SMALLINT 코드로 변환
+
+    Args:
+        dry_run: True이면 변환할 테이블만 확인
+
+    Returns:
+        dict: {"tables": {테이블: 변환한 행 수}, "views_dropped": [...]}
+    """
+    legacy = legacy_status_tables(engine)
+    stats = {"tables": {name: None for name in legacy}, "views_dropped": []}
+    if dry_run or not legacy:
+        return stats
+
+    migrate = _migrate_sqlite if engine.dialect.name == "sqlite" else _migrate_postgresql
+    existing_views = set(inspect(engine).get_view_names())
+    for model, columns in ENCODED_COLUMNS.items():
+        if model.__tablename__ not in legacy:
+            continue
+        with engine.begin() as conn:
+            for view in DEPENDENT_VIEWS:
+                if view in existing_views:
+                    conn.exec_driver_sql(f'DROP VIEW IF EXISTS "{view}"')
+                    existing_views.discard(view)
+                    stats["views_dropped"].append(view)
+            stats["tables"][model.__tablename__] = migrate(conn, model, columns)
+    return stats
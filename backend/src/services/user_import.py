@@ -0,0 +1,223 @@
+"""사용자 데이터 import 엔진
+
+조직도 CSV/XLSX 파일을 읽어 사원번호(employee_id) 기준으로 사용자를 bulk upsert 합니다.
+
+- 기존 사용자는 import 시작 시 한 번 조회한 맵으로 매칭하므로 행마다 DB를 조회하지 않습니다.
+- 새 사용자는 bulk INSERT, 정보가 바뀐 사용자만 bulk UPDATE 합니다. (한 트랜잭션)
+- 기존 사용자의 비밀번호는 변경하지 않습니다.
+
+비밀번호 해시 (bcrypt는 1회 100~300ms):
+- 기본: 새 사용자의 초기 비밀번호(DEFAULT_PASSWORD) 해시를 한 번만 계산해 공유합니다.
+- unique_salts=True: 사용자마다 다른 salt로 해시하며, 프로세스 풀(workers)로 병렬 계산합니다.
+
+파일 형식 (CSV 또는 XLSX 첫 번째 시트, 첫 행은 헤더):
+부문, 총괄본부, 본부, 부서, 사원번호, 사원명, 직위, 직책, 이메일, ...
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from models.models import User
+from services.auth import get_password_hash
+from services.import_readers import iter_dict_rows
+
+DEFAULT_PASSWORD = "1234"  # 새 사용자 초기 비밀번호
+DEFAULT_BATCH_SIZE = 1000
+
+# upsert 시 비교/갱신하는 필드
+USER_FIELDS = ("name", "email", "division", "general_headquarters", "department", "position", "role")
+
+
+@dataclass
+class UserRow:
+    """CSV 한 행 (사용자 1명)"""
+
+    row_number: int
+    employee_id: str
+    name: str
+    email: str
+    division: Optional[str] = None
+    general_headquarters: Optional[str] = None
+    department: Optional[str] = None
+    position: Optional[str] = None
+    role: Optional[str] = None
+
+    def values(self) -> dict:
+        return {name: getattr(self, name) for name in USER_FIELDS}
+
+
+@dataclass
+class UserImportResult:
+    """사용자 import 결과 요약"""
+
+    rows: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+    created_ids: List[str] = field(default_factory=list)
+    updated_ids: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    hash_seconds: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
+def parse_user_row(row_number: int, row: dict) -> UserRow:
+    """파일 행(dict)을 UserRow로 변환 (필수 필드 누락 시 ValueError)"""
+
+    def value(key):
+        return (row.get(key) or "").strip() or None
+
+    employee_id, name, email = value("사원번호"), value("사원명"), value("이메일")
+    if not employee_id or not name or not email:
+        raise ValueError(f"필수 필드 누락: 사원번호={employee_id}, 이름={name}, 이메일={email}")
+
+    return UserRow(
+        row_number=row_number,
+        employee_id=employee_id,
+        name=name,
+        email=email,
+        division=value("부문"),
+        general_headquarters=value("총괄본부"),
+        department=value("부서"),
+        position=value("직위"),
+        role=value("직책"),
+    )
+
+
+def iter_user_rows(file_path, warnings: list = None) -> Iterator[UserRow]:
+    """CSV/XLSX 파일을 한 행씩 읽어 UserRow로 반환
+
+    필수 필드가 없는 행은 건너뛰고 warnings 리스트에 사유를 추가합니다.
+    """
+    for row_number, row in iter_dict_rows(file_path):
+        try:
+            yield parse_user_row(row_number, row)
+        except ValueError as e:
+            if warnings is not None:
+                warnings.append(f"{row_number}행 - {e}. 건너뜁니다.")
+
+
+def hash_passwords(passwords: List[str], workers: int = None) -> List[str]:
+    """비밀번호 목록을 프로세스 풀에서 병렬로 해시 (bcrypt는 CPU 바운드라 스레드로는 빨라지지 않음)
+
+    Args:
+        passwords: 평문 비밀번호 목록
+        workers: 프로세스 수 (기본값: CPU 수)
+    """
+    if not passwords:
+        return []
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(passwords) == 1:
+        return [get_password_hash(password) for password in passwords]
+    with ProcessPoolExecutor(max_workers=min(workers, len(passwords))) as pool:
+        return list(pool.map(get_password_hash, passwords, chunksize=max(1, len(passwords) // (workers * 4))))
+
+
+def import_users(
+    db: Session,
+    file_path,
+    default_password: str = DEFAULT_PASSWORD,
+    unique_salts: bool = False,
+    workers: int = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    commit_each_batch: bool = False,
+    progress=None,
+) -> UserImportResult:
+    """사용자 데이터 import (사원번호 기준 bulk upsert)
+
+    Args:
+        db: DB 세션
+        file_path: CSV 또는 XLSX 파일 경로
+        default_password: 새 사용자 초기 비밀번호
+        unique_salts: True이면 새 사용자마다 별도 salt로 해시 (프로세스 풀 사용)
+        workers: unique_salts 사용 시 프로세스 수
+        batch_size: 한 번에 INSERT/UPDATE할 행 수
+        commit_each_batch: True이면 배치마다 커밋하여 쓰기 잠금을 짧게 유지 (False이면 한 트랜잭션)
+        progress: 진행 상황 콜백 progress(처리한 행 수, phase). 파일을 읽은 뒤 phase="reading",
+            commit_each_batch=True이면 배치를 커밋할 때마다 phase="writing"으로 반영한 사용자 수를 넘깁니다.
+
+    Returns:
+        UserImportResult
+    """
+    result = UserImportResult()
+    started = time.perf_counter()
+
+    try:
+        # 1. 파일 읽기 (같은 사원번호가 여러 번 나오면 첫 행 사용)
+        rows = {}
+        for row in iter_user_rows(file_path, result.warnings):
+            if row.employee_id in rows:
+                result.warnings.append(
+                    f"{row.row_number}행 - 사원번호 {row.employee_id} 중복 "
+                    f"({rows[row.employee_id].row_number}행 사용). 건너뜁니다."
+                )
+                continue
+            rows[row.employee_id] = row
+        result.skipped = len(result.warnings)  # 필수 필드 누락 + 사원번호 중복
+        result.rows = len(rows) + result.skipped
+        if progress:
+            progress(result.rows)
+
+        # 2. 기존 사용자 조회 (한 번만)
+        columns = [getattr(User, name) for name in USER_FIELDS]
+        existing = {}  # {employee_id: (id, {field: value})}
+        for user_id, employee_id, *values in db.query(User.id, User.employee_id, *columns):
+            existing[employee_id] = (user_id, dict(zip(USER_FIELDS, values)))
+
+        # 3. 추가/변경 분류
+        new_rows, changed = [], []
+        for employee_id, row in rows.items():
+            values = row.values()
+            if employee_id not in existing:
+                new_rows.append(row)
+                result.created_ids.append(employee_id)
+            elif existing[employee_id][1] != values:
+                changed.append({"id": existing[employee_id][0], **values})
+                result.updated_ids.append(employee_id)
+            else:
+                result.unchanged += 1
+
+        # 4. 새 사용자 비밀번호 해시
+        hash_started = time.perf_counter()
+        if unique_salts:
+            hashes = hash_passwords([default_password] * len(new_rows), workers)
+        else:
+            shared_hash = get_password_hash(default_password) if new_rows else None
+            hashes = [shared_hash] * len(new_rows)
+        result.hash_seconds = time.perf_counter() - hash_started
+
+        # 5. bulk INSERT / UPDATE
+        new_users = [
+            {"employee_id": row.employee_id, "password_hash": password_hash, **row.values()}
+            for row, password_hash in zip(new_rows, hashes)
+        ]
+        written = 0
+        for rows_batch, statement in ((new_users, insert(User)), (changed, update(User))):
+            for start in range(0, len(rows_batch), batch_size):
+                chunk = rows_batch[start : start + batch_size]
+                db.execute(statement, chunk)
+                if commit_each_batch:
+                    db.commit()
+                    written += len(chunk)
+                    if progress:
+                        progress(written, "writing")
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    result.created = len(new_users)
+    result.updated = len(changed)
+    result.elapsed = time.perf_counter() - started
+    return result
@@ -1,13 +1,12 @@
 """
 users 테이블 백업 및 이메일 변경 스크립트
 
-1. users 테이블을 백업 테이블로 복사
+1. DB 스냅샷 생성 (database/snapshots/, 운영 DB에 백업 테이블을 만들지 않음)
 2. 모든 사용자의 email을 테스트 이메일로 변경
-3. 나중에 복구할 수 있도록 백업 테이블 유지
+3. 나중에 restore_user_emails.py로 스냅샷에서 이메일만 복구
 """
 import sys
 from pathlib import Path
-from datetime import datetime
 
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
@@ -15,6 +14,7 @@ sys.path.insert(0, str(project_root / "backend" / "src"))
 
 from sqlalchemy import text
 from services.database import SessionLocal
+from services.db_snapshot import create_snapshot
 
 # 테스트 이메일 주소
 TEST_EMAIL = "kimhs@ajnet.co.kr"
@@ -28,21 +28,12 @@ def backup_and_update_emails():
         print("users 테이블 백업 및 이메일 변경")
         print("="*60)
         
-        # 1. 백업 테이블 생성 (타임스탬프 포함)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_table_name = f"users_backup_{timestamp}"
-        
-        print(f"\n[1단계] 백업 테이블 생성: {backup_table_name}")
-        db.execute(text(f"""
-            CREATE TABLE IF NOT EXISTS {backup_table_name} AS
-            SELECT * FROM users
-        """))
-        db.commit()
-        
-        # 백업된 행 수 확인
-        result = db.execute(text(f"SELECT COUNT(*) FROM {backup_table_name}"))
+        # 1. 스냅샷 생성 (서버 실행 중에도 쓰기를 막지 않음)
+        print("\n[1단계] DB 스냅샷 생성")
+        snapshot_path = create_snapshot("user_emails")
+        result = db.execute(text("SELECT COUNT(*) FROM users"))
         backup_count = result.scalar()
-        print(f"  백업 완료: {backup_count}개 행")
+        print(f"  백업 완료: {snapshot_path.name} (users {backup_count}개 행)")
         
         # 2. 현재 이메일 상태 확인
         print("\n[2단계] 현재 이메일 상태 확인")
@@ -108,10 +99,10 @@ def backup_and_update_emails():
         print("\n" + "="*60)
         print("백업 및 이메일 변경 완료!")
         print("="*60)
-        print(f"\n백업 테이블: {backup_table_name}")
+        print(f"\n스냅샷: {snapshot_path}")
         print(f"테스트 이메일: {TEST_EMAIL}")
         print("\n복구 방법:")
-        print(f"  python backend/src/utils/restore_user_emails.py {backup_table_name}")
+        print(f"  python backend/src/utils/restore_user_emails.py {snapshot_path.name}")
         print("="*60)
         
     except Exception as e:
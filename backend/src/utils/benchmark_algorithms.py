@@ -0,0 +1,368 @@
+"""
+핵심 백엔드 알고리즘 마이크로 벤치마크 스크립트
+
+메모리 SQLite DB에 크기별(--items) 고정 데이터를 만들고, 라우트/스케줄러에서 쓰는 알고리즘을 반복 실행하여
+중앙값/최소/평균 시간을 측정합니다. 데이터는 generate_synthetic_data.py와 같은 방식으로 seed 고정 생성합니다.
+(체크 항목 N개, 시스템 N/20개, 사용자 N/10명, 평일 FIXTURE_DAYS일, 마지막 날은 일부만 체크된 "오늘")
+
+벤치마크
+- fail_history.group_status_history: 오늘 로그를 항목별 시간순 이력으로 그룹화 (console FAIL 항목)
+- fail_history.summarize_fail_history: 항목별 이력 상태 분석 (최종 FAIL, 첫/최신 FAIL)
+- day_close.final_records: 기간 체크 기록의 (항목, 날짜)별 최종 기록 선택 (엑셀 다운로드 중복 제거)
+- day_close.build_day_rows: 체크 항목 x 날짜 행 생성 (엑셀 다운로드)
+- day_close.count_statuses_by_date: 날짜별 상태 수 (엑셀 통계 시트)
+- day_close.load_daily_results: 스냅샷 + 마감 전 기록 조회 전체 (DB 포함)
+- scheduler.group_unchecked_items: 미체크 항목 담당자 수집/시스템별 그룹화 (DB 포함)
+
+결과는 --save로 database/benchmarks/<커밋>.json에 저장하고, 다른 커밋에서 --compare <커밋 또는 파일>로 비교합니다.
+중앙값이 --max-regression(%) 넘게 늘어난 벤치마크가 있으면 종료 코드 1을 반환합니다.
+(같은 머신에서 측정한 결과끼리 비교하세요)
+pytest로도 같은 벤치마크를 실행하고 기준선을 저장할 수 있습니다. (backend/tests/test_benchmarks.py)
+
+사용법:
+    python backend/src/utils/benchmark_algorithms.py [--items 500,1000] [--rounds 5] [--filter day_close]
+
+예시:
+    python backend/src/utils/benchmark_algorithms.py --save                   # 현재 커밋 기준선 저장
+    python backend/src/utils/benchmark_algorithms.py --compare 1a2b3c4       # 기준선과 비교
+    python backend/src/utils/benchmark_algorithms.py --json > result.json
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "backend" / "src"))
+
+BENCHMARK_DIR = project_root / "database" / "benchmarks"
+
+FIXTURE_END_DATE = date(2025, 6, 13)  # 고정 데이터의 "오늘" (금요일)
+FIXTURE_DAYS = 14  # 고정 데이터 기간 (주말 포함 일수)
+MIN_ROUND_SECONDS = 0.05  # 측정 1회의 최소 시간 (빠른 함수는 여러 번 호출)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="핵심 백엔드 알고리즘 마이크로 벤치마크")
+    parser.add_argument(
+        "--items",
+        default="500,1000",
+        type=lambda value: [int(size) for size in value.split(",")],
+        help="고정 데이터의 체크 항목 수, 쉼표로 여러 크기 지정 (기본값: 500,1000)",
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="벤치마크별 측정 횟수 (기본값: 5, 별도 워밍업 1회)")
+    parser.add_argument(
+        "--max-seconds", type=float, default=10, help="벤치마크별 측정 시간 한도, 넘으면 측정 횟수를 줄임 (초, 기본값: 10)"
+    )
+    parser.add_argument("--filter", help="이름에 이 문자열이 포함된 벤치마크만 실행")
+    parser.add_argument("--seed", type=int, default=42, help="고정 데이터 난수 시드 (기본값: 42)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    parser.add_argument(
+        "--save",
+        nargs="?",
+        const="",
+        help="결과를 JSON 기준선으로 저장 (경로 생략 시 database/benchmarks/<커밋>.json)",
+    )
+    parser.add_argument("--compare", help="비교할 기준선 (JSON 파일 경로 또는 database/benchmarks의 커밋 ID)")
+    parser.add_argument("--max-regression", type=float, default=20, help="허용할 중앙값 증가율 (%%, 기본값: 20)")
+    return parser.parse_args()
+
+
+def git_commit() -> str:
+    """현재 커밋 ID (변경 사항이 있으면 -dirty, git이 없으면 unknown)"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=project_root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=project_root, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def build_fixture(item_count: int, seed: int):
+    """메모리 SQLite DB에 고정 데이터 생성, (엔진, 통계) 반환"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from sqlalchemy.pool import StaticPool
+
+    from models.models import User, System, CheckItem, UserSystemAssignment
+    from services.database import Base
+    from services.daily_slots import create_daily_slots
+    from utils.generate_synthetic_data import BatchWriter, build_catalog, build_users, generate_history
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+
+    rng = random.Random(seed)
+    start_date = FIXTURE_END_DATE - timedelta(days=FIXTURE_DAYS - 1)
+    created_at = datetime.combine(start_date, datetime.min.time()) - timedelta(days=1)
+    history_args = SimpleNamespace(fail_rate=0.03, coverage=0.95)
+    with engine.connect() as conn:
+        writer = BatchWriter(conn, 20000)
+        users = build_users(rng, max(10, item_count // 10), "-", created_at)
+        staff_ids = [user["id"] for user in users if user["position"] in ("사원", "파트장")]
+        systems, items, assignments, assignees_by_system, fail_rates = build_catalog(
+            rng, max(1, item_count // 20), item_count, staff_ids, users, created_at
+        )
+        for model, rows in ((User, users), (System, systems), (CheckItem, items), (UserSystemAssignment, assignments)):
+            writer.extend(model, rows)
+        generate_history(
+            rng, writer, users, systems, items, assignees_by_system, fail_rates, history_args,
+            start_date, FIXTURE_END_DATE, snapshots=True,
+        )
+        writer.flush()
+        counts = dict(writer.counts)
+
+    with Session(engine) as db:
+        counts["checklist_daily_slots"] = create_daily_slots(db, FIXTURE_END_DATE)["created"]
+    return engine, counts
+
+
+def define_benchmarks(engine) -> list:
+    """[(이름, 입력 크기, 측정할 함수), ...] - 입력 준비(조회)는 측정에서 제외"""
+    from sqlalchemy.orm import Session
+
+    from models.models import ChecklistRecordLog
+    from services.day_close import (
+        build_day_rows,
+        count_statuses_by_date,
+        final_records,
+        load_daily_results,
+        load_item_catalog,
+    )
+    from services.daily_slots import unchecked_items
+    from services.fail_history import group_status_history, summarize_fail_history
+    from services.record_archive import load_records
+    from services.scheduler import group_unchecked_items
+
+    start_date = FIXTURE_END_DATE - timedelta(days=FIXTURE_DAYS - 1)
+    with Session(engine, expire_on_commit=False) as db:
+        today_logs = (
+            db.query(ChecklistRecordLog)
+            .filter(ChecklistRecordLog.check_date == FIXTURE_END_DATE)
+            .order_by(ChecklistRecordLog.created_at)
+            .all()
+        )
+        records = load_records(db, start_date, FIXTURE_END_DATE)
+        catalog = load_item_catalog(db)
+        daily_rows = load_daily_results(db, start_date, FIXTURE_END_DATE)
+        unchecked = unchecked_items(db, FIXTURE_END_DATE)
+        db.expunge_all()
+
+    histories = list(group_status_history(today_logs).values())
+    latest = final_records(records)
+    record_dates = sorted({record.check_date for record in records})
+
+    def summarize_all():
+        for history in histories:
+            summarize_fail_history(history)
+
+    def build_all_days():
+        for target_date in record_dates:
+            build_day_rows(catalog, latest, target_date)
+
+    def with_session(func):
+        def run():
+            with Session(engine) as db:
+                func(db)
+
+        return run
+
+    return [
+        ("fail_history.group_status_history", len(today_logs), lambda: group_status_history(today_logs)),
+        ("fail_history.summarize_fail_history", len(histories), summarize_all),
+        ("day_close.final_records", len(records), lambda: final_records(records)),
+        ("day_close.build_day_rows", len(catalog) * len(record_dates), build_all_days),
+        ("day_close.count_statuses_by_date", len(daily_rows), lambda: count_statuses_by_date(daily_rows)),
+        (
+            "day_close.load_daily_results",
+            len(daily_rows),
+            with_session(lambda db: load_daily_results(db, start_date, FIXTURE_END_DATE)),
+        ),
+        (
+            "scheduler.group_unchecked_items",
+            len(unchecked),
+            with_session(lambda db: group_unchecked_items(db, unchecked)),
+        ),
+    ]
+
+
+def measure(func, rounds: int, max_seconds: float) -> dict:
+    """워밍업 1회 후 최대 rounds회 측정 (호출 1회당 ms)
+
+    빠른 함수는 한 회에 MIN_ROUND_SECONDS 이상 걸리도록 여러 번(loops) 호출하여 타이머 오차를 줄이고,
+    측정 누적 시간이 max_seconds를 넘으면 중단합니다(최소 1회). 워밍업만으로 max_seconds를 넘는
+    느린 벤치마크는 워밍업 결과를 측정값으로 사용합니다.
+    """
+    started = time.perf_counter()
+    func()
+    warmup = time.perf_counter() - started
+    loops = max(1, math.ceil(MIN_ROUND_SECONDS / warmup)) if warmup > 0 else 1
+    timings = [warmup * 1000] if warmup >= max_seconds else []
+
+    measured = sum(timings) / 1000
+    while len(timings) < max(rounds, 1) and (not timings or measured < max_seconds):
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - started
+        timings.append(elapsed / loops * 1000)
+        measured += elapsed
+    return {
+        "rounds": len(timings),
+        "loops": loops,
+        "median_ms": statistics.median(timings),
+        "min_ms": min(timings),
+        "mean_ms": statistics.fmean(timings),
+    }
+
+
+def run_fixture_benchmarks(item_count: int, seed: int, rounds: int, max_seconds: float, name_filter: str = None):
+    """고정 데이터 한 크기의 벤치마크 실행, (고정 데이터 통계, {"이름[items=N]": 측정 결과}) 반환"""
+    engine, counts = build_fixture(item_count, seed)
+    results = {}
+    try:
+        for name, size, func in define_benchmarks(engine):
+            if name_filter and name_filter not in name:
+                continue
+            print(f"  {name}", file=sys.stderr)
+            results[f"{name}[items={item_count}]"] = {"n": size, **measure(func, rounds, max_seconds)}
+    finally:
+        engine.dispose()
+    return counts, results
+
+
+def benchmark_meta(rounds: int, max_seconds: float, seed: int) -> dict:
+    """기준선 JSON의 meta (커밋, 실행 환경, 측정 설정)"""
+    import sqlalchemy
+
+    return {
+        "commit": git_commit(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "machine": platform.machine(),
+        "rounds": rounds,
+        "max_seconds": max_seconds,
+        "seed": seed,
+    }
+
+
+def run_benchmarks(args) -> dict:
+    results = {}
+    fixtures = {}
+    for item_count in args.items:
+        print(f"고정 데이터 생성 중 (체크 항목 {item_count:,}개)...", file=sys.stderr)
+        counts, fixture_results = run_fixture_benchmarks(
+            item_count, args.seed, args.rounds, args.max_seconds, args.filter
+        )
+        fixtures[str(item_count)] = counts
+        results.update(fixture_results)
+
+    return {
+        "meta": benchmark_meta(args.rounds, args.max_seconds, args.seed),
+        "fixtures": fixtures,
+        "results": results,
+    }
+
+
+def save_baseline(result: dict, path: Path = None) -> Path:
+    """결과를 JSON 기준선으로 저장 (경로 생략 시 database/benchmarks/<커밋>.json), 저장한 경로 반환"""
+    save_path = Path(path) if path else BENCHMARK_DIR / f"{result['meta']['commit']}.json"
+    save_path.parent.mkdir(parents=True, exist_ok=True)
+    save_path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    return save_path
+
+
+def resolve_baseline(value: str) -> Path:
+    """--compare 값(파일 경로 또는 커밋 ID)을 기준선 파일 경로로 변환"""
+    path = Path(value)
+    if path.is_file():
+        return path
+    matches = sorted(BENCHMARK_DIR.glob(f"{value}*.json")) if BENCHMARK_DIR.exists() else []
+    if not matches:
+        print(f"[ERROR] 기준선을 찾을 수 없습니다: {value} ({BENCHMARK_DIR})")
+        sys.exit(1)
+    return matches[-1]
+
+
+def compare(result: dict, baseline: dict, max_regression: float) -> list:
+    """[(이름, 이전 중앙값, 현재 중앙값, 변화율, 회귀 여부), ...] - 양쪽에 있는 벤치마크만"""
+    rows = []
+    for name, current in result["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        change = (current["median_ms"] - before["median_ms"]) / before["median_ms"] * 100 if before["median_ms"] else 0.0
+        rows.append((name, before["median_ms"], current["median_ms"], change, change > max_regression))
+    return rows
+
+
+def print_report(result: dict):
+    meta = result["meta"]
+    print("=" * 96)
+    print(f"알고리즘 벤치마크 (커밋 {meta['commit']}, Python {meta['python']}, 측정 {meta['rounds']}회)")
+    print("=" * 96)
+    for item_count, counts in result["fixtures"].items():
+        print(
+            f"고정 데이터 items={item_count}: 기록 {counts.get('checklist_records', 0):,}건, "
+            f"로그 {counts.get('checklist_records_logs', 0):,}건, 스냅샷 {counts.get('checklist_daily_snapshots', 0):,}건"
+        )
+    print(f"\n{'벤치마크':<56} {'입력':>8} {'중앙값(ms)':>11} {'최소(ms)':>10} {'평균(ms)':>10} {'횟수':>4}")
+    print("-" * 96)
+    for name, entry in result["results"].items():
+        print(
+            f"{name:<56} {entry['n']:>8,} {entry['median_ms']:>11.2f} {entry['min_ms']:>10.2f} "
+            f"{entry['mean_ms']:>10.2f} {entry['rounds']:>4}"
+        )
+    print("=" * 96)
+
+
+def print_comparison(rows: list, baseline_commit: str, file=None):
+    print(f"\n기준선 {baseline_commit} 대비 중앙값", file=file)
+    print(f"{'벤치마크':<56} {'이전(ms)':>10} {'현재(ms)':>10} {'변화':>9}", file=file)
+    print("-" * 96, file=file)
+    for name, before, current, change, regressed in rows:
+        print(
+            f"{name:<56} {before:>10.2f} {current:>10.2f} {change:>+8.1f}%{'  << 회귀' if regressed else ''}",
+            file=file,
+        )
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    from services.logging_config import setup_logging
+
+    setup_logging(log_format="text")
+    result = run_benchmarks(args)
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print_report(result)
+
+    if args.save is not None:
+        save_path = save_baseline(result, args.save or None)
+        print(f"\n기준선 저장: {save_path}", file=sys.stderr)
+
+    if args.compare:
+        baseline = json.loads(resolve_baseline(args.compare).read_text(encoding="utf-8"))
+        rows = compare(result, baseline, args.max_regression)
+        # --json이면 결과 JSON과 섞이지 않도록 비교 표는 stderr로 출력
+        print_comparison(rows, baseline["meta"]["commit"], file=sys.stderr if args.json else None)
+        if any(row[-1] for row in rows):
+            print(f"\n[FAIL] 중앙값이 {args.max_regression}% 넘게 늘어난 벤치마크가 있습니다.", file=sys.stderr)
+            sys.exit(1)
@@ -0,0 +1,242 @@
+"""미체크 알림 파이프라인(check_unchecked_items) 벤치마크 스크립트
+
+임시 SQLite DB에 사용자 N명, 미체크 항목 M개를 생성한 뒤 로컬 SMTP 싱크(smtp_sink.py)를
+상대로 알림 사이클을 실행하고 쿼리 수, 본문 렌더링 시간, SMTP 시간, 초당 메일 수를 출력합니다.
+실제 DB(database/qa_checklist.db)와 실제 메일 서버에는 접근하지 않습니다.
+
+사용법:
+    python backend/src/utils/benchmark_reminder.py [--users N] [--items M] [--cycles C]
+
+예시:
+    python backend/src/utils/benchmark_reminder.py --users 500 --items 5000 --cycles 3
+    python backend/src/utils/benchmark_reminder.py --json > before.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "backend" / "src"))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="미체크 알림 파이프라인 벤치마크")
+    parser.add_argument("--users", type=int, default=200, help="생성할 담당자 수 (기본값: 200)")
+    parser.add_argument("--items", type=int, default=2000, help="생성할 미체크 항목 수 (기본값: 2000)")
+    parser.add_argument("--items-per-system", type=int, default=20, help="시스템당 항목 수 (기본값: 20)")
+    parser.add_argument("--assignees-per-system", type=int, default=2, help="시스템당 담당자 수 (기본값: 2)")
+    parser.add_argument("--cycles", type=int, default=3, help="알림 사이클 반복 횟수 (기본값: 3)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력 (비교용)")
+    return parser.parse_args()
+
+
+def seed_database(db, users: int, items: int, items_per_system: int, assignees_per_system: int):
+    """벤치마크용 사용자/시스템/체크 항목/담당자 할당 생성"""
+    from models.models import User, System, CheckItem, UserSystemAssignment
+
+    headquarters = [f"총괄본부{i}" for i in range(max(1, users // 50))]
+    db.bulk_insert_mappings(
+        User,
+        [
+            {
+                "employee_id": f"B{i:06d}",
+                "name": f"담당자{i}",
+                "email": f"user{i}@bench.local",
+                "password_hash": "-",
+                "general_headquarters": headquarters[i % len(headquarters)],
+                "position": "팀장" if i < len(headquarters) else "사원",
+                "division": "DX본부",
+            }
+            for i in range(users)
+        ],
+    )
+    db.add(
+        User(
+            employee_id="B_DIRECTOR",
+            name="본부장",
+            email="director@bench.local",
+            password_hash="-",
+            division="DX본부",
+            position="본부장",
+        )
+    )
+
+    system_count = max(1, -(-items // items_per_system))
+    db.bulk_insert_mappings(
+        System, [{"id": i + 1, "system_name": f"시스템{i + 1}"} for i in range(system_count)]
+    )
+    db.bulk_insert_mappings(
+        CheckItem,
+        [
+            {
+                "system_id": i // items_per_system + 1,
+                "item_name": f"체크 항목 {i + 1}",
+                "order_index": i % items_per_system,
+            }
+            for i in range(items)
+        ],
+    )
+    assignees = db.query(User.id, User.name).filter(User.employee_id.like("B0%")).order_by(User.id).all()
+    assignments = []
+    for system_id in range(1, system_count + 1):
+        for offset in range(assignees_per_system):
+            user_id, user_name = assignees[(system_id * assignees_per_system + offset) % len(assignees)]
+            assignments.append(
+                {
+                    "user_id": user_id,
+                    "user_name": user_name,
+                    "system_id": system_id,
+                    "item_name": "-",
+                }
+            )
+    db.bulk_insert_mappings(UserSystemAssignment, assignments)
+    db.commit()
+    return system_count, len(assignments)
+
+
+def run_benchmark(args):
+    from sqlalchemy import event
+    from services.database import SessionLocal, engine, Base
+    import models.models  # noqa: F401 (테이블 등록)
+    from services import scheduler
+    from utils.smtp_sink import SMTPSink
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        system_count, assignment_count = seed_database(
+            db, args.users, args.items, args.items_per_system, args.assignees_per_system
+        )
+    finally:
+        db.close()
+
+    # 쿼리 수 집계
+    counters = {"queries": 0, "render": 0.0, "smtp": 0.0}
+
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        counters["queries"] += 1
+
+    event.listen(engine, "before_cursor_execute", count_query)
+
+    # 본문 렌더링 / SMTP 발송 시간 측정을 위한 래핑
+    original_render = scheduler.build_unchecked_email_body
+    original_send = scheduler.send_email
+
+    def timed_render(*a, **kw):
+        started = time.perf_counter()
+        try:
+            return original_render(*a, **kw)
+        finally:
+            counters["render"] += time.perf_counter() - started
+
+    def timed_send(*a, **kw):
+        started = time.perf_counter()
+        try:
+            return original_send(*a, **kw)
+        finally:
+            counters["smtp"] += time.perf_counter() - started
+
+    scheduler.build_unchecked_email_body = timed_render
+    scheduler.send_email = timed_send
+
+    cycles = []
+    with SMTPSink() as sink:
+        os.environ.update(sink.env())
+        for _ in range(args.cycles):
+            counters.update(queries=0, render=0.0, smtp=0.0)
+            sent_before = len(sink.messages)
+            started = time.perf_counter()
+            scheduler.check_unchecked_items()
+            elapsed = time.perf_counter() - started
+            messages = sink.messages[sent_before:]
+            cycles.append(
+                {
+                    "total_seconds": elapsed,
+                    "queries": counters["queries"],
+                    "render_seconds": counters["render"],
+                    "smtp_seconds": counters["smtp"],
+                    "messages": len(messages),
+                    "recipients": sum(len(m.rcpt_tos) for m in messages),
+                    "bytes": sum(len(m.data) for m in messages),
+                }
+            )
+
+    scheduler.build_unchecked_email_body = original_render
+    scheduler.send_email = original_send
+    event.remove(engine, "before_cursor_execute", count_query)
+
+    total_seconds = sum(c["total_seconds"] for c in cycles)
+    total_messages = sum(c["messages"] for c in cycles)
+    return {
+        "params": {
+            "users": args.users,
+            "items": args.items,
+            "systems": system_count,
+            "assignments": assignment_count,
+            "cycles": args.cycles,
+        },
+        "cycles": cycles,
+        "summary": {
+            "avg_total_seconds": total_seconds / len(cycles),
+            "avg_queries": sum(c["queries"] for c in cycles) / len(cycles),
+            "avg_render_seconds": sum(c["render_seconds"] for c in cycles) / len(cycles),
+            "avg_smtp_seconds": sum(c["smtp_seconds"] for c in cycles) / len(cycles),
+            "messages_per_second": total_messages / total_seconds if total_seconds else 0.0,
+        },
+    }
+
+
+def print_report(result):
+    params = result["params"]
+    summary = result["summary"]
+    print("=" * 60)
+    print("미체크 알림 파이프라인 벤치마크")
+    print("=" * 60)
+    print(
+        f"사용자 {params['users']}명, 시스템 {params['systems']}개, "
+        f"미체크 항목 {params['items']}개, 할당 {params['assignments']}건"
+    )
+    print(f"\n{'사이클':<6} {'전체(s)':>10} {'쿼리 수':>8} {'렌더링(s)':>10} {'SMTP(s)':>10} {'메일':>5} {'수신자':>6}")
+    print("-" * 60)
+    for idx, cycle in enumerate(result["cycles"], 1):
+        print(
+            f"{idx:<6} {cycle['total_seconds']:>10.3f} {cycle['queries']:>8} "
+            f"{cycle['render_seconds']:>10.4f} {cycle['smtp_seconds']:>10.4f} "
+            f"{cycle['messages']:>5} {cycle['recipients']:>6}"
+        )
+    print("-" * 60)
+    print(f"평균 소요 시간: {summary['avg_total_seconds']:.3f}s")
+    print(f"평균 쿼리 수: {summary['avg_queries']:.0f}")
+    print(f"평균 렌더링 시간: {summary['avg_render_seconds']:.4f}s")
+    print(f"평균 SMTP 시간: {summary['avg_smtp_seconds']:.4f}s")
+    print(f"초당 메일 수: {summary['messages_per_second']:.2f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # services.database import 전에 임시 DB로 지정 (실제 DB 보호)
+        os.environ["DATABASE_URL"] = f"sqlite:///{Path(tmp_dir, 'benchmark.db').as_posix()}"
+        # 테스트 모드가 켜져 있으면 실제 수신자 계산이 생략되므로 해제 (.env보다 우선)
+        os.environ["SCHEDULER_TEST_EMAIL"] = ""
+
+        # 스케줄러의 진행 로그는 결과 출력과 섞이지 않도록 버림
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            result = run_benchmark(args)
+
+        from services.database import engine
+
+        engine.dispose()
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print_report(result)
@@ -0,0 +1,68 @@
+"""
+일 마감 스크립트 (체크 항목별 일별 최종 상태 스냅샷 기록)
+
+스케줄러가 매일 DAY_CLOSE_TIME(기본값 00:10)에 전날을 마감하므로,
+이 스크립트는 처음 도입할 때 지난 날짜를 한꺼번에 마감하거나 특정 날짜를 마감할 때 사용합니다.
+이미 마감된 날짜와 체크 기록이 없는 날짜는 건너뜁니다.
+
+주의: 지난 날짜도 현재 체크 항목/담당자 기준으로 마감됩니다.
+
+사용법:
+    python backend/src/utils/close_day.py                              # 밀린 날짜 마감 (최근 DAY_CLOSE_CATCHUP_DAYS일)
+    python backend/src/utils/close_day.py --from 2025-01-01 --to 2025-06-30
+"""
+import sys
+import argparse
+from datetime import date, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "backend" / "src"))
+
+from services.database import SessionLocal, engine, Base
+from services.day_close import close_day, close_pending_days
+from services.scheduler import get_korea_today
+from services.logging_config import setup_logging
+
+
+def close_range(start_date: date, end_date: date):
+    """날짜 범위 마감 (오늘 이후 날짜는 마감하지 않음)"""
+    end_date = min(end_date, get_korea_today() - timedelta(days=1))
+    closed, skipped = [], 0
+    db = SessionLocal()
+    try:
+        target = start_date
+        while target <= end_date:
+            count = close_day(db, target)
+            if count:
+                closed.append(target)
+                print(f"  {target}: {count}개 항목 마감")
+            else:
+                skipped += 1
+            target += timedelta(days=1)
+    finally:
+        db.close()
+    return closed, skipped
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="체크리스트 일 마감")
+    parser.add_argument("--from", dest="start_date", type=date.fromisoformat, help="마감 시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end_date", type=date.fromisoformat, help="마감 종료 날짜 (기본값: 어제)")
+    args = parser.parse_args()
+    setup_logging(log_format="text")
+
+    # 스냅샷 테이블이 없으면 생성
+    Base.metadata.create_all(bind=engine)
+
+    print("=" * 50)
+    if args.start_date:
+        end_date = args.end_date or get_korea_today() - timedelta(days=1)
+        closed, skipped = close_range(args.start_date, end_date)
+        print(f"마감 완료: {len(closed)}일 (이미 마감/기록 없음: {skipped}일)")
+    else:
+        stats = close_pending_days()
+        print(f"마감 완료: {len(stats['closed_dates'])}일, 항목 {stats['rows_scanned']}건")
+    print("=" * 50)
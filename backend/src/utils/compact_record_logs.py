@@ -0,0 +1,51 @@
+"""
+체크 기록 로그(checklist_records_logs) 압축 스크립트
+
+보관 기간이 지난 날짜의 로그를 항목/날짜별 상태 전이 지점(첫 로그, 상태 변경, 최종 상태)만 남기고
+정리합니다. 삭제되는 로그를 포함한 원본은 database/archive/checklist_records_logs/에
+gzip JSON Lines 파일로 보관됩니다.
+
+스케줄러가 매일 LOG_COMPACTION_TIME(기본값 03:30)에 같은 작업을 실행하므로,
+이 스크립트는 처음 도입할 때 쌓인 로그를 정리하거나 결과를 미리 확인할 때 사용합니다.
+
+사용법:
+    python backend/src/utils/compact_record_logs.py [--horizon-days N] [--dry-run]
+"""
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "backend" / "src"))
+
+from services.log_compaction import compact_record_logs, LOG_COMPACTION_HORIZON_DAYS, LOG_ARCHIVE_DIR
+from services.logging_config import setup_logging
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="체크 기록 로그 압축")
+    parser.add_argument(
+        "--horizon-days",
+        type=int,
+        default=LOG_COMPACTION_HORIZON_DAYS,
+        help=f"이 기간(일)이 지난 로그만 압축 (기본값: {LOG_COMPACTION_HORIZON_DAYS})",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="삭제/보관하지 않고 결과만 출력")
+    args = parser.parse_args()
+    setup_logging(log_format="text")
+
+    stats = compact_record_logs(horizon_days=args.horizon_days, dry_run=args.dry_run)
+
+    print("\n" + "=" * 50)
+    print("로그 압축 완료!" if not args.dry_run else "로그 압축 결과 (dry-run)")
+    print(f"  기준일: {stats['cutoff_date']} 이전")
+    print(f"  조회한 로그: {stats['rows_scanned']}건")
+    print(f"  압축한 날짜: {stats['dates_compacted']}일")
+    print(f"  압축한 항목: {stats['groups_compacted']}건")
+    print(f"  삭제한 로그: {stats['rows_deleted']}건")
+    print(f"  보관한 원본 로그: {stats['rows_archived']}건")
+    if stats["archive_files"]:
+        print(f"  보관 경로: {LOG_ARCHIVE_DIR} ({len(stats['archive_files'])}개 파일, {stats['archive_bytes']:,} bytes)")
+    print("=" * 50)
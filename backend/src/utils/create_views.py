@@ -37,7 +37,7 @@ def create_views():
                         ci.system_id,
                         s.system_name,
                         cr.check_date,
-                        cr.status,
+                        CASE cr.status WHEN 1 THEN 'PASS' WHEN 2 THEN 'FAIL' END AS status,
                         cr.notes,
                         cr.checked_at
                     FROM checklist_records cr
@@ -0,0 +1,91 @@
+"""
+데이터베이스 스냅샷 생성/복원 스크립트
+
+스냅샷은 database/snapshots/에 별도 파일로 저장되며 운영 DB의 스키마는 바꾸지 않습니다.
+(SQLite: 백업 API로 복사하므로 서버 실행 중에도 생성 가능, PostgreSQL: pg_dump/pg_restore 필요)
+
+사용법:
+    python backend/src/utils/db_snapshot.py create [--label 이름]
+    python backend/src/utils/db_snapshot.py list
+    python backend/src/utils/db_snapshot.py restore [스냅샷] [--table users --table ...] [-y]
+
+전체 복원은 서버를 중지한 상태에서 실행하세요.
+"""
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "backend" / "src"))
+
+from services.db_snapshot import (
+    create_snapshot,
+    list_snapshots,
+    resolve_snapshot,
+    restore_snapshot,
+    restore_tables,
+    DB_SNAPSHOT_DIR,
+)
+from services.logging_config import setup_logging
+
+
+def print_snapshots():
+    snapshots = list_snapshots()
+    if not snapshots:
+        print(f"  (스냅샷이 없습니다: {DB_SNAPSHOT_DIR})")
+        return
+    for path in snapshots:
+        print(f"  - {path.name} ({path.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="데이터베이스 스냅샷 생성/복원")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    create_parser = subparsers.add_parser("create", help="스냅샷 생성")
+    create_parser.add_argument("--label", help="파일 이름에 붙일 이름 (예: before_import)")
+
+    subparsers.add_parser("list", help="스냅샷 목록")
+
+    restore_parser = subparsers.add_parser("restore", help="스냅샷 복원")
+    restore_parser.add_argument("snapshot", help="스냅샷 파일 이름 또는 경로")
+    restore_parser.add_argument(
+        "--table", action="append", dest="tables", help="이 테이블만 복원 (여러 번 지정 가능)"
+    )
+    restore_parser.add_argument("-y", "--yes", action="store_true", help="확인 없이 복원")
+
+    args = parser.parse_args()
+    setup_logging(log_format="text")
+
+    print("=" * 60)
+    if args.command == "create":
+        path = create_snapshot(args.label)
+        print(f"스냅샷 생성 완료: {path} ({path.stat().st_size:,} bytes)")
+    elif args.command == "list":
+        print("스냅샷 목록:")
+        print_snapshots()
+    else:
+        try:
+            path = resolve_snapshot(args.snapshot)
+        except FileNotFoundError as e:
+            print(f"오류: {e}")
+            print("\n사용 가능한 스냅샷:")
+            print_snapshots()
+            sys.exit(1)
+
+        target = f"{', '.join(args.tables)} 테이블" if args.tables else "DB 전체"
+        if not args.yes:
+            response = input(f"{path.name} 스냅샷으로 {target}를 복원합니다. 계속하시겠습니까? (y/n): ")
+            if response.lower() != "y":
+                print("복원을 취소했습니다.")
+                sys.exit(1)
+
+        if args.tables:
+            for table, rows in restore_tables(path, args.tables).items():
+                print(f"  {table}: {rows}행 복원")
+        else:
+            restore_snapshot(path)
+        print(f"복원 완료: {target} ← {path.name}")
+    print("=" * 60)
@@ -0,0 +1,486 @@
+"""
+합성 데이터 생성 스크립트 (규모 테스트용)
+
+비어 있는 SQLite/PostgreSQL DB에 사용자, 시스템, 체크 항목, 담당자 할당과 지난 N일간의
+체크 기록/기록 로그/일 마감 스냅샷을 생성합니다. 같은 --seed와 옵션이면 항상 같은 데이터가 만들어집니다.
+(비밀번호 해시의 salt만 매번 다름, 실행 날짜와 무관하게 재현하려면 --end-date도 지정)
+
+생성 규칙
+- 조직: 본부장 1명, 총괄본부별 팀장, 부서별 파트장과 사원 (알림 참조자 계산이 실제와 같은 경로를 타도록)
+  console 사번(CONSOLE_EMPLOYEE_IDS)도 사원으로 포함되며, 모든 사용자의 비밀번호는 1234입니다.
+- 시스템마다 체크 항목 수가 다르고(평균 items/systems), 담당자는 1~3명입니다.
+- 체크는 평일에만 하며, 시스템마다 FAIL 비율이 다릅니다. 어제 FAIL인 항목은 오늘도 FAIL일 확률이 높습니다.
+- 일부 기록은 같은 날 다시 제출됩니다 (FAIL -> 조치 후 PASS, PASS -> 재확인 후 FAIL 등, 로그는 UPDATE).
+- 지난 날짜는 일 마감 스냅샷까지 만들고, 오늘은 일부만 체크된 상태로 일별 슬롯을 생성합니다.
+- 로그는 압축하지 않은 상태로 만들어지므로, 압축 후 상태는 compact_record_logs.py로 만듭니다.
+
+데이터 행은 Core bulk INSERT로 --batch-size 단위로 넣습니다.
+SQLite는 생성 중 동기화/저널을 끄므로(PRAGMA synchronous=OFF, journal_mode=MEMORY) 중단되면 DB를 지우고 다시 생성하세요.
+
+사용법:
+    python backend/src/utils/generate_synthetic_data.py --database-url sqlite:///database/synthetic.db
+    python backend/src/utils/generate_synthetic_data.py --database-url postgresql://user:pw@localhost/qa_synthetic
+
+예시 (작은 규모):
+    python backend/src/utils/generate_synthetic_data.py --database-url sqlite:////tmp/small.db \\
+        --systems 50 --items 1000 --users 100 --days 60 --seed 7
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "backend" / "src"))
+
+# main.CONSOLE_ACCESS_EMPLOYEE_IDS와 같은 사번 (부하 테스트에서 console API 호출용)
+CONSOLE_EMPLOYEE_IDS = ("224147", "224005", "225016")
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_NAME_SYLLABLES = "민서지현준우영수하은도윤재성혜진태경소연상훈"
+SYSTEM_PREFIXES = (
+    "고객", "주문", "결제", "정산", "물류", "회원", "인사", "회계", "영업", "마케팅",
+    "CRM", "ERP", "포털", "모바일", "데이터", "검색", "추천", "광고", "재고", "배송",
+)
+SYSTEM_SUFFIXES = ("관리시스템", "플랫폼", "서비스", "API", "배치")
+ITEM_TEMPLATES = (
+    "서비스 접속 확인",
+    "로그인 정상 동작",
+    "주요 API 응답 시간",
+    "배치 작업 결과",
+    "디스크 사용률",
+    "DB 연결 상태",
+    "인증서 만료일",
+    "에러 로그 확인",
+    "백업 완료 여부",
+    "모니터링 알람 확인",
+    "메모리 사용률",
+    "외부 연동 상태",
+)
+FAIL_NOTES = (
+    "응답 지연",
+    "로그인 실패",
+    "배치 미완료",
+    "디스크 사용률 90% 초과",
+    "에러 로그 다수 발생",
+    "외부 연동 타임아웃",
+    "인증서 만료 임박",
+)
+FIX_NOTES = ("조치 완료", "재기동 후 정상", "담당자 확인 후 정상")
+
+# 체크/재제출 확률
+SYSTEM_SKIP_RATE = 0.03  # 시스템 전체를 그날 체크하지 않을 확률
+FAIL_REPEAT_RATE = 0.5  # 어제 FAIL인 항목이 오늘도 FAIL일 확률
+FAIL_FIX_RATE = 0.35  # FAIL 제출 후 같은 날 PASS로 다시 제출할 확률
+PASS_REVERT_RATE = 0.02  # PASS 제출 후 같은 날 FAIL로 다시 제출할 확률
+RECHECK_RATE = 0.01  # 같은 상태로 다시 제출할 확률
+TODAY_COVERAGE = 0.5  # 오늘 체크된 비율 (나머지는 미체크)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="규모 테스트용 합성 데이터 생성")
+    parser.add_argument("--database-url", help="대상 DB (기본값: .env의 DATABASE_URL), 비어 있는 DB만 허용")
+    parser.add_argument("--systems", type=int, default=1000, help="시스템 수 (기본값: 1000)")
+    parser.add_argument("--items", type=int, default=20000, help="체크 항목 수 (기본값: 20000)")
+    parser.add_argument("--users", type=int, default=2000, help="사용자 수 (기본값: 2000)")
+    parser.add_argument("--days", type=int, default=730, help="기록을 생성할 기간, 오늘 포함 (기본값: 730)")
+    parser.add_argument("--end-date", type=date.fromisoformat, help="마지막 날짜 (기본값: 오늘, YYYY-MM-DD)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (기본값: 42)")
+    parser.add_argument("--fail-rate", type=float, default=0.03, help="평균 FAIL 비율 (기본값: 0.03)")
+    parser.add_argument("--coverage", type=float, default=0.95, help="평일 항목별 체크 비율 (기본값: 0.95)")
+    parser.add_argument("--no-snapshots", action="store_true", help="일 마감 스냅샷 생성 안 함")
+    parser.add_argument("--batch-size", type=int, default=20000, help="INSERT 한 번에 넣을 행 수 (기본값: 20000)")
+    args = parser.parse_args()
+    if args.items < args.systems:
+        parser.error("--items는 --systems 이상이어야 합니다")
+    if args.users < 10:
+        parser.error("--users는 10 이상이어야 합니다")
+    return args
+
+
+def person_name(rng: random.Random) -> str:
+    return rng.choice(SURNAMES) + rng.choice(GIVEN_NAME_SYLLABLES) + rng.choice(GIVEN_NAME_SYLLABLES)
+
+
+def build_users(rng: random.Random, count: int, password_hash: str, created_at: datetime) -> list:
+    """조직 구조를 가진 사용자 행 (본부장 1명, 총괄본부별 팀장, 부서별 파트장, 나머지 사원)"""
+    headquarters = [f"{name}총괄본부" for name in rng.sample(SYSTEM_PREFIXES, min(len(SYSTEM_PREFIXES), max(1, count // 100)))]
+    departments = [(headquarters[i % len(headquarters)], f"품질{i + 1}팀") for i in range(max(1, count // 20))]
+
+    rows = []
+
+    def add(position, division=None, general_headquarters=None, department=None, employee_id=None):
+        user_id = len(rows) + 1
+        employee_id = employee_id or f"{900000 + user_id}"
+        rows.append(
+            {
+                "id": user_id,
+                "employee_id": employee_id,
+                "name": person_name(rng),
+                "email": f"{employee_id}@synthetic.local",
+                "password_hash": password_hash,
+                "division": division,
+                "general_headquarters": general_headquarters,
+                "department": department,
+                "position": position,
+                "role": position if position != "사원" else None,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+        )
+
+    add("본부장", division="DX본부")
+    for name in headquarters:
+        add("팀장", division="DX본부", general_headquarters=name)
+    for name, department in departments[: count - len(rows)]:
+        add("파트장", general_headquarters=name, department=department)
+    console_ids = list(CONSOLE_EMPLOYEE_IDS)
+    while len(rows) < count:
+        name, department = rng.choice(departments)
+        add("사원", general_headquarters=name, department=department, employee_id=console_ids.pop(0) if console_ids else None)
+    return rows
+
+
+def build_catalog(rng: random.Random, system_count: int, item_count: int, staff_ids: list, users: list, created_at: datetime):
+    """시스템/체크 항목/담당자 할당 행과 시스템별 FAIL 비율
+
+    Returns:
+        tuple: (systems, items, assignments, assignees_by_system, fail_rates)
+    """
+    # 시스템별 항목 수: 최소 1개, 나머지는 치우친 분포로 배분 (항목이 많은 시스템이 일부 존재)
+    weights = [rng.paretovariate(1.5) for _ in range(system_count)]
+    counts = [1] * system_count
+    for index in rng.choices(range(system_count), weights=weights, k=item_count - system_count):
+        counts[index] += 1
+
+    user_names = {user["id"]: user["name"] for user in users}
+    systems, items, assignments = [], [], []
+    assignees_by_system, fail_rates = {}, {}
+    for system_id in range(1, system_count + 1):
+        prefix, suffix = rng.choice(SYSTEM_PREFIXES), rng.choice(SYSTEM_SUFFIXES)
+        systems.append(
+            {
+                "id": system_id,
+                "system_name": f"{prefix}{suffix} {system_id:04d}",
+                "description": None,
+                "created_at": created_at,
+            }
+        )
+        assignees = rng.sample(staff_ids, rng.choices((1, 2, 3), weights=(50, 35, 15))[0])
+        assignees_by_system[system_id] = assignees
+        # 대부분은 평균보다 안정적이고 일부 시스템이 FAIL을 많이 냄
+        fail_rates[system_id] = rng.expovariate(1.0)
+
+        for order_index in range(counts[system_id - 1]):
+            item_id = len(items) + 1
+            item_name = f"{rng.choice(ITEM_TEMPLATES)} {order_index + 1}"
+            items.append(
+                {
+                    "id": item_id,
+                    "system_id": system_id,
+                    "item_name": item_name,
+                    "description": "점검 기준 문서 참고" if rng.random() < 0.2 else None,
+                    "order_index": order_index,
+                    "created_at": created_at,
+                }
+            )
+            for user_id in assignees:
+                assignments.append(
+                    {
+                        "id": len(assignments) + 1,
+                        "user_id": user_id,
+                        "user_name": user_names[user_id],
+                        "system_id": system_id,
+                        "item_name": item_name,
+                        "created_at": created_at,
+                    }
+                )
+    return systems, items, assignments, assignees_by_system, fail_rates
+
+
+class BatchWriter:
+    """테이블별로 행을 모아 batch_size마다 bulk INSERT 후 커밋
+
+    SQLite는 행마다 SQLAlchemy 파라미터 처리를 거치지 않도록, 컬럼 타입의 bind processor로 값을 변환해
+    드라이버의 executemany로 바로 넣습니다. (PostgreSQL 등은 Core INSERT의 insertmanyvalues 배치 사용)
+    """
+
+    def __init__(self, conn, batch_size: int):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.pending = {}
+        self.counts = {}
+        self._statements = {}
+
+    def add(self, model, row: dict):
+        rows = self.pending.setdefault(model, [])
+        rows.append(row)
+        if len(rows) >= self.batch_size:
+            self.flush(model)
+
+    def extend(self, model, rows: list):
+        for start in range(0, len(rows), self.batch_size):
+            self.pending.setdefault(model, []).extend(rows[start : start + self.batch_size])
+            self.flush(model)
+
+    def _driver_statement(self, model, keys: tuple):
+        """(INSERT SQL, 컬럼별 값 변환 함수) - 테이블/컬럼 조합별로 한 번만 생성"""
+        from functools import lru_cache
+        from operator import itemgetter
+        from sqlalchemy import Date
+
+        from models.models import EncodedEnum
+
+        cache_key = (model, keys)
+        if cache_key not in self._statements:
+            dialect = self.conn.dialect
+            quote = dialect.identifier_preparer.quote
+            columns = [model.__table__.c[key] for key in keys]
+            sql = (
+                f"INSERT INTO {quote(model.__tablename__)} ({', '.join(quote(column.name) for column in columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})"
+            )
+            converters = []
+            for key, column in zip(keys, columns):
+                process = column.type.dialect_impl(dialect).bind_processor(dialect)
+                # 날짜/상태처럼 값 종류가 적은 컬럼은 변환 결과 재사용
+                if process and isinstance(column.type, (Date, EncodedEnum)):
+                    process = lru_cache(maxsize=4096)(process)
+                converters.append((itemgetter(key), process))
+            self._statements[cache_key] = (sql, converters)
+        return self._statements[cache_key]
+
+    def _insert(self, model, rows: list):
+        from sqlalchemy import insert
+
+        if self.conn.dialect.name != "sqlite":
+            self.conn.execute(insert(model), rows)
+            return
+        sql, converters = self._driver_statement(model, tuple(rows[0]))
+        columns = []
+        for get, process in converters:
+            values = map(get, rows)
+            columns.append(list(map(process, values)) if process else list(values))
+        self.conn.exec_driver_sql(sql, list(zip(*columns)))
+
+    def flush(self, model=None):
+        for target in [model] if model else list(self.pending):
+            rows = self.pending.get(target)
+            if rows:
+                self._insert(target, rows)
+                self.counts[target.__tablename__] = self.counts.get(target.__tablename__, 0) + len(rows)
+                self.pending[target] = []
+        self.conn.commit()
+
+
+def generate_history(rng, writer, users, systems, items, assignees_by_system, fail_rates, args, start_date, end_date, snapshots):
+    """날짜별 체크 기록/로그/스냅샷 생성 (평일만, 마지막 날은 일부만 체크)"""
+    from models.models import ChecklistRecord, ChecklistRecordLog, ChecklistDailySnapshot
+
+    system_names = {system["id"]: system["system_name"] for system in systems}
+    user_names = {user["id"]: user["name"] for user in users}
+    catalog = [
+        {
+            "check_item_id": item["id"],
+            "system_id": item["system_id"],
+            "system_name": system_names[item["system_id"]],
+            "item_name": item["item_name"],
+            "order_index": item["order_index"],
+            "assignees": ", ".join(sorted(user_names[user_id] for user_id in assignees_by_system[item["system_id"]])),
+        }
+        for item in items
+    ]
+    base_fail = {system_id: min(rate * args.fail_rate, 0.5) for system_id, rate in fail_rates.items()}
+
+    random_value, choice, randrange = rng.random, rng.choice, rng.randrange
+    failing = set()
+    day = start_date
+    days_done = 0
+    while day <= end_date:
+        if day.weekday() >= 5:
+            day += timedelta(days=1)
+            continue
+        is_today = day == end_date
+        coverage = args.coverage * (TODAY_COVERAGE if is_today else 1)
+        work_start = datetime(day.year, day.month, day.day, 9)
+        closed_at = work_start + timedelta(hours=15, minutes=10)
+        skipped_systems = {system_id for system_id in fail_rates if random_value() < SYSTEM_SKIP_RATE}
+        next_failing = set()
+
+        for entry in catalog:
+            item_id, system_id = entry["check_item_id"], entry["system_id"]
+            if system_id in skipped_systems or random_value() >= coverage:
+                if snapshots and not is_today:
+                    writer.add(
+                        ChecklistDailySnapshot,
+                        {**entry, "snapshot_date": day, "status": "UNCHECKED", "notes": None,
+                         "checked_by": None, "checked_at": None, "closed_at": closed_at},
+                    )
+                continue
+
+            assignees = assignees_by_system[system_id]
+            user_id = choice(assignees)
+            checked_at = work_start + timedelta(seconds=randrange(3 * 3600))
+            fail = random_value() < (FAIL_REPEAT_RATE if item_id in failing else base_fail[system_id])
+            status, notes = ("FAIL", choice(FAIL_NOTES)) if fail else ("PASS", None)
+            log = {"user_id": user_id, "check_item_id": item_id, "check_date": day, "status": status,
+                   "notes": notes, "action": "CREATE", "created_at": checked_at}
+            writer.add(ChecklistRecordLog, log)
+
+            # 같은 날 다시 제출 (기록은 마지막 제출 상태, 로그는 UPDATE로 추가)
+            resubmit = random_value()
+            if fail and resubmit < FAIL_FIX_RATE:
+                status, notes = "PASS", choice(FIX_NOTES)
+            elif not fail and resubmit < PASS_REVERT_RATE:
+                status, notes = "FAIL", choice(FAIL_NOTES)
+            elif resubmit >= 1 - RECHECK_RATE:
+                pass
+            else:
+                resubmit = None
+            if resubmit is not None:
+                user_id = choice(assignees)
+                checked_at += timedelta(seconds=60 + randrange(4 * 3600))
+                writer.add(ChecklistRecordLog, {**log, "user_id": user_id, "status": status, "notes": notes,
+                                                "action": "UPDATE", "created_at": checked_at})
+
+            if status == "FAIL":
+                next_failing.add(item_id)
+            writer.add(
+                ChecklistRecord,
+                {"user_id": user_id, "check_item_id": item_id, "check_date": day, "status": status,
+                 "notes": notes, "checked_at": checked_at},
+            )
+            if snapshots and not is_today:
+                writer.add(
+                    ChecklistDailySnapshot,
+                    {**entry, "snapshot_date": day, "status": status, "notes": notes,
+                     "checked_by": user_id, "checked_at": checked_at, "closed_at": closed_at},
+                )
+
+        failing = next_failing
+        days_done += 1
+        if days_done % 20 == 0:
+            print(f"  {day}: {days_done}일 생성, 기록 {writer.counts.get('checklist_records', 0):,}건")
+        day += timedelta(days=1)
+    return days_done
+
+
+def reset_sequences(conn, models):
+    """PostgreSQL: id를 직접 지정해 넣은 테이블의 시퀀스를 최대 id로 맞춤"""
+    from sqlalchemy import text
+
+    if conn.dialect.name != "postgresql":
+        return
+    for model in models:
+        table = model.__tablename__
+        conn.execute(
+            text(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT COALESCE(MAX(id), 1) FROM {table}))")
+        )
+    conn.commit()
+
+
+def ensure_empty(conn, models):
+    """대상 DB에 데이터가 있으면 중단 (실제 DB에 섞이지 않도록)"""
+    from sqlalchemy import func, select
+
+    for model in models:
+        if conn.execute(select(func.count()).select_from(model)).scalar():
+            print(f"[ERROR] {model.__tablename__} 테이블에 데이터가 있습니다. 비어 있는 DB를 지정하세요.")
+            sys.exit(1)
+
+
+def main(args):
+    from services.auth import get_password_hash
+    from services.database import Base, SessionLocal, engine
+    from services.daily_slots import create_daily_slots
+    from services.scheduler import get_korea_today
+    from services.user_import import DEFAULT_PASSWORD
+    from models.models import (
+        User,
+        System,
+        CheckItem,
+        UserSystemAssignment,
+        ChecklistRecord,
+        ChecklistRecordLog,
+        ChecklistDailySlot,
+        ChecklistDailySnapshot,
+    )
+
+    end_date = args.end_date or get_korea_today()
+    start_date = end_date - timedelta(days=args.days - 1)
+    created_at = datetime.combine(start_date, datetime.min.time()) - timedelta(days=1)
+    rng = random.Random(args.seed)
+
+    print("=" * 60)
+    print("합성 데이터 생성")
+    print("=" * 60)
+    print(f"대상 DB: {engine.url.render_as_string(hide_password=True)}")
+    print(f"시스템 {args.systems:,}개, 체크 항목 {args.items:,}개, 사용자 {args.users:,}명")
+    print(f"기간: {start_date} ~ {end_date} ({args.days}일), seed={args.seed}")
+
+    Base.metadata.create_all(bind=engine)
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        ensure_empty(conn, (User, System, CheckItem, ChecklistRecord, ChecklistRecordLog))
+        if conn.dialect.name == "sqlite":
+            conn.exec_driver_sql("PRAGMA synchronous=OFF")
+            conn.exec_driver_sql("PRAGMA journal_mode=MEMORY")
+
+        writer = BatchWriter(conn, args.batch_size)
+        users = build_users(rng, args.users, get_password_hash(DEFAULT_PASSWORD), created_at)
+        staff_ids = [user["id"] for user in users if user["position"] in ("사원", "파트장")]
+        systems, items, assignments, assignees_by_system, fail_rates = build_catalog(
+            rng, args.systems, args.items, staff_ids, users, created_at
+        )
+        for model, rows in ((User, users), (System, systems), (CheckItem, items), (UserSystemAssignment, assignments)):
+            writer.extend(model, rows)
+        reset_sequences(conn, (User, System, CheckItem, UserSystemAssignment))
+        print(f"\n조직/체크 항목 생성 완료 (할당 {len(assignments):,}건), 기록 생성 중...")
+
+        days = generate_history(
+            rng, writer, users, systems, items, assignees_by_system, fail_rates, args,
+            start_date, end_date, snapshots=not args.no_snapshots,
+        )
+        writer.flush()
+        counts = writer.counts
+
+    # 오늘 슬롯 (서버 시작 시와 같은 방식으로 기록에서 상태를 채움)
+    if end_date == get_korea_today():
+        db = SessionLocal()
+        try:
+            counts[ChecklistDailySlot.__tablename__] = create_daily_slots(db, end_date)["created"]
+        finally:
+            db.close()
+
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    print("\n" + "=" * 60)
+    print(f"완료: 평일 {days}일, 총 {total:,}행, {elapsed:.1f}초 ({total / elapsed:,.0f}행/초)")
+    for table in (
+        User.__tablename__,
+        System.__tablename__,
+        CheckItem.__tablename__,
+        UserSystemAssignment.__tablename__,
+        ChecklistRecord.__tablename__,
+        ChecklistRecordLog.__tablename__,
+        ChecklistDailySnapshot.__tablename__,
+        ChecklistDailySlot.__tablename__,
+    ):
+        print(f"  {table:<28} {counts.get(table, 0):>12,}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    # services.database import 전에 대상 DB 지정 (.env보다 우선)
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+
+    from services.logging_config import setup_logging
+
+    setup_logging(log_format="text")
+    main(args)
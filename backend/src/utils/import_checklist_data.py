@@ -1,7 +1,10 @@
 """
 체크리스트 데이터 import 스크립트
 
-CSV 형식:
+CSV 또는 XLSX(첫 번째 시트, 첫 행은 헤더) 파일을 읽습니다.
+XLSX는 한 행씩 스트리밍으로 읽으므로 CSV로 변환할 필요가 없습니다.
+
+컬럼 형식:
 user_name, id, system_id, item_name, description, order_index, created_at
 
 각 행은 사용자-체크 항목 관계를 나타냅니다.
@@ -11,13 +14,29 @@ user_name, id, system_id, item_name, description, order_index, created_at
 김지훈, 2, IAS Sales, CPU 사용률 95% 이상 사용여부 확인, , 2, 2026년 1월 14일 수요일
 김정민, 2, IAS Sales, CPU 사용률 95% 이상 사용여부 확인, , 2, 2026년 1월 14일 수요일
 
+실제 처리는 services/checklist_import.py의 import 엔진이 담당합니다.
+(사용자 이름은 한 번 조회한 맵으로 해석하고, bulk INSERT로 한 트랜잭션 안에서 저장)
+
+import 방식 (--mode):
+    sync    (기본) 기존 항목을 (시스템 이름, 항목 이름)으로 매칭해 변경분만 반영
+            체크 항목 ID와 체크 기록이 유지됩니다.
+            파일에 없는 항목/할당은 --delete-missing을 지정할 때만 삭제합니다.
+            (삭제되는 항목의 체크 기록/로그/일별 슬롯도 함께 삭제됩니다)
+    replace 기존 체크 항목/할당을 모두 삭제 후 다시 생성
+            체크 항목 ID가 바뀌고, 연결된 체크 기록/로그도 함께 삭제될 수 있습니다.
+
+import 전에 파일 전체를 검증하며, 오류가 있으면 DB를 변경하지 않고 중단합니다.
+    오류: 시스템명/항목명 누락, 잘못된 order_index, 같은 항목의 설명/순서 불일치, 등록되지 않은 담당자
+    --dry-run: 검증만 하고 import하지 않음 (오류가 있으면 종료 코드 1)
+    --allow-unknown-users: 등록되지 않은 담당자는 경고로 처리하고 해당 할당만 건너뜀
+
 사용법:
-    python backend/src/utils/import_checklist_data.py [CSV 파일 경로]
+    python backend/src/utils/import_checklist_data.py [CSV/XLSX 파일 경로] [--mode sync|replace] [--delete-missing] [--batch-size N]
+    python backend/src/utils/import_checklist_data.py [CSV/XLSX 파일 경로] --dry-run
     
-    CSV 파일 경로를 지정하지 않으면 database/checklist_data_0115_bom.csv를 사용합니다.
+    파일 경로를 지정하지 않으면 database/checklist_data_0115_bom.csv를 사용합니다.
 """
 import sys
-import csv
 from pathlib import Path
 
 # 프로젝트 루트를 Python 경로에 추가
@@ -27,18 +46,36 @@ sys.path.insert(0, str(project_root / "backend" / "src"))
 
 from sqlalchemy.orm import Session
 from services.database import SessionLocal
-from models.models import System, CheckItem, User, UserSystemAssignment
+from services.checklist_import import (
+    import_checklist,
+    sync_checklist,
+    validate_checklist,
+    ImportValidationError,
+    DEFAULT_BATCH_SIZE,
+)
+from services.daily_slots import refresh_slots
+from services.scheduler import get_korea_today
 
 # 기본 CSV 파일 경로
 DEFAULT_CSV_FILE = project_root / "database" / "checklist_data_0115_bom.csv"
 
 
-def import_checklist_data(csv_file_path=None):
+def import_checklist_data(
+    csv_file_path=None,
+    batch_size=DEFAULT_BATCH_SIZE,
+    mode="sync",
+    delete_missing=False,
+    allow_unknown_users=False,
+):
     """
-    CSV 파일에서 체크리스트 데이터를 읽어 데이터베이스에 import
+    CSV/XLSX 파일에서 체크리스트 데이터를 읽어 데이터베이스에 import
     
     Args:
-        csv_file_path: CSV 파일 경로 (지정하지 않으면 기본값 사용)
+        csv_file_path: CSV/XLSX 파일 경로 (지정하지 않으면 기본값 사용)
+        batch_size: 한 번에 읽고 INSERT할 행 수
+        mode: 'sync' (변경분만 반영) 또는 'replace' (전체 삭제 후 재생성)
+        delete_missing: sync 모드에서 파일에 없는 항목/할당 삭제 여부
+        allow_unknown_users: 등록되지 않은 담당자를 경고로 처리할지 여부
     """
     if csv_file_path is None:
         csv_file_path = DEFAULT_CSV_FILE
@@ -46,8 +83,8 @@ def import_checklist_data(csv_file_path=None):
         csv_file_path = Path(csv_file_path)
     
     if not csv_file_path.exists():
-        print(f"오류: CSV 파일을 찾을 수 없습니다: {csv_file_path}")
-        return
+        print(f"오류: 파일을 찾을 수 없습니다: {csv_file_path}")
+        return False
     
     db: Session = SessionLocal()
     
@@ -55,132 +92,69 @@ def import_checklist_data(csv_file_path=None):
         print("=" * 60)
         print("체크리스트 데이터 Import 시작")
         print("=" * 60)
-        print(f"CSV 파일: {csv_file_path}")
-        
-        # 기존 데이터 삭제
-        print("\n[1] 기존 체크 항목 및 할당 데이터 삭제 중...")
-        db.query(UserSystemAssignment).delete()
-        db.query(CheckItem).delete()
-        db.commit()
-        print("기존 데이터 삭제 완료")
-        
-        # CSV 파일 읽기
-        print("\n[2] CSV 파일 읽기 중...")
-        systems = {}  # {system_name: System 객체}
-        check_items = {}  # {(system_id, item_name): CheckItem 객체}
-        user_assignments = []  # [(user_id, system_id, item_name), ...]
-        
-        with open(csv_file_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            
-            for row_idx, row in enumerate(reader, start=2):
-                try:
-                    # CSV 필드 파싱
-                    user_names_str = row.get('user_name', '').strip()
-                    system_name = row.get('system_id', '').strip()
-                    item_name = row.get('item_name', '').strip()
-                    description = row.get('description', '').strip()
-                    order_index_str = row.get('order_index', '').strip()
-                    
-                    if not system_name or not item_name:
-                        print(f"경고: {row_idx}행 - 시스템명 또는 항목명이 비어있습니다. 건너뜁니다.")
-                        continue
-                    
-                    # 시스템 생성 또는 조회
-                    if system_name not in systems:
-                        system = System(system_name=system_name)
-                        db.add(system)
-                        db.flush()  # ID 생성
-                        systems[system_name] = system
-                        print(f"시스템 생성: {system_name} (ID: {system.id})")
-                    
-                    system = systems[system_name]
-                    
-                    # 체크 항목 생성 또는 조회
-                    item_key = (system.id, item_name)
-                    if item_key not in check_items:
-                        order_index = int(order_index_str) if order_index_str else 0
-                        check_item = CheckItem(
-                            system_id=system.id,
-                            item_name=item_name,
-                            description=description if description else None,
-                            order_index=order_index
-                        )
-                        db.add(check_item)
-                        db.flush()  # ID 생성
-                        check_items[item_key] = check_item
-                        print(f"체크 항목 생성: {item_name} (시스템: {system_name})")
-                    
-                    # 사용자 할당 정보 수집
-                    if user_names_str:
-                        user_names = [name.strip() for name in user_names_str.split(',') if name.strip()]
-                        for user_name in user_names:
-                            user_assignments.append((user_name, system.id, item_name))
-                
-                except Exception as e:
-                    print(f"오류: {row_idx}행 처리 중 오류 발생: {e}")
-                    continue
+        print(f"파일: {csv_file_path}")
+        print(f"배치 크기: {batch_size}")
+        print(f"import 방식: {mode}")
         
-        db.commit()
-        print(f"\n[3] 시스템 및 체크 항목 생성 완료")
-        print(f"  - 시스템 수: {len(systems)}")
-        print(f"  - 체크 항목 수: {len(check_items)}")
+        progress = lambda rows, phase="reading": print(f"  처리 중... {rows}행 ({phase})")
+        if mode == "replace":
+            result = import_checklist(
+                db,
+                csv_file_path,
+                batch_size=batch_size,
+                progress=progress,
+                allow_unknown_users=allow_unknown_users,
+            )
+        else:
+            result = sync_checklist(
+                db,
+                csv_file_path,
+                batch_size=batch_size,
+                delete_missing=delete_missing,
+                progress=progress,
+                allow_unknown_users=allow_unknown_users,
+            )
         
-        # 사용자 할당 생성
-        print("\n[4] 사용자 할당 생성 중...")
-        assignment_count = 0
-        skipped_count = 0
+        # 오늘 체크 슬롯을 바뀐 체크 항목에 맞춤
+        refresh_slots(db, get_korea_today())
         
-        for user_name, system_id, item_name in user_assignments:
-            try:
-                # 사용자 조회
-                user = db.query(User).filter(User.name == user_name).first()
-                if not user:
-                    print(f"경고: 사용자를 찾을 수 없습니다: {user_name}")
-                    skipped_count += 1
-                    continue
-                
-                # 체크 항목 조회
-                check_item = check_items.get((system_id, item_name))
-                if not check_item:
-                    print(f"경고: 체크 항목을 찾을 수 없습니다: {item_name} (시스템 ID: {system_id})")
-                    skipped_count += 1
-                    continue
-                
-                # 할당 생성 (중복 체크)
-                existing = db.query(UserSystemAssignment).filter(
-                    UserSystemAssignment.user_id == user.id,
-                    UserSystemAssignment.system_id == system_id,
-                    UserSystemAssignment.item_name == item_name
-                ).first()
-                
-                if not existing:
-                    assignment = UserSystemAssignment(
-                        user_id=user.id,
-                        system_id=system_id,
-                        item_name=item_name,
-                        user_name=user.name
-                    )
-                    db.add(assignment)
-                    assignment_count += 1
-            
-            except Exception as e:
-                print(f"오류: 사용자 할당 생성 중 오류 발생 ({user_name}, {item_name}): {e}")
-                skipped_count += 1
-                continue
+        for warning in result.warnings:
+            print(f"경고: {warning}")
         
-        db.commit()
-        print(f"\n[5] 사용자 할당 생성 완료")
-        print(f"  - 생성된 할당 수: {assignment_count}")
-        print(f"  - 건너뛴 할당 수: {skipped_count}")
+        print(f"\n[결과]")
+        print(f"  - 처리한 행 수: {result.rows}")
+        print(f"  - 시스템: 신규 {result.systems_created}개, 기존 재사용 {result.systems_reused}개")
+        if mode == "replace":
+            print(f"  - 체크 항목 수: {result.items_created}")
+            print(f"  - 생성된 할당 수: {result.assignments_created}")
+        else:
+            print(
+                f"  - 체크 항목: 추가 {result.items_created}, 수정 {result.items_updated}, "
+                f"삭제 {result.items_deleted}, 변경 없음 {result.items_unchanged}"
+            )
+            print(
+                f"  - 할당: 추가 {result.assignments_created}, 삭제 {result.assignments_deleted}, "
+                f"변경 없음 {result.assignments_unchanged}"
+            )
+            if result.records_deleted:
+                print(f"  - 삭제된 항목의 체크 기록: {result.records_deleted}")
+            print_diff(result)
+        print(f"  - 건너뛴 할당 수: {result.assignments_skipped}")
+        print(f"  - 소요 시간: {result.elapsed:.3f}초 ({result.rows_per_second:,.0f}행/초)")
         
         print("\n" + "=" * 60)
         print("체크리스트 데이터 Import 완료!")
         print("=" * 60)
+        return True
+    
+    except ImportValidationError as e:
+        print_validation(e.validation)
+        print("\n검증 오류가 있어 import를 중단했습니다. (DB 변경 없음)")
+        return False
     
     except Exception as e:
-        db.rollback()
         print(f"\n오류 발생: {e}")
+        print("변경 사항을 모두 취소했습니다. (기존 데이터 유지)")
         import traceback
         traceback.print_exc()
         raise
@@ -189,12 +163,95 @@ def import_checklist_data(csv_file_path=None):
         db.close()
 
 
-if __name__ == "__main__":
-    import sys
+def validate_checklist_data(csv_file_path=None, allow_unknown_users=False):
+    """
+    파일 검증만 수행 (dry-run, DB를 변경하지 않음)
+    
+    Returns:
+        bool: 오류가 없으면 True
+    """
+    csv_file_path = Path(csv_file_path) if csv_file_path else DEFAULT_CSV_FILE
+    if not csv_file_path.exists():
+        print(f"오류: 파일을 찾을 수 없습니다: {csv_file_path}")
+        return False
     
-    csv_file = None
-    if len(sys.argv) > 1:
-        csv_file = sys.argv[1]
+    db: Session = SessionLocal()
+    try:
+        print(f"파일 검증 (dry-run): {csv_file_path}")
+        validation = validate_checklist(db, csv_file_path, allow_unknown_users=allow_unknown_users)
+    except ValueError as e:
+        print(f"오류: {e}")
+        return False
+    finally:
+        db.close()
     
-    import_checklist_data(csv_file)
+    print_validation(validation)
+    return validation.ok
+
+
+def print_validation(validation, limit=50):
+    """검증 결과 출력 (오류/경고는 최대 limit개)"""
+    print(f"\n[검증 결과] {'통과' if validation.ok else '실패'} ({validation.elapsed:.3f}초)")
+    print(f"  - 행 수: {validation.rows}")
+    print(f"  - 체크 항목 수: {validation.items}")
+    print(f"  - 담당자 할당 수: {validation.assignments}")
+    if validation.new_systems:
+        print(f"  - 새 시스템 ({len(validation.new_systems)}개): {', '.join(sorted(validation.new_systems))}")
+    for title, messages in (("오류", validation.errors), ("경고", validation.warnings)):
+        if not messages:
+            continue
+        print(f"\n  [{title}] {len(messages)}건")
+        for message in messages[:limit]:
+            print(f"    - {message}")
+        if len(messages) > limit:
+            print(f"    ... 외 {len(messages) - limit}건")
+
 
+def print_diff(result, limit=20):
+    """sync 결과의 변경 내역 출력 (종류별 최대 limit개)"""
+    sections = [
+        ("체크 항목 추가", result.item_inserts),
+        ("체크 항목 수정", result.item_updates),
+        ("체크 항목 삭제", result.item_deletes),
+        ("할당 추가", result.assignment_inserts),
+        ("할당 삭제", result.assignment_deletes),
+    ]
+    for title, keys in sections:
+        if not keys:
+            continue
+        print(f"\n  [{title}] {len(keys)}건")
+        for key in sorted(keys)[:limit]:
+            print(f"    - {' / '.join(str(k) for k in key)}")
+        if len(keys) > limit:
+            print(f"    ... 외 {len(keys) - limit}건")
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="체크리스트 데이터 CSV/XLSX import")
+    parser.add_argument("csv_file", nargs="?", help="CSV/XLSX 파일 경로 (기본값: database/checklist_data_0115_bom.csv)")
+    parser.add_argument("--mode", choices=["sync", "replace"], default="sync", help="import 방식 (기본값: sync)")
+    parser.add_argument(
+        "--delete-missing",
+        action="store_true",
+        help="sync 모드에서 파일에 없는 항목/할당 삭제 (항목의 체크 기록/로그/일별 슬롯도 함께 삭제)",
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help=f"배치 크기 (기본값: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--dry-run", action="store_true", help="파일 검증만 하고 import하지 않음")
+    parser.add_argument("--allow-unknown-users", action="store_true", help="등록되지 않은 담당자는 경고로 처리하고 해당 할당만 건너뜀")
+    args = parser.parse_args()
+    
+    if args.dry_run:
+        ok = validate_checklist_data(args.csv_file, allow_unknown_users=args.allow_unknown_users)
+        sys.exit(0 if ok else 1)
+    
+    ok = import_checklist_data(
+        args.csv_file,
+        batch_size=args.batch_size,
+        mode=args.mode,
+        delete_missing=args.delete_missing,
+        allow_unknown_users=args.allow_unknown_users,
+    )
+    if not ok:
+        sys.exit(1)
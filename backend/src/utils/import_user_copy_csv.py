@@ -1,12 +1,18 @@
 """
-user copy.csv 파일을 데이터베이스에 import하는 스크립트
+사용자 CSV/XLSX 파일을 데이터베이스에 import하는 스크립트
+(XLSX는 첫 번째 시트를 한 행씩 스트리밍으로 읽습니다)
+
+실제 처리는 services/user_import.py의 import 엔진이 담당합니다.
+(사원번호 기준 bulk upsert, 새 사용자 초기 비밀번호 해시는 한 번만 계산)
 
 사용법:
-    python backend/src/utils/import_user_copy_csv.py
+    python backend/src/utils/import_user_copy_csv.py [CSV/XLSX 파일 경로] [--unique-salts] [--workers N]
+
+    파일 경로를 지정하지 않으면 database/user.csv를 사용합니다.
+    --unique-salts: 새 사용자마다 별도 salt로 비밀번호를 해시 (프로세스 풀로 병렬 계산)
 """
 import sys
-import os
-import csv
+import argparse
 from pathlib import Path
 
 # 프로젝트 루트를 Python 경로에 추가
@@ -16,98 +22,50 @@ sys.path.insert(0, str(project_root / "backend" / "src"))
 
 from sqlalchemy.orm import Session
 from services.database import SessionLocal
-from models.models import User
-from services.auth import get_password_hash
+from services.user_import import import_users as run_user_import, DEFAULT_PASSWORD, DEFAULT_BATCH_SIZE
 
 # CSV 파일 경로
-CSV_FILE = project_root / "database" / "user copy.csv"
-DEFAULT_PASSWORD = "1234"  # 기본 비밀번호
+CSV_FILE = project_root / "database" / "user.csv"
 
 
-def import_users():
-    """CSV 파일에서 사용자 데이터를 읽어 데이터베이스에 import"""
+def import_users(csv_file_path=None, unique_salts=False, workers=None, batch_size=DEFAULT_BATCH_SIZE):
+    """CSV/XLSX 파일에서 사용자 데이터를 읽어 데이터베이스에 import"""
+    csv_file = Path(csv_file_path) if csv_file_path else CSV_FILE
     db: Session = SessionLocal()
-    
+
     try:
-        if not CSV_FILE.exists():
-            print(f"오류: CSV 파일을 찾을 수 없습니다: {CSV_FILE}")
+        if not csv_file.exists():
+            print(f"오류: 파일을 찾을 수 없습니다: {csv_file}")
             return
-        
-        print(f"CSV 파일 읽기: {CSV_FILE}")
-        
-        with open(CSV_FILE, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            
-            imported_count = 0
-            updated_count = 0
-            skipped_count = 0
-            
-            for row in reader:
-                # 필수 필드 확인
-                employee_id = row.get('사원번호', '').strip()
-                name = row.get('사원명', '').strip()
-                email = row.get('이메일', '').strip()
-                
-                if not employee_id or not name or not email:
-                    print(f"  [건너뜀] 필수 필드 누락: 사원번호={employee_id}, 이름={name}, 이메일={email}")
-                    skipped_count += 1
-                    continue
-                
-                # 기존 사용자 확인
-                existing_user = db.query(User).filter(User.employee_id == employee_id).first()
-                
-                # 조직 정보 필드 읽기
-                division = row.get('부문', '').strip() or None
-                general_headquarters = row.get('총괄본부', '').strip() or None
-                headquarters = row.get('본부', '').strip() or None
-                department = row.get('부서', '').strip() or None
-                position = row.get('직위', '').strip() or None
-                role = row.get('직책', '').strip() or None
-                
-                if existing_user:
-                    # 기존 사용자 정보 업데이트
-                    existing_user.name = name
-                    existing_user.email = email
-                    existing_user.division = division
-                    existing_user.general_headquarters = general_headquarters
-                    existing_user.headquarters = headquarters
-                    existing_user.department = department
-                    existing_user.position = position
-                    existing_user.role = role
-                    # 비밀번호는 업데이트하지 않음 (기존 비밀번호 유지)
-                    print(f"  [업데이트] {name} ({employee_id}) - {email}")
-                    updated_count += 1
-                else:
-                    # 새 사용자 생성
-                    password_hash = get_password_hash(DEFAULT_PASSWORD)
-                    new_user = User(
-                        employee_id=employee_id,
-                        name=name,
-                        email=email,
-                        password_hash=password_hash,
-                        division=division,
-                        general_headquarters=general_headquarters,
-                        headquarters=headquarters,
-                        department=department,
-                        position=position,
-                        role=role
-                    )
-                    db.add(new_user)
-                    print(f"  [추가] {name} ({employee_id}) - {email}")
-                    imported_count += 1
-            
-            db.commit()
-            
-            print("\n" + "="*50)
-            print("Import 완료!")
-            print(f"  새로 추가: {imported_count}명")
-            print(f"  업데이트: {updated_count}명")
-            print(f"  건너뜀: {skipped_count}명")
+
+        print(f"파일 읽기: {csv_file}")
+        if unique_salts:
+            print(f"비밀번호 해시: 사용자별 salt (프로세스 {workers or '자동'}개)")
+
+        result = run_user_import(
+            db,
+            csv_file,
+            unique_salts=unique_salts,
+            workers=workers,
+            batch_size=batch_size,
+        )
+
+        for warning in result.warnings:
+            print(f"  [건너뜀] {warning}")
+
+        print("\n" + "="*50)
+        print("Import 완료!")
+        print(f"  새로 추가: {result.created}명")
+        print(f"  업데이트: {result.updated}명")
+        print(f"  변경 없음: {result.unchanged}명")
+        print(f"  건너뜀: {result.skipped}명")
+        print(f"  비밀번호 해시 시간: {result.hash_seconds:.3f}초")
+        print(f"  소요 시간: {result.elapsed:.3f}초 ({result.rows_per_second:,.0f}행/초)")
+        if result.created:
             print(f"  기본 비밀번호: {DEFAULT_PASSWORD}")
-            print("="*50)
-            
+        print("="*50)
+
     except Exception as e:
-        db.rollback()
         print(f"오류 발생: {e}")
         import traceback
         traceback.print_exc()
@@ -116,5 +74,11 @@ def import_users():
 
 
 if __name__ == "__main__":
-    import_users()
+    parser = argparse.ArgumentParser(description="사용자 데이터 CSV/XLSX import")
+    parser.add_argument("csv_file", nargs="?", help="CSV/XLSX 파일 경로 (기본값: database/user.csv)")
+    parser.add_argument("--unique-salts", action="store_true", help="새 사용자마다 별도 salt로 비밀번호 해시")
+    parser.add_argument("--workers", type=int, default=None, help="--unique-salts 사용 시 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help=f"배치 크기 (기본값: {DEFAULT_BATCH_SIZE})")
+    args = parser.parse_args()
 
+    import_users(args.csv_file, unique_salts=args.unique_salts, workers=args.workers, batch_size=args.batch_size)
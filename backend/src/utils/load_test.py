@@ -0,0 +1,492 @@
+"""
+HTTP 부하 테스트 스크립트 (주요 사용자 흐름)
+
+실행 중인 서버(또는 --start-server로 직접 띄운 서버)에 가상 사용자를 동시에 실행하여
+엔드포인트별 처리량(req/s), 지연 시간(p50/p95/p99/최대), 오류 수, 평균 쿼리 수(X-Query-Count)를 출력합니다.
+
+가상 사용자
+- 체크 담당자(--checkers명): 로그인 -> 담당 시스템 목록 -> 오늘 체크 기록 -> 시스템별 체크 항목 조회 후 제출
+  (--fail-rate 비율로 FAIL) -> 오늘 체크 기록을 반복합니다. 단계 사이에는 --think-time(초, ±50%)만큼 쉽니다.
+- console 사용자(--consoles명): 로그인 후 --poll-interval초마다 통계와 FAIL 항목 목록을 조회합니다.
+
+--checkers 10,50,100처럼 여러 값을 주면 동시 사용자 수를 늘려 가며 단계마다 --duration초씩 측정하므로,
+지연 시간이 급격히 늘어나는 지점으로 지원 가능한 담당자 수를 가늠할 수 있습니다.
+--json으로 저장한 결과를 --compare로 넘기면 단계/엔드포인트별 p95와 처리량을 비교하고,
+p95가 --max-regression(%) 넘게 늘었거나 오류가 생긴 경우 종료 코드 1을 반환합니다.
+
+로그인 계정은 서버와 같은 DB(--database-url 또는 .env의 DATABASE_URL)에서 담당 시스템이 있는 사용자를 조회하며,
+console 사용자는 console 사번(generate_synthetic_data.CONSOLE_EMPLOYEE_IDS) 중 DB에 있는 사용자입니다.
+체크 기록을 실제로 제출하므로 운영 DB(database/qa_checklist.db)에는 실행하지 않습니다.
+(generate_synthetic_data.py로 만든 DB 사용)
+
+--start-server는 uvicorn을 하위 프로세스로 띄우고, 스케줄러 메일이 실제로 발송되지 않도록 로컬 SMTP 싱크를 연결합니다.
+부하 생성기와 서버가 같은 CPU를 나눠 쓰므로, 정확한 한계를 보려면 서버 코어 외에 여유 코어가 있는 환경에서 실행하세요.
+
+사용법:
+    python backend/src/utils/load_test.py --start-server --database-url sqlite:///database/synthetic.db
+    python backend/src/utils/load_test.py --base-url http://127.0.0.1:8003 --database-url sqlite:///database/synthetic.db
+
+예시:
+    python backend/src/utils/load_test.py --start-server --database-url sqlite:///database/synthetic.db \\
+        --checkers 10,50,100 --duration 60 --json > before.json
+    python backend/src/utils/load_test.py --start-server --database-url sqlite:///database/synthetic.db \\
+        --checkers 10,50,100 --duration 60 --compare before.json
+"""
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "backend" / "src"))
+
+SERVER_START_TIMEOUT = 120  # 서버 시작 대기 시간 (초)
+REQUEST_TIMEOUT = 60  # 요청 하나의 최대 대기 시간 (초)
+
+# 결과에 표시할 엔드포인트 순서
+ENDPOINTS = (
+    "POST /api/auth/login",
+    "GET /api/user/systems",
+    "GET /api/systems/{id}/check-items",
+    "GET /api/checklist/today",
+    "POST /api/checklist/submit",
+    "GET /api/console/stats",
+    "GET /api/console/fail-items",
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="주요 사용자 흐름 HTTP 부하 테스트")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8003", help="서버 주소 (기본값: http://127.0.0.1:8003)")
+    parser.add_argument("--database-url", help="계정을 조회할 DB, 서버와 같은 DB (기본값: .env의 DATABASE_URL)")
+    parser.add_argument("--start-server", action="store_true", help="uvicorn 서버를 직접 띄워서 실행 (--base-url의 포트 사용)")
+    parser.add_argument("--server-workers", type=int, default=1, help="--start-server의 uvicorn 워커 수 (기본값: 1)")
+    parser.add_argument(
+        "--checkers",
+        default="20",
+        type=lambda value: [int(level) for level in value.split(",")],
+        help="동시 체크 담당자 수, 쉼표로 여러 단계 지정 (기본값: 20)",
+    )
+    parser.add_argument("--consoles", type=int, default=1, help="동시 console 사용자 수 (기본값: 1)")
+    parser.add_argument("--duration", type=float, default=30, help="단계별 측정 시간 (초, 기본값: 30)")
+    parser.add_argument("--ramp-up", type=float, default=5, help="가상 사용자를 나눠서 시작하는 시간 (초, 기본값: 5)")
+    parser.add_argument("--think-time", type=float, default=1.0, help="체크 담당자 단계 사이 대기 시간 (초, 기본값: 1.0)")
+    parser.add_argument("--poll-interval", type=float, default=5.0, help="console 조회 간격 (초, 기본값: 5.0)")
+    parser.add_argument("--systems-per-session", type=int, default=2, help="세션마다 체크할 시스템 수 (기본값: 2)")
+    parser.add_argument("--fail-rate", type=float, default=0.05, help="제출 항목 중 FAIL 비율 (기본값: 0.05)")
+    parser.add_argument("--password", default="1234", help="로그인 비밀번호 (기본값: 1234)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (기본값: 42)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력 (비교용)")
+    parser.add_argument("--compare", type=Path, help="이전 --json 결과 파일과 비교")
+    parser.add_argument("--max-regression", type=float, default=20, help="허용할 p95 증가율 (%%, 기본값: 20)")
+    return parser.parse_args()
+
+
+def percentile(sorted_values: list, percent: float) -> float:
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = min(max(math.ceil(percent / 100 * len(sorted_values)), 1), len(sorted_values))
+    return sorted_values[rank - 1]
+
+
+class Recorder:
+    """엔드포인트별 지연 시간/상태 코드/쿼리 수 기록 (여러 스레드에서 호출)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = {}
+        self.errors = {}
+        self.queries = {}
+        self.sessions = 0
+        self.polls = 0
+
+    def record(self, name: str, seconds: float, ok: bool, query_count: int = None):
+        with self._lock:
+            self.latencies.setdefault(name, []).append(seconds)
+            if not ok:
+                self.errors[name] = self.errors.get(name, 0) + 1
+            if query_count is not None:
+                self.queries[name] = self.queries.get(name, 0) + query_count
+
+    def count_session(self, console: bool = False):
+        with self._lock:
+            if console:
+                self.polls += 1
+            else:
+                self.sessions += 1
+
+    def summary(self, elapsed: float) -> dict:
+        endpoints = {}
+        for name in sorted(self.latencies, key=lambda name: ENDPOINTS.index(name) if name in ENDPOINTS else len(ENDPOINTS)):
+            values = sorted(self.latencies[name])
+            endpoints[name] = {
+                "requests": len(values),
+                "errors": self.errors.get(name, 0),
+                "rps": len(values) / elapsed if elapsed else 0.0,
+                "p50_ms": percentile(values, 50) * 1000,
+                "p95_ms": percentile(values, 95) * 1000,
+                "p99_ms": percentile(values, 99) * 1000,
+                "max_ms": values[-1] * 1000,
+                "avg_queries": self.queries.get(name, 0) / len(values),
+            }
+        total = sum(endpoint["requests"] for endpoint in endpoints.values())
+        return {
+            "elapsed_seconds": elapsed,
+            "requests": total,
+            "errors": sum(endpoint["errors"] for endpoint in endpoints.values()),
+            "rps": total / elapsed if elapsed else 0.0,
+            "checker_sessions": self.sessions,
+            "sessions_per_minute": self.sessions / elapsed * 60 if elapsed else 0.0,
+            "console_polls": self.polls,
+            "endpoints": endpoints,
+        }
+
+
+class ApiClient:
+    """가상 사용자 하나의 HTTP 연결 (keep-alive, 스레드마다 하나)"""
+
+    def __init__(self, base_url: str, recorder: Recorder):
+        parts = urlsplit(base_url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.recorder = recorder
+        self.token = None
+        self._conn = None
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = http.client.HTTPConnection(self.host, self.port, timeout=REQUEST_TIMEOUT)
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def request(self, method: str, path: str, name: str, body: dict = None, form: dict = None):
+        """요청 후 (상태 코드, JSON 본문) 반환, 연결 오류는 상태 코드 0으로 기록"""
+        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        payload = None
+        if form is not None:
+            payload = urlencode(form)
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        elif body is not None:
+            payload = json.dumps(body)
+            headers["Content-Type"] = "application/json"
+
+        started = time.perf_counter()
+        try:
+            conn = self._connection()
+            conn.request(method, path, body=payload, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException):
+            self.recorder.record(name, time.perf_counter() - started, ok=False)
+            self.close()
+            return 0, None
+        elapsed = time.perf_counter() - started
+
+        query_count = response.getheader("X-Query-Count")
+        self.recorder.record(name, elapsed, ok=response.status < 400, query_count=int(query_count) if query_count else None)
+        try:
+            return response.status, json.loads(data) if data else None
+        except ValueError:
+            return response.status, None
+
+    def login(self, employee_id: str, password: str) -> bool:
+        self.token = None
+        status, data = self.request(
+            "POST", "/api/auth/login", "POST /api/auth/login", form={"username": employee_id, "password": password}
+        )
+        if status == 200 and data:
+            self.token = data["access_token"]
+        return self.token is not None
+
+
+def pause(stop: threading.Event, rng: random.Random, seconds: float) -> bool:
+    """seconds(±50%)만큼 대기, 중지 요청이면 True"""
+    return stop.wait(rng.uniform(0.5, 1.5) * seconds) if seconds > 0 else stop.is_set()
+
+
+def checker_session(client: ApiClient, rng: random.Random, employee_id: str, args, stop: threading.Event):
+    """체크 담당자 한 명의 세션 (로그인부터 제출까지)"""
+    if not client.login(employee_id, args.password) or pause(stop, rng, args.think_time):
+        return
+    status, systems = client.request("GET", "/api/user/systems", "GET /api/user/systems")
+    client.request("GET", "/api/checklist/today", "GET /api/checklist/today")
+    if status != 200 or not systems:
+        return
+
+    for system in rng.sample(systems, min(len(systems), args.systems_per_session)):
+        if pause(stop, rng, args.think_time):
+            return
+        status, items = client.request(
+            "GET", f"/api/systems/{system['id']}/check-items", "GET /api/systems/{id}/check-items"
+        )
+        if status != 200 or not items or pause(stop, rng, args.think_time):
+            return
+        submitted = []
+        for item in items:
+            fail = rng.random() < args.fail_rate
+            submitted.append(
+                {"check_item_id": item["id"], "status": "FAIL" if fail else "PASS", "notes": "부하 테스트" if fail else None}
+            )
+        client.request("POST", "/api/checklist/submit", "POST /api/checklist/submit", body={"items": submitted})
+
+    client.request("GET", "/api/checklist/today", "GET /api/checklist/today")
+    client.recorder.count_session()
+
+
+def run_checker(base_url: str, recorder: Recorder, accounts: list, seed: int, args, stop: threading.Event):
+    rng = random.Random(seed)
+    client = ApiClient(base_url, recorder)
+    try:
+        while not stop.is_set():
+            checker_session(client, rng, rng.choice(accounts), args, stop)
+            pause(stop, rng, args.think_time)
+    finally:
+        client.close()
+
+
+def run_console(base_url: str, recorder: Recorder, employee_id: str, seed: int, args, stop: threading.Event):
+    rng = random.Random(seed)
+    client = ApiClient(base_url, recorder)
+    try:
+        if not client.login(employee_id, args.password):
+            return
+        while not stop.is_set():
+            client.request("GET", "/api/console/stats", "GET /api/console/stats")
+            client.request("GET", "/api/console/fail-items", "GET /api/console/fail-items")
+            recorder.count_session(console=True)
+            pause(stop, rng, args.poll_interval)
+    finally:
+        client.close()
+
+
+def run_level(base_url: str, checkers: int, checker_accounts: list, console_accounts: list, args) -> dict:
+    """동시 사용자 수 한 단계 실행 (램프업 후 duration초 동안)"""
+    recorder = Recorder()
+    stop = threading.Event()
+    targets = [(run_checker, checker_accounts) for _ in range(checkers)]
+    targets += [(run_console, console_accounts[index % len(console_accounts)]) for index in range(args.consoles if console_accounts else 0)]
+
+    threads = []
+    started = time.perf_counter()
+    for index, (target, account) in enumerate(targets):
+        thread = threading.Thread(
+            target=target,
+            args=(base_url, recorder, account, args.seed * 100003 + checkers * 1009 + index, args, stop),
+            daemon=True,
+        )
+        thread.start()
+        threads.append(thread)
+        if args.ramp_up > 0 and stop.wait(args.ramp_up / len(targets)):
+            break
+
+    stop.wait(max(0.0, started + args.ramp_up + args.duration - time.perf_counter()))
+    stop.set()
+    for thread in threads:
+        thread.join(REQUEST_TIMEOUT)
+    result = recorder.summary(time.perf_counter() - started)
+    result["checkers"] = checkers
+    result["consoles"] = args.consoles if console_accounts else 0
+    return result
+
+
+def load_accounts(seed: int):
+    """(담당 시스템이 있는 사용자 사번 목록, console 사번 목록)"""
+    from services.database import SessionLocal, engine, project_root as app_root
+    from models.models import User, UserSystemAssignment
+    from utils.generate_synthetic_data import CONSOLE_EMPLOYEE_IDS
+
+    # 실제로 체크 기록을 제출하므로 운영 DB에는 실행하지 않음
+    if engine.url.database and Path(engine.url.database).resolve() == (app_root / "database" / "qa_checklist.db").resolve():
+        print("[ERROR] 운영 DB(database/qa_checklist.db)에는 부하 테스트를 실행할 수 없습니다. --database-url을 지정하세요.")
+        sys.exit(1)
+
+    db = SessionLocal()
+    try:
+        checkers = [
+            employee_id
+            for (employee_id,) in db.query(User.employee_id)
+            .join(UserSystemAssignment, UserSystemAssignment.user_id == User.id)
+            .distinct()
+            .order_by(User.employee_id)
+        ]
+        consoles = [
+            employee_id
+            for (employee_id,) in db.query(User.employee_id)
+            .filter(User.employee_id.in_(CONSOLE_EMPLOYEE_IDS))
+            .order_by(User.employee_id)
+        ]
+    finally:
+        db.close()
+        engine.dispose()
+    random.Random(seed).shuffle(checkers)
+    return checkers, consoles
+
+
+def wait_for_server(base_url: str, process=None):
+    parts = urlsplit(base_url)
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"서버 프로세스가 종료되었습니다 (종료 코드 {process.returncode})")
+        try:
+            conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=2)
+            conn.request("GET", "/")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"{SERVER_START_TIMEOUT}초 안에 서버가 시작되지 않았습니다: {base_url}")
+
+
+def start_server(base_url: str, workers: int, smtp_env: dict):
+    """uvicorn 하위 프로세스 시작 (서버 로그는 LOG_LEVEL을 지정하지 않으면 ERROR 이상만 출력)"""
+    parts = urlsplit(base_url)
+    env = {**os.environ, **smtp_env, "LOG_LEVEL": os.getenv("LOG_LEVEL", "ERROR"), "SCHEDULER_TEST_EMAIL": ""}
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--host", parts.hostname, "--port", str(parts.port or 80),
+            "--workers", str(workers), "--no-access-log",
+        ],
+        cwd=str(project_root / "backend" / "src"),
+        env=env,
+        stdout=sys.stderr,
+    )
+
+
+def compare(result: dict, baseline: dict, max_regression: float) -> list:
+    """단계/엔드포인트별 p95, 처리량 비교 행과 회귀 여부
+
+    Returns:
+        list: [(checkers, 엔드포인트, 이전 p95, 현재 p95, 이전 rps, 현재 rps, 회귀 여부), ...]
+    """
+    previous_levels = {level["checkers"]: level for level in baseline["levels"]}
+    rows = []
+    for level in result["levels"]:
+        previous = previous_levels.get(level["checkers"])
+        if previous is None:
+            continue
+        for name, current in level["endpoints"].items():
+            before = previous["endpoints"].get(name)
+            if before is None:
+                continue
+            regressed = current["errors"] > before["errors"] or (
+                before["p95_ms"] > 0 and (current["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100 > max_regression
+            )
+            rows.append(
+                (level["checkers"], name, before["p95_ms"], current["p95_ms"], before["rps"], current["rps"], regressed)
+            )
+    return rows
+
+
+def print_report(result: dict):
+    print("=" * 100)
+    print("HTTP 부하 테스트")
+    print("=" * 100)
+    params = result["params"]
+    print(
+        f"대상: {params['base_url']}, 단계별 {params['duration']}초 (램프업 {params['ramp_up']}초), "
+        f"think time {params['think_time']}초, 계정 {params['accounts']}명"
+    )
+    for level in result["levels"]:
+        print(
+            f"\n[체크 담당자 {level['checkers']}명, console {level['consoles']}명] "
+            f"{level['requests']:,}건, {level['rps']:.1f} req/s, 오류 {level['errors']}건, "
+            f"세션 {level['sessions_per_minute']:.1f}/분"
+        )
+        print(
+            f"{'엔드포인트':<36} {'요청':>7} {'오류':>5} {'req/s':>8} {'p50(ms)':>9} {'p95(ms)':>9} "
+            f"{'p99(ms)':>9} {'최대(ms)':>9} {'쿼리':>6}"
+        )
+        print("-" * 100)
+        for name, endpoint in level["endpoints"].items():
+            print(
+                f"{name:<36} {endpoint['requests']:>7} {endpoint['errors']:>5} {endpoint['rps']:>8.2f} "
+                f"{endpoint['p50_ms']:>9.1f} {endpoint['p95_ms']:>9.1f} {endpoint['p99_ms']:>9.1f} "
+                f"{endpoint['max_ms']:>9.1f} {endpoint['avg_queries']:>6.1f}"
+            )
+    print("=" * 100)
+
+
+def print_comparison(rows: list, file=None):
+    print(f"\n{'담당자':>6} {'엔드포인트':<36} {'이전 p95':>10} {'현재 p95':>10} {'변화':>8} {'이전 req/s':>10} {'현재 req/s':>10}", file=file)
+    print("-" * 100, file=file)
+    for checkers, name, before_p95, current_p95, before_rps, current_rps, regressed in rows:
+        change = (current_p95 - before_p95) / before_p95 * 100 if before_p95 else 0.0
+        print(
+            f"{checkers:>6} {name:<36} {before_p95:>10.1f} {current_p95:>10.1f} {change:>+7.1f}% "
+            f"{before_rps:>10.2f} {current_rps:>10.2f}{'  << 회귀' if regressed else ''}",
+            file=file,
+        )
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    # services.database import 전에 계정을 조회할 DB 지정 (.env보다 우선, 서버에도 전달)
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+
+    checker_accounts, console_accounts = load_accounts(args.seed)
+    if not checker_accounts:
+        print("[ERROR] 담당 시스템이 있는 사용자가 없습니다. generate_synthetic_data.py로 데이터를 생성하세요.")
+        sys.exit(1)
+
+    server = None
+    sink = None
+    if args.start_server:
+        from utils.smtp_sink import SMTPSink
+
+        sink = SMTPSink().start()
+        server = start_server(args.base_url, args.server_workers, sink.env())
+    try:
+        wait_for_server(args.base_url, server)
+        levels = []
+        for checkers in args.checkers:
+            print(f"체크 담당자 {checkers}명 실행 중...", file=sys.stderr)
+            levels.append(run_level(args.base_url, checkers, checker_accounts, console_accounts, args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(30)
+        if sink is not None:
+            sink.stop()
+
+    result = {
+        "params": {
+            "base_url": args.base_url,
+            "duration": args.duration,
+            "ramp_up": args.ramp_up,
+            "think_time": args.think_time,
+            "poll_interval": args.poll_interval,
+            "systems_per_session": args.systems_per_session,
+            "accounts": len(checker_accounts),
+            "seed": args.seed,
+        },
+        "levels": levels,
+    }
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print_report(result)
+
+    if args.compare:
+        rows = compare(result, json.loads(args.compare.read_text(encoding="utf-8")), args.max_regression)
+        # --json이면 결과 JSON과 섞이지 않도록 비교 표는 stderr로 출력
+        print_comparison(rows, file=sys.stderr if args.json else None)
+        if any(row[-1] for row in rows):
+            print(f"\n[FAIL] p95가 {args.max_regression}% 넘게 늘었거나 오류가 생긴 엔드포인트가 있습니다.", file=sys.stderr)
+            sys.exit(1)
@@ -0,0 +1,45 @@
+"""
+체크 기록/로그 상태 컬럼 인코딩 변경 스크립트 (문자열 → SMALLINT)
+
+checklist_records.status, checklist_records_logs.status/action을 작은 정수 코드로 변환합니다.
+(PASS=1, FAIL=2 / CREATE=1, UPDATE=2, DELETE=3, API 응답은 기존과 같은 문자열)
+이미 변환된 테이블은 건너뛰므로 여러 번 실행해도 됩니다.
+
+실행 전에 서버를 중지하고 DB를 백업하세요.
+변환 후 SQLite 파일 크기를 줄이려면 VACUUM을 실행하세요.
+
+사용법:
+    python backend/src/utils/migrate_status_encoding.py [--dry-run]
+"""
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "backend" / "src"))
+
+from services.database import engine
+from services.status_migration import migrate_status_encoding
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="체크 기록/로그 상태 컬럼 인코딩 변경")
+    parser.add_argument("--dry-run", action="store_true", help="변환할 테이블만 확인")
+    args = parser.parse_args()
+
+    print("=" * 50)
+    stats = migrate_status_encoding(engine, dry_run=args.dry_run)
+    if not stats["tables"]:
+        print("변환할 테이블이 없습니다. (이미 SMALLINT 코드로 저장됨)")
+    elif args.dry_run:
+        print(f"변환할 테이블: {', '.join(stats['tables'])}")
+    else:
+        for table_name, rows in stats["tables"].items():
+            print(f"  {table_name}: {rows}행 변환")
+        if stats["views_dropped"]:
+            print(f"삭제된 VIEW: {', '.join(stats['views_dropped'])}")
+            print("  python backend/src/utils/create_views.py 로 다시 생성하세요.")
+        print("상태 컬럼 인코딩 변경 완료!")
+    print("=" * 50)
@@ -1,13 +1,16 @@
 """
 users 테이블 이메일 복구 스크립트
 
-백업 테이블에서 원래 이메일 주소를 복구합니다.
+backup_and_update_user_emails.py가 만든 스냅샷에서 원래 이메일 주소만 복구합니다.
+(다른 컬럼과 스냅샷 이후 추가된 사용자는 변경하지 않음)
 
 사용법:
-    python backend/src/utils/restore_user_emails.py [백업_테이블명]
-    
+    python backend/src/utils/restore_user_emails.py [스냅샷 파일]
+
 예시:
-    python backend/src/utils/restore_user_emails.py users_backup_20260115_143000
+    python backend/src/utils/restore_user_emails.py 20260115_143000_user_emails.db
+
+이전 버전이 운영 DB 안에 만든 백업 테이블(users_backup_*)을 지정하면 해당 테이블에서 복구합니다.
 """
 import sys
 from pathlib import Path
@@ -16,123 +19,88 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "backend" / "src"))
 
-from sqlalchemy import text
-from services.database import SessionLocal
+from sqlalchemy import inspect, text
+from services.database import SessionLocal, engine
+from services.db_snapshot import list_snapshots, resolve_snapshot, restore_columns
+
+
+def print_emails(db, title, limit):
+    result = db.execute(text(f"SELECT id, employee_id, name, email FROM users ORDER BY id LIMIT {limit}"))
+    print(f"\n  {title} (처음 {limit}개):")
+    print(f"  {'ID':<6} {'사번':<15} {'이름':<15} {'이메일':<30}")
+    print("  " + "-"*70)
+    for row in result:
+        print(f"  {row[0]:<6} {row[1]:<15} {row[2]:<15} {row[3]:<30}")
+
 
-def restore_emails(backup_table_name):
-    """백업 테이블에서 원래 이메일 복구"""
+def print_available_backups():
+    print("\n사용 가능한 스냅샷:")
+    snapshots = [path for path in list_snapshots() if "user_emails" in path.stem]
+    if snapshots:
+        for path in reversed(snapshots):
+            print(f"  - {path.name}")
+    else:
+        print("  (스냅샷이 없습니다)")
+    legacy_tables = [name for name in inspect(engine).get_table_names() if name.startswith("users_backup_")]
+    if legacy_tables:
+        print("\n이전 버전 백업 테이블 (복구 후 삭제 권장):")
+        for name in sorted(legacy_tables, reverse=True):
+            print(f"  - {name}")
+
+
+def restore_emails(backup_name):
+    """스냅샷(또는 이전 버전 백업 테이블)에서 원래 이메일 복구"""
     db = SessionLocal()
-    
+
     try:
         print("="*60)
         print("users 테이블 이메일 복구")
         print("="*60)
-        
-        # 백업 테이블 존재 확인
-        result = db.execute(text(f"""
-            SELECT name FROM sqlite_master 
-            WHERE type='table' AND name='{backup_table_name}'
-        """))
-        if not result.fetchone():
-            print(f"\n오류: 백업 테이블 '{backup_table_name}'을 찾을 수 없습니다.")
-            print("\n사용 가능한 백업 테이블:")
-            result = db.execute(text("""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name LIKE 'users_backup_%'
-                ORDER BY name DESC
-            """))
-            backups = result.fetchall()
-            if backups:
-                for backup in backups:
-                    print(f"  - {backup[0]}")
-            else:
-                print("  (백업 테이블이 없습니다)")
-            return
-        
-        # 백업 테이블 행 수 확인
-        result = db.execute(text(f"SELECT COUNT(*) FROM {backup_table_name}"))
-        backup_count = result.scalar()
-        print(f"\n백업 테이블: {backup_table_name}")
-        print(f"백업된 행 수: {backup_count}개")
-        
-        # 현재 users 테이블 행 수 확인
-        result = db.execute(text("SELECT COUNT(*) FROM users"))
-        current_count = result.scalar()
-        print(f"현재 users 테이블 행 수: {current_count}개")
-        
-        if backup_count != current_count:
-            print("\n경고: 백업 테이블과 현재 테이블의 행 수가 다릅니다!")
-            response = input("계속하시겠습니까? (y/n): ")
-            if response.lower() != 'y':
-                print("복구를 취소했습니다.")
+
+        legacy_table = backup_name.startswith("users_backup_") and inspect(engine).has_table(backup_name)
+        if not legacy_table:
+            try:
+                snapshot_path = resolve_snapshot(backup_name)
+            except FileNotFoundError as e:
+                print(f"\n오류: {e}")
+                print_available_backups()
                 return
-        
+            print(f"\n스냅샷: {snapshot_path}")
+        else:
+            print(f"\n백업 테이블: {backup_name}")
+
         # 복구 전 현재 상태 확인
         print("\n[1단계] 복구 전 현재 이메일 상태 확인")
-        result = db.execute(text("""
-            SELECT 
-                id,
-                employee_id,
-                name,
-                email
-            FROM users
-            ORDER BY id
-            LIMIT 5
-        """))
-        
-        print("\n  현재 이메일 (처음 5개):")
-        print(f"  {'ID':<6} {'사번':<15} {'이름':<15} {'이메일':<30}")
-        print("  " + "-"*70)
-        for row in result:
-            print(f"  {row[0]:<6} {row[1]:<15} {row[2]:<15} {row[3]:<30}")
-        
+        print_emails(db, "현재 이메일", 5)
+
         # 복구 실행
         print("\n[2단계] 이메일 복구 실행...")
-        result = db.execute(text(f"""
-            UPDATE users
-            SET email = (
-                SELECT email 
-                FROM {backup_table_name} 
-                WHERE {backup_table_name}.id = users.id
-            )
-            WHERE EXISTS (
-                SELECT 1 
-                FROM {backup_table_name} 
-                WHERE {backup_table_name}.id = users.id
-            )
-        """))
-        db.commit()
-        restored_count = result.rowcount
+        if legacy_table:
+            result = db.execute(text(f"""
+                UPDATE users
+                SET email = (SELECT email FROM {backup_name} WHERE {backup_name}.id = users.id)
+                WHERE EXISTS (SELECT 1 FROM {backup_name} WHERE {backup_name}.id = users.id)
+            """))
+            db.commit()
+            restored_count = result.rowcount
+        else:
+            db.close()
+            restored_count = restore_columns(snapshot_path, "users", ["email"])
         print(f"  복구 완료: {restored_count}개 행")
-        
+
         # 복구 후 상태 확인
         print("\n[3단계] 복구 후 이메일 상태 확인")
-        result = db.execute(text("""
-            SELECT 
-                id,
-                employee_id,
-                name,
-                email
-            FROM users
-            ORDER BY id
-            LIMIT 10
-        """))
-        
-        print("\n  복구된 이메일 (처음 10개):")
-        print(f"  {'ID':<6} {'사번':<15} {'이름':<15} {'이메일':<30}")
-        print("  " + "-"*70)
-        for row in result:
-            print(f"  {row[0]:<6} {row[1]:<15} {row[2]:<15} {row[3]:<30}")
-        
+        print_emails(db, "복구된 이메일", 10)
+
         # 고유 이메일 개수 확인
         result = db.execute(text("SELECT COUNT(DISTINCT email) FROM users"))
         unique_emails = result.scalar()
         print(f"\n  고유 이메일 수: {unique_emails}개")
-        
+
         print("\n" + "="*60)
         print("이메일 복구 완료!")
         print("="*60)
-        
+
     except Exception as e:
         db.rollback()
         print(f"\n오류 발생: {e}")
@@ -144,25 +112,8 @@ def restore_emails(backup_table_name):
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("사용법: python backend/src/utils/restore_user_emails.py [백업_테이블명]")
-        print("\n사용 가능한 백업 테이블 확인:")
-        db = SessionLocal()
-        try:
-            result = db.execute(text("""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name LIKE 'users_backup_%'
-                ORDER BY name DESC
-            """))
-            backups = result.fetchall()
-            if backups:
-                for backup in backups:
-                    print(f"  - {backup[0]}")
-            else:
-                print("  (백업 테이블이 없습니다)")
-        finally:
-            db.close()
+        print("사용법: python backend/src/utils/restore_user_emails.py [스냅샷 파일]")
+        print_available_backups()
         sys.exit(1)
-    
-    backup_table_name = sys.argv[1]
-    restore_emails(backup_table_name)
 
+    restore_emails(sys.argv[1])
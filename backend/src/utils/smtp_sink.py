@@ -0,0 +1,221 @@
+"""로컬 SMTP 싱크 (개발/벤치마크용)
+
+실제 메일 서버 없이 send_email()을 그대로 실행할 수 있도록, 수신한 메일을
+메모리에 기록만 하는 최소한의 SMTP 서버입니다. 외부로는 아무것도 발송하지 않습니다.
+
+지원 명령: HELO/EHLO, AUTH PLAIN/LOGIN(모든 계정 허용), MAIL, RCPT, DATA, RSET, NOOP, QUIT
+STARTTLS는 지원하지 않으므로 SMTP_STARTTLS=false로 설정해야 합니다.
+
+사용법:
+    # 단독 실행 (기본 포트 1025)
+    python backend/src/utils/smtp_sink.py [포트]
+
+    # .env 설정 예시
+    SMTP_HOST=127.0.0.1
+    SMTP_PORT=1025
+    SMTP_USER=sink
+    SMTP_PASSWORD=sink
+    SMTP_STARTTLS=false
+
+    # 코드에서 사용 (in-process)
+    with SMTPSink() as sink:
+        os.environ.update(sink.env())
+        send_email(...)
+        print(len(sink.messages))
+"""
+import email
+import email.header
+import socketserver
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class SinkMessage:
+    """싱크가 수신한 메일 1건"""
+
+    mail_from: str
+    rcpt_tos: List[str]
+    data: bytes
+    received_at: float = field(default_factory=time.time)
+
+    @property
+    def subject(self) -> str:
+        message = email.message_from_bytes(self.data)
+        return str(email.header.make_header(email.header.decode_header(message.get("Subject", ""))))
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """SMTP 세션 1개 처리 (연결당 스레드 1개)"""
+
+    def _reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+    def _readline(self) -> str:
+        return self.rfile.readline().decode("utf-8", "replace").rstrip("\r\n")
+
+    def _read_command(self):
+        raw = self.rfile.readline()
+        if not raw:
+            return None
+        return raw.decode("utf-8", "replace").rstrip("\r\n")
+
+    def _read_data(self) -> bytes:
+        chunks = []
+        while True:
+            line = self.rfile.readline()
+            if not line or line in (b".\r\n", b".\n"):
+                break
+            # dot-stuffing 해제
+            if line.startswith(b".."):
+                line = line[1:]
+            chunks.append(line)
+        return b"".join(chunks)
+
+    def handle(self):
+        sink: "SMTPSink" = self.server.sink
+        mail_from = ""
+        rcpt_tos: List[str] = []
+
+        self._reply("220 smtp-sink ready")
+        while True:
+            line = self._read_command()
+            if line is None:
+                break
+            command, _, arg = line.partition(" ")
+            command = command.upper()
+
+            if command == "EHLO":
+                self.wfile.write(
+                    b"250-smtp-sink\r\n250-AUTH PLAIN LOGIN\r\n250-8BITMIME\r\n250 SMTPUTF8\r\n"
+                )
+            elif command == "HELO":
+                self._reply("250 smtp-sink")
+            elif command == "AUTH":
+                mechanism, _, initial = arg.partition(" ")
+                if mechanism.upper() == "LOGIN":
+                    if not initial:
+                        self._reply("334 VXNlcm5hbWU6")
+                        self._readline()
+                    self._reply("334 UGFzc3dvcmQ6")
+                    self._readline()
+                elif not initial:
+                    self._reply("334 ")
+                    self._readline()
+                self._reply("235 2.7.0 Authentication successful")
+            elif command == "MAIL":
+                mail_from = arg.split(":", 1)[-1].strip().strip("<>")
+                rcpt_tos = []
+                self._reply("250 OK")
+            elif command == "RCPT":
+                rcpt_tos.append(arg.split(":", 1)[-1].strip().strip("<>"))
+                self._reply("250 OK")
+            elif command == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                data = self._read_data()
+                sink._record(SinkMessage(mail_from=mail_from, rcpt_tos=rcpt_tos, data=data))
+                mail_from, rcpt_tos = "", []
+                self._reply("250 OK: queued")
+            elif command == "RSET":
+                mail_from, rcpt_tos = "", []
+                self._reply("250 OK")
+            elif command == "NOOP":
+                self._reply("250 OK")
+            elif command == "QUIT":
+                self._reply("221 Bye")
+                break
+            elif command == "STARTTLS":
+                self._reply("454 TLS not available")
+            else:
+                self._reply("502 Command not implemented")
+
+
+class _SinkServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class SMTPSink:
+    """수신 메일을 메모리에 기록하는 in-process SMTP 서버
+
+    Args:
+        host: 바인딩할 호스트 (기본값: 127.0.0.1)
+        port: 바인딩할 포트 (0이면 임의의 빈 포트 사용)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._server = _SinkServer((host, port), _SMTPHandler)
+        self._server.sink = self
+        self._thread = None
+        self._lock = threading.Lock()
+        self.messages: List[SinkMessage] = []
+
+    @property
+    def host(self) -> str:
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def _record(self, message: SinkMessage):
+        with self._lock:
+            self.messages.append(message)
+
+    def clear(self):
+        """기록된 메일 초기화"""
+        with self._lock:
+            self.messages.clear()
+
+    def env(self) -> dict:
+        """send_email()이 이 싱크로 발송하도록 하는 환경 변수"""
+        return {
+            "SMTP_HOST": self.host,
+            "SMTP_PORT": str(self.port),
+            "SMTP_USER": "sink",
+            "SMTP_PASSWORD": "sink",
+            "SMTP_FROM_EMAIL": "sink@localhost",
+            "SMTP_USE_SSL": "false",
+            "SMTP_STARTTLS": "false",
+            "SMTP_CC_EMAILS": "",
+        }
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="smtp-sink", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import sys
+
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 1025
+    sink = SMTPSink(port=port).start()
+    print(f"SMTP 싱크 실행 중: {sink.host}:{sink.port} (종료: Ctrl+C)")
+    print("  .env 설정: SMTP_HOST=127.0.0.1, SMTP_PORT=%d, SMTP_STARTTLS=false" % sink.port)
+    seen = 0
+    try:
+        while True:
+            time.sleep(0.5)
+            for message in sink.messages[seen:]:
+                print(f"[수신] {message.mail_from} -> {', '.join(message.rcpt_tos)} | {message.subject}")
+            seen = len(sink.messages)
+    except KeyboardInterrupt:
+        sink.stop()
+        print(f"\n종료: 총 {seen}건 수신")
@@ -0,0 +1,62 @@
+"""pytest 공통 설정
+
+실행 (프로젝트 루트에서, pip install -r backend/requirements-dev.txt 후): python -m pytest -q backend/tests
+
+테스트는 항상 임시 SQLite DB를 사용합니다. (database/qa_checklist.db에 연결하지 않도록
+services.database를 import하기 전에 DATABASE_URL을 임시 경로로 설정)
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+_TEST_DB_DIR = tempfile.mkdtemp(prefix="qa_checklist_test_")
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(_TEST_DB_DIR, 'default.db').as_posix()}"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from services.database import Base  # noqa: E402
+import models.models  # noqa: E402,F401  (테이블 등록)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark", "핵심 알고리즘 벤치마크 (test_benchmarks.py)")
+    group.addoption(
+        "--benchmark-items", default="50", help="고정 데이터의 체크 항목 수, 쉼표로 여러 크기 지정 (기본값: 50)"
+    )
+    group.addoption("--benchmark-rounds", type=int, default=1, help="벤치마크별 측정 횟수 (기본값: 1)")
+    group.addoption(
+        "--benchmark-max-seconds", type=float, default=10, help="벤치마크별 측정 시간 한도 (초, 기본값: 10)"
+    )
+    group.addoption(
+        "--benchmark-save",
+        nargs="?",
+        const="",
+        help="결과를 JSON 기준선으로 저장 (경로 생략 시 database/benchmarks/<커밋>.json)",
+    )
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """테스트마다 새로 만드는 SQLite 파일 DB (현재 모델 스키마)"""
+    engine = create_engine(f"sqlite:///{(tmp_path / 'test.db').as_posix()}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    """테스트 DB용 SessionLocal (내부에서 SessionLocal()을 여는 작업은 monkeypatch로 교체)"""
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
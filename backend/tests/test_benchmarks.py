@@ -0,0 +1,50 @@
+"""핵심 알고리즘 벤치마크 (utils/benchmark_algorithms.py의 고정 데이터와 측정 함수 사용)
+
+기본값은 작은 고정 데이터(체크 항목 50개)로 1회씩만 측정하여 벤치마크가 동작하는지 확인합니다.
+기준선 측정/저장 (프로젝트 루트에서):
+    python -m pytest -q backend/tests/test_benchmarks.py --benchmark-items 500,1000 --benchmark-rounds 5 --benchmark-save
+저장한 기준선은 benchmark_algorithms.py --compare <커밋>으로 비교합니다.
+"""
+import pytest
+
+from utils.benchmark_algorithms import benchmark_meta, run_fixture_benchmarks, save_baseline
+
+SEED = 42  # benchmark_algorithms.py --seed 기본값과 같은 고정 데이터
+
+
+def pytest_generate_tests(metafunc):
+    if "item_count" in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption("benchmark_items").split(",")]
+        metafunc.parametrize("item_count", sizes, ids=[f"items={size}" for size in sizes])
+
+
+@pytest.fixture(scope="module")
+def baseline(request):
+    """크기별 측정 결과를 모아 --benchmark-save이면 기준선 JSON으로 저장"""
+    config = request.config
+    result = {"fixtures": {}, "results": {}}
+    yield result
+
+    save = config.getoption("benchmark_save")
+    if save is None or not result["results"]:
+        return
+    meta = benchmark_meta(config.getoption("benchmark_rounds"), config.getoption("benchmark_max_seconds"), SEED)
+    path = save_baseline({"meta": meta, **result}, save or None)
+    with config.pluginmanager.get_plugin("capturemanager").global_and_fixture_disabled():
+        print(f"\n기준선 저장: {path}")
+
+
+def test_algorithm_benchmarks(item_count, baseline, request):
+    config = request.config
+    counts, results = run_fixture_benchmarks(
+        item_count, SEED, config.getoption("benchmark_rounds"), config.getoption("benchmark_max_seconds")
+    )
+
+    assert counts["check_items"] == item_count
+    assert results
+    for name, entry in results.items():
+        assert name.endswith(f"[items={item_count}]")
+        assert entry["rounds"] >= 1 and entry["median_ms"] >= 0
+
+    baseline["fixtures"][str(item_count)] = counts
+    baseline["results"].update(results)
@@ -0,0 +1,173 @@
+"""체크리스트 sync import 테스트"""
+import csv
+from datetime import date, datetime
+
+from models.models import (
+    User,
+    System,
+    CheckItem,
+    UserSystemAssignment,
+    ChecklistRecord,
+    ChecklistRecordLog,
+    ChecklistDailySlot,
+)
+from services.checklist_import import sync_checklist, validate_checklist
+
+HEADER = ["user_name", "id", "system_id", "item_name", "description", "order_index", "created_at"]
+
+
+def write_checklist(path, rows):
+    """(담당자, 시스템, 항목, 설명, 순서) 행으로 체크리스트 CSV 작성"""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        for number, (user_name, system_name, item_name, description, order_index) in enumerate(rows, start=1):
+            writer.writerow([user_name, number, system_name, item_name, description, order_index, ""])
+    return path
+
+
+def add_checks(db, item_id: int, user_id: int, check_date: date):
+    """체크 항목에 체크 기록/로그/일별 슬롯 추가"""
+    checked_at = datetime(check_date.year, check_date.month, check_date.day, 9)
+    db.add(ChecklistRecord(user_id=user_id, check_item_id=item_id, check_date=check_date, status="PASS"))
+    db.add(
+        ChecklistRecordLog(
+            user_id=user_id,
+            check_item_id=item_id,
+            check_date=check_date,
+            status="PASS",
+            action="CREATE",
+            created_at=checked_at,
+        )
+    )
+    db.add(ChecklistDailySlot(check_date=check_date, check_item_id=item_id, status="PASS", checked_by=user_id))
+
+
+def orphan_count(db, model) -> int:
+    return db.query(model).filter(~model.check_item_id.in_(db.query(CheckItem.id))).count()
+
+
+def test_sync_adds_changes_and_removes_items_without_orphans(db, tmp_path):
+    db.add_all(
+        [
+            User(employee_id="1001", name="김담당", email="kim@example.com", password_hash="-"),
+            User(employee_id="1002", name="이담당", email="lee@example.com", password_hash="-"),
+        ]
+    )
+    db.commit()
+    kim, lee = db.query(User).order_by(User.id).all()
+
+    initial = write_checklist(
+        tmp_path / "initial.csv",
+        [
+            ("김담당", "주문시스템", "CPU 사용률 확인", "", 1),
+            ("김담당", "주문시스템", "디스크 사용률 확인", "", 2),
+            ("이담당", "주문시스템", "배치 결과 확인", "", 3),
+        ],
+    )
+    sync_checklist(db, initial)
+    items = {item.item_name: item for item in db.query(CheckItem)}
+    today = date(2026, 1, 15)
+    for item in items.values():
+        add_checks(db, item.id, kim.id, today)
+    db.commit()
+
+    # 항목 1개 추가, 1개 변경(설명), 1개 제거
+    updated = write_checklist(
+        tmp_path / "updated.csv",
+        [
+            ("김담당", "주문시스템", "CPU 사용률 확인", "95% 이상이면 FAIL", 1),
+            ("김담당", "주문시스템", "디스크 사용률 확인", "", 2),
+            ("이담당", "주문시스템", "메모리 사용률 확인", "", 4),
+        ],
+    )
+
+    # 기본값은 파일에 없는 항목을 유지
+    kept = sync_checklist(db, updated)
+    assert (kept.items_created, kept.items_updated, kept.items_deleted) == (1, 1, 0)
+    assert kept.items_unchanged == 1
+    assert db.query(CheckItem).count() == 4
+    assert db.query(ChecklistRecord).count() == 3
+
+    result = sync_checklist(db, updated, delete_missing=True)
+    assert (result.items_created, result.items_updated, result.items_deleted) == (0, 0, 1)
+    assert result.item_deletes == [("주문시스템", "배치 결과 확인")]
+    assert result.assignments_deleted == 1
+    assert result.records_deleted == 1
+
+    assert {item.item_name for item in db.query(CheckItem)} == {
+        "CPU 사용률 확인",
+        "디스크 사용률 확인",
+        "메모리 사용률 확인",
+    }
+    cpu = db.query(CheckItem).filter(CheckItem.item_name == "CPU 사용률 확인").one()
+    assert cpu.id == items["CPU 사용률 확인"].id  # 변경된 항목은 ID 유지
+    assert cpu.description == "95% 이상이면 FAIL"
+    assert db.query(System).count() == 1
+    assert {(a.user_name, a.item_name) for a in db.query(UserSystemAssignment)} == {
+        ("김담당", "CPU 사용률 확인"),
+        ("김담당", "디스크 사용률 확인"),
+        ("이담당", "메모리 사용률 확인"),
+    }
+
+    # 남은 항목의 체크 기록은 유지되고, 삭제된 항목의 기록/로그/슬롯은 남지 않음
+    assert db.query(ChecklistRecord).count() == 2
+    assert db.query(ChecklistRecordLog).count() == 2
+    assert db.query(ChecklistDailySlot).count() == 2
+    for model in (ChecklistRecord, ChecklistRecordLog, ChecklistDailySlot):
+        assert orphan_count(db, model) == 0
+
+
+def test_sync_keeps_duplicate_items_unless_delete_missing(db, tmp_path):
+    db.add(User(employee_id="1001", name="김담당", email="kim@example.com", password_hash="-"))
+    db.commit()
+    kim = db.query(User).one()
+
+    path = write_checklist(tmp_path / "checklist.csv", [("김담당", "주문시스템", "CPU 사용률 확인", "", 1)])
+    sync_checklist(db, path)
+    kept = db.query(CheckItem).one()
+
+    # 같은 키의 항목이 DB에 중복으로 있고 양쪽 모두 체크 기록이 있음
+    duplicate = CheckItem(system_id=kept.system_id, item_name=kept.item_name, description="", order_index=1)
+    db.add(duplicate)
+    db.commit()
+    kept_id, duplicate_id = kept.id, duplicate.id
+    add_checks(db, kept_id, kim.id, date(2026, 1, 15))
+    add_checks(db, duplicate_id, kim.id, date(2026, 1, 16))
+    db.commit()
+
+    validation = validate_checklist(db, path)
+    assert any("DB 체크 항목 중복: 주문시스템 / CPU 사용률 확인" in w for w in validation.warnings)
+
+    # 기본값은 중복 항목과 그 체크 기록을 건드리지 않음
+    result = sync_checklist(db, path)
+    assert (result.items_deleted, result.records_deleted) == (0, 0)
+    assert not result.has_changes
+    assert db.query(CheckItem).count() == 2
+    assert db.query(ChecklistRecord).filter(ChecklistRecord.check_item_id == duplicate_id).count() == 1
+
+    # delete_missing=True이면 중복 항목을 삭제하고 변경 내역에 표시
+    result = sync_checklist(db, path, delete_missing=True)
+    assert result.item_deletes == [("주문시스템", "CPU 사용률 확인", f"중복 ID {duplicate_id}")]
+    assert (result.items_deleted, result.records_deleted) == (1, 1)
+    assert [item.id for item in db.query(CheckItem)] == [kept_id]
+    for model in (ChecklistRecord, ChecklistRecordLog, ChecklistDailySlot):
+        assert orphan_count(db, model) == 0
+
+
+def test_sync_reports_writing_progress_per_commit(db, tmp_path):
+    db.add(User(employee_id="1001", name="김담당", email="kim@example.com", password_hash="-"))
+    db.commit()
+    path = write_checklist(
+        tmp_path / "checklist.csv",
+        [
+            ("김담당", "주문시스템", "CPU 사용률 확인", "", 1),
+            ("김담당", "주문시스템", "디스크 사용률 확인", "", 2),
+        ],
+    )
+
+    calls = []
+    sync_checklist(db, path, batch_size=1, commit_each_batch=True, progress=lambda *args: calls.append(args))
+
+    # 읽기 배치 2번, 쓰기(항목 2건 + 할당 2건) 커밋마다 1번
+    assert calls == [(1,), (2,), (1, "writing"), (2, "writing"), (3, "writing"), (4, "writing")]
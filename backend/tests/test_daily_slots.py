@@ -0,0 +1,97 @@
+"""일별 체크 슬롯 테스트"""
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from models.models import User, System, CheckItem, ChecklistRecord, ChecklistDailySlot
+from services import daily_slots
+
+TODAY = date(2026, 1, 14)
+
+
+@pytest.fixture
+def items(db):
+    """시스템 2개에 체크 항목 4개 (ID 1~4), 사용자 1명"""
+    db.add(User(employee_id="1001", name="김담당", email="kim@example.com", password_hash="-"))
+    db.add_all([System(system_name="주문시스템"), System(system_name="정산시스템")])
+    db.flush()
+    db.add_all(
+        [
+            CheckItem(system_id=1, item_name="CPU 사용률 확인"),
+            CheckItem(system_id=1, item_name="디스크 사용률 확인"),
+            CheckItem(system_id=2, item_name="배치 결과 확인"),
+            CheckItem(system_id=2, item_name="정산 파일 확인"),
+        ]
+    )
+    db.commit()
+
+
+def add_record(db, item_id, status, check_date=TODAY):
+    db.add(
+        ChecklistRecord(
+            user_id=1,
+            check_item_id=item_id,
+            check_date=check_date,
+            status=status,
+            checked_at=datetime(check_date.year, check_date.month, check_date.day, 9),
+        )
+    )
+
+
+def unchecked_ids(db, system_ids=None):
+    return [item.id for item in daily_slots.unchecked_items(db, TODAY, system_ids)]
+
+
+def test_slots_match_record_based_unchecked_items(db, items):
+    add_record(db, 2, "PASS")  # 슬롯 생성 전에 체크된 항목
+    add_record(db, 3, "FAIL")
+    add_record(db, 1, "PASS", check_date=TODAY - timedelta(days=1))
+    db.commit()
+    without_slots = unchecked_ids(db), unchecked_ids(db, [2])
+
+    assert daily_slots.create_daily_slots(db, TODAY) == {"created": 4, "removed": 0, "items": 4}
+    assert daily_slots.create_daily_slots(db, TODAY)["created"] == 0  # 다시 실행해도 같은 결과
+
+    assert (unchecked_ids(db), unchecked_ids(db, [2])) == without_slots == ([1, 4], [4])
+    assert daily_slots.slot_status_counts(db, TODAY) == {"PASS": 1, "FAIL": 1, "UNCHECKED": 2}
+    assert daily_slots.slot_status_counts(db, TODAY + timedelta(days=1)) is None
+
+    # 제출 시 슬롯 갱신
+    add_record(db, 4, "FAIL")
+    daily_slots.mark_slot(db, 4, TODAY, "FAIL", 1, datetime(2026, 1, 14, 10))
+    db.commit()
+    assert unchecked_ids(db) == [1]
+    assert daily_slots.slot_status_counts(db, TODAY) == {"PASS": 1, "FAIL": 2, "UNCHECKED": 1}
+
+
+def test_refresh_follows_item_changes(db, items):
+    daily_slots.create_daily_slots(db, TODAY)
+
+    db.query(CheckItem).filter(CheckItem.id == 2).delete()
+    db.add(CheckItem(system_id=1, item_name="메모리 사용률 확인"))
+    db.commit()
+    daily_slots.refresh_slots(db, TODAY)
+
+    slot_items = {item_id for (item_id,) in db.query(ChecklistDailySlot.check_item_id)}
+    assert slot_items == {1, 3, 4, 5}
+    assert unchecked_ids(db) == [1, 3, 4, 5]
+
+    # 슬롯이 없는 날짜는 만들지 않음
+    daily_slots.refresh_slots(db, TODAY + timedelta(days=1))
+    assert not daily_slots.has_slots(db, TODAY + timedelta(days=1))
+
+
+def test_instantiate_prunes_old_slots(db, items, session_factory, monkeypatch):
+    monkeypatch.setattr(daily_slots, "SessionLocal", session_factory)
+    monkeypatch.setattr(daily_slots, "DAILY_SLOT_RETENTION_DAYS", 7)
+    daily_slots.create_daily_slots(db, TODAY - timedelta(days=8))
+    daily_slots.create_daily_slots(db, TODAY - timedelta(days=7))
+
+    stats = daily_slots.instantiate_daily_slots(today=TODAY)
+
+    assert (stats["slots_created"], stats["slots_pruned"]) == (4, 4)
+    db.expire_all()
+    assert {check_date for (check_date,) in db.query(ChecklistDailySlot.check_date).distinct()} == {
+        TODAY - timedelta(days=7),
+        TODAY,
+    }
@@ -0,0 +1,161 @@
+"""일 마감 테스트"""
+from datetime import date, datetime
+
+import pytest
+
+from models.models import User, System, CheckItem, UserSystemAssignment, ChecklistRecord, ChecklistDailySnapshot
+from services import day_close
+
+CLOSE_DATE = date(2026, 1, 14)
+
+
+@pytest.fixture
+def catalog(db):
+    """시스템 2개, 체크 항목 3개, 담당자 2명"""
+    db.add_all(
+        [
+            User(employee_id="1001", name="김담당", email="kim@example.com", password_hash="-"),
+            User(employee_id="1002", name="이담당", email="lee@example.com", password_hash="-"),
+        ]
+    )
+    db.add_all([System(system_name="주문시스템"), System(system_name="정산시스템")])
+    db.flush()
+    db.add_all(
+        [
+            CheckItem(system_id=1, item_name="CPU 사용률 확인", order_index=1),
+            CheckItem(system_id=1, item_name="디스크 사용률 확인", order_index=2),
+            CheckItem(system_id=2, item_name="배치 결과 확인", order_index=1),
+        ]
+    )
+    db.add_all(
+        [
+            UserSystemAssignment(user_id=2, user_name="이담당", system_id=1, item_name="CPU 사용률 확인"),
+            UserSystemAssignment(user_id=1, user_name="김담당", system_id=1, item_name="디스크 사용률 확인"),
+            UserSystemAssignment(user_id=1, user_name="김담당", system_id=2, item_name="배치 결과 확인"),
+        ]
+    )
+    db.commit()
+
+
+def add_record(db, item_id, check_date, status, notes=None, user_id=1, hour=9):
+    db.add(
+        ChecklistRecord(
+            user_id=user_id,
+            check_item_id=item_id,
+            check_date=check_date,
+            status=status,
+            notes=notes,
+            checked_at=datetime(check_date.year, check_date.month, check_date.day, hour),
+        )
+    )
+
+
+def legacy_export_rows(db, start_date, end_date):
+    """일 마감 도입 전 엑셀 다운로드의 행 계산 (체크 기록과 현재 체크 항목 기준)"""
+    records = (
+        db.query(ChecklistRecord)
+        .filter(ChecklistRecord.check_date >= start_date, ChecklistRecord.check_date <= end_date)
+        .all()
+    )
+    system_map = {s.id: s.system_name for s in db.query(System)}
+    user_map = {u.id: u.name for u in db.query(User)}
+    assignment_map = {}
+    for assignment in db.query(UserSystemAssignment):
+        assignment_map.setdefault(assignment.system_id, set()).add(user_map[assignment.user_id])
+
+    latest = {}
+    for record in records:
+        key = (record.check_item_id, record.check_date)
+        if key not in latest or record.checked_at > latest[key].checked_at:
+            latest[key] = record
+
+    rows = []
+    for item in db.query(CheckItem):
+        for check_date in sorted({record.check_date for record in records}):
+            record = latest.get((item.id, check_date))
+            rows.append(
+                (
+                    check_date,
+                    item.system_id,
+                    item.item_name,
+                    system_map.get(item.system_id, ""),
+                    ", ".join(sorted(assignment_map.get(item.system_id, []))),
+                    record.status if record else "미점검",
+                    (record.notes or "") if record else "",
+                )
+            )
+    rows.sort(key=lambda row: row[:3])
+    return [row[:1] + row[2:] for row in rows]
+
+
+def export_rows(db, start_date, end_date):
+    """load_daily_results() 행을 엑셀 다운로드와 같은 값으로 변환"""
+    return [
+        (
+            row["snapshot_date"],
+            row["item_name"],
+            row["system_name"],
+            row["assignees"],
+            "미점검" if row["status"] == "UNCHECKED" else row["status"],
+            row["notes"] or "",
+        )
+        for row in day_close.load_daily_results(db, start_date, end_date)
+    ]
+
+
+def test_closed_day_matches_legacy_export(db, catalog):
+    add_record(db, 1, CLOSE_DATE, "PASS", hour=9)
+    add_record(db, 1, CLOSE_DATE, "FAIL", "응답 지연", user_id=2, hour=11)  # 같은 날 다시 체크 (최종 FAIL)
+    add_record(db, 3, CLOSE_DATE, "PASS", "정상", hour=10)
+    add_record(db, 2, date(2026, 1, 15), "PASS")  # 마감하지 않는 날
+    db.commit()
+    start, end = date(2026, 1, 13), date(2026, 1, 15)
+    expected = legacy_export_rows(db, start, end)
+    assert export_rows(db, start, end) == expected  # 마감 전
+
+    assert day_close.close_day(db, CLOSE_DATE) == 3
+
+    assert export_rows(db, start, end) == expected  # 마감 후 (스냅샷 + 마감 전 날짜)
+    assert day_close.snapshot_status_counts(db, CLOSE_DATE) == {"PASS": 1, "FAIL": 1, "UNCHECKED": 1}
+    assert day_close.snapshot_status_counts(db, date(2026, 1, 15)) is None
+    snapshot = (
+        db.query(ChecklistDailySnapshot)
+        .filter(ChecklistDailySnapshot.check_item_id == 1)
+        .one()
+    )
+    assert (snapshot.status, snapshot.notes, snapshot.checked_by) == ("FAIL", "응답 지연", 2)
+    assert day_close.count_statuses_by_date(day_close.load_daily_results(db, start, end)) == {
+        "2026-01-14": {"PASS": 1, "FAIL": 1, "UNCHECKED": 1},
+        "2026-01-15": {"PASS": 1, "FAIL": 0, "UNCHECKED": 2},
+    }
+
+
+def test_closed_day_is_not_rewritten(db, catalog):
+    add_record(db, 1, CLOSE_DATE, "PASS")
+    db.commit()
+    day_close.close_day(db, CLOSE_DATE)
+    closed = export_rows(db, CLOSE_DATE, CLOSE_DATE)
+
+    # 마감 후 체크 항목 이름 변경, 담당자 변경, 늦은 기록 추가
+    db.query(CheckItem).filter(CheckItem.id == 1).update({"item_name": "CPU 사용률 95% 이상 확인"})
+    db.query(UserSystemAssignment).filter(UserSystemAssignment.system_id == 1).delete()
+    add_record(db, 2, CLOSE_DATE, "FAIL", hour=23)
+    db.commit()
+
+    assert day_close.close_day(db, CLOSE_DATE) == 0
+    assert export_rows(db, CLOSE_DATE, CLOSE_DATE) == closed
+
+
+def test_close_pending_days_catches_up_and_skips_empty_days(db, catalog, session_factory, monkeypatch):
+    monkeypatch.setattr(day_close, "SessionLocal", session_factory)
+    add_record(db, 1, date(2026, 1, 12), "PASS")
+    add_record(db, 2, date(2026, 1, 14), "FAIL")
+    db.commit()
+
+    stats = day_close.close_pending_days(today=date(2026, 1, 15))
+
+    assert stats["closed_dates"] == ["2026-01-12", "2026-01-14"]
+    assert "2026-01-13" in stats["skipped_dates"]
+    assert stats["rows_scanned"] == 6
+    # 마지막 마감일 다음 날부터 이어서 마감
+    assert day_close.close_pending_days(today=date(2026, 1, 15))["closed_dates"] == []
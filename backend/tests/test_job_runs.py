@@ -0,0 +1,61 @@
+"""스케줄러 작업 실행 이력 테스트"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from models.models import SchedulerJobRun
+from services import job_runs
+
+
+@pytest.fixture
+def history_db(monkeypatch, session_factory):
+    monkeypatch.setattr(job_runs, "SessionLocal", session_factory)
+    monkeypatch.setattr(job_runs, "_pending_coalesced", {})
+    return session_factory
+
+
+def test_coalesced_runs_are_recorded(history_db, db):
+    async def run_scheduler():
+        # 앱과 같은 AsyncIOScheduler (작업 코루틴은 이벤트 리스너 처리 후 시작)
+        scheduler = AsyncIOScheduler(
+            job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": None}, timezone="Asia/Seoul"
+        )
+        scheduler.add_listener(job_runs.create_job_event_listener(scheduler), job_runs.JOB_EVENT_MASK)
+        finished = asyncio.Event()
+
+        async def job():
+            await asyncio.to_thread(job_runs.run_with_history, "coalesce_test", lambda: {})
+            finished.set()
+
+        # 10분 간격 작업의 예정 시간이 25분 전이면 -25, -15, -5분 실행이 밀림 → 1회 실행, 2회 합쳐짐
+        now = datetime.now(pytz.timezone("Asia/Seoul"))
+        scheduler.add_job(
+            job,
+            IntervalTrigger(minutes=10, start_date=now - timedelta(minutes=25), timezone="Asia/Seoul"),
+            id="coalesce_test",
+            next_run_time=now - timedelta(minutes=25),
+        )
+        scheduler.start()
+        try:
+            await asyncio.wait_for(finished.wait(), 10)
+        finally:
+            scheduler.shutdown(wait=False)
+
+    asyncio.run(run_scheduler())
+
+    runs = db.query(SchedulerJobRun).filter(SchedulerJobRun.job_id == "coalesce_test").all()
+    assert [(run.status, run.coalesced_runs) for run in runs] == [("SUCCESS", 2)]
+
+
+def test_count_coalesced_runs():
+    tz = pytz.timezone("Asia/Seoul")
+    start = tz.localize(datetime(2026, 1, 14, 9, 0))
+    trigger = IntervalTrigger(minutes=10, start_date=start, timezone="Asia/Seoul")
+
+    assert job_runs.count_coalesced_runs(trigger, start, start) == 0
+    assert job_runs.count_coalesced_runs(trigger, start, start + timedelta(minutes=30)) == 3
+    assert job_runs.count_coalesced_runs(trigger, None, start) == 0
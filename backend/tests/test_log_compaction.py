@@ -0,0 +1,125 @@
+"""체크 기록 로그 압축 테스트"""
+from datetime import date, datetime
+
+import pytest
+
+from models.models import User, System, CheckItem, ChecklistRecordLog
+from services import log_compaction
+from services.fail_history import group_status_history, summarize_fail_history
+
+OLD_DATE = date(2026, 1, 5)
+RECENT_DATE = date(2026, 2, 27)
+TODAY = date(2026, 3, 1)
+
+
+@pytest.fixture
+def compaction(monkeypatch, session_factory, tmp_path):
+    monkeypatch.setattr(log_compaction, "SessionLocal", session_factory)
+    monkeypatch.setattr(log_compaction, "LOG_ARCHIVE_DIR", tmp_path / "archive")
+    return lambda **kwargs: log_compaction.compact_record_logs(horizon_days=30, today=TODAY, **kwargs)
+
+
+@pytest.fixture
+def items(db):
+    """사용자 1명(ID 1), 체크 항목 3개(ID 1~3)"""
+    db.add(User(employee_id="1001", name="김담당", email="kim@example.com", password_hash="-"))
+    db.add(System(system_name="주문시스템"))
+    db.flush()
+    db.add_all([CheckItem(system_id=1, item_name=f"항목{i}", order_index=i) for i in range(1, 4)])
+    db.commit()
+
+
+def add_history(db, user_id, item_id, check_date, entries):
+    """(시:분, 상태, 비고) 목록으로 로그 추가"""
+    for index, (hhmm, status, notes) in enumerate(entries):
+        hour, minute = map(int, hhmm.split(":"))
+        db.add(
+            ChecklistRecordLog(
+                user_id=user_id,
+                check_item_id=item_id,
+                check_date=check_date,
+                status=status,
+                notes=notes,
+                action="CREATE" if index == 0 else "UPDATE",
+                created_at=datetime(check_date.year, check_date.month, check_date.day, hour, minute),
+            )
+        )
+
+
+def log_times(db, item_id, check_date):
+    return [
+        (log.created_at.strftime("%H:%M"), log.status, log.notes)
+        for log in db.query(ChecklistRecordLog)
+        .filter(ChecklistRecordLog.check_item_id == item_id, ChecklistRecordLog.check_date == check_date)
+        .order_by(ChecklistRecordLog.created_at)
+    ]
+
+
+def fail_summaries(db, check_date):
+    logs = db.query(ChecklistRecordLog).filter(ChecklistRecordLog.check_date == check_date).all()
+    return {item_id: summarize_fail_history(history) for item_id, history in group_status_history(logs).items()}
+
+
+def test_compaction_keeps_transitions_and_latest_fail_note(db, items, compaction):
+    # 항목 1: FAIL → FAIL → PASS → PASS → FAIL → FAIL (최종 FAIL, 최신 메모 "재발생 2")
+    add_history(
+        db,
+        1,
+        1,
+        OLD_DATE,
+        [
+            ("09:00", "FAIL", "디스크 부족"),
+            ("09:10", "FAIL", "디스크 부족 확인 중"),
+            ("09:20", "PASS", None),
+            ("09:30", "PASS", None),
+            ("09:40", "FAIL", "재발생"),
+            ("09:50", "FAIL", "재발생 2"),
+        ],
+    )
+    # 항목 2: 같은 상태만 반복 (첫 로그와 마지막 로그만 남음)
+    add_history(db, 1, 2, OLD_DATE, [("09:00", "PASS", None), ("10:00", "PASS", None), ("11:00", "PASS", "확인")])
+    # 항목 3: 보관 기간 이내 날짜는 압축하지 않음
+    add_history(db, 1, 3, RECENT_DATE, [("09:00", "PASS", None), ("10:00", "PASS", None), ("11:00", "PASS", None)])
+    db.commit()
+    before = fail_summaries(db, OLD_DATE)
+
+    stats = compaction()
+
+    assert stats["dates_compacted"] == 1
+    assert stats["groups_compacted"] == 2
+    assert stats["rows_deleted"] == 3
+    assert stats["rows_archived"] == 9
+    assert log_times(db, 1, OLD_DATE) == [
+        ("09:00", "FAIL", "디스크 부족"),  # 첫 로그
+        ("09:20", "PASS", None),  # FAIL → PASS
+        ("09:40", "FAIL", "재발생"),  # PASS → FAIL
+        ("09:50", "FAIL", "재발생 2"),  # 마지막 로그 (최신 FAIL 메모)
+    ]
+    assert log_times(db, 2, OLD_DATE) == [("09:00", "PASS", None), ("11:00", "PASS", "확인")]
+    assert len(log_times(db, 3, RECENT_DATE)) == 3
+
+    after = fail_summaries(db, OLD_DATE)
+    assert after == before
+    assert after[1]["notes"] == "재발생 2"
+    assert after[1]["fail_time"] == datetime(2026, 1, 5, 9, 0)
+
+    # 원본 로그는 보관 파일에 모두 남음
+    (archive_file,) = stats["archive_files"]
+    archived = log_compaction.read_archive(log_compaction.LOG_ARCHIVE_DIR / archive_file)
+    assert len(archived) == 9
+    assert {row["notes"] for row in archived} >= {"디스크 부족 확인 중"}
+
+    # 다시 실행해도 변경 없음
+    assert compaction()["rows_deleted"] == 0
+
+
+def test_dry_run_does_not_delete(db, items, compaction):
+    add_history(db, 1, 1, OLD_DATE, [("09:00", "PASS", None), ("10:00", "PASS", None), ("11:00", "PASS", None)])
+    db.commit()
+
+    stats = compaction(dry_run=True)
+
+    assert stats["rows_deleted"] == 1
+    assert stats["archive_files"] == []
+    assert len(log_times(db, 1, OLD_DATE)) == 3
+    assert not log_compaction.LOG_ARCHIVE_DIR.exists()
@@ -0,0 +1,126 @@
+"""체크 기록 월별 보관 테스트"""
+from datetime import date, datetime
+
+import pytest
+
+from models.models import User, System, CheckItem, ChecklistRecord
+from services import record_archive
+
+pytest.importorskip("pyarrow")
+
+TODAY = date(2026, 3, 10)
+
+
+@pytest.fixture
+def archive(monkeypatch, session_factory, tmp_path):
+    monkeypatch.setattr(record_archive, "SessionLocal", session_factory)
+    monkeypatch.setattr(record_archive, "RECORD_ARCHIVE_DIR", tmp_path / "archive")
+    return lambda: record_archive.archive_closed_months(retention_months=1, today=TODAY)
+
+
+@pytest.fixture
+def items(db):
+    db.add_all(
+        [
+            User(employee_id="1001", name="김담당", email="kim@example.com", password_hash="-"),
+            User(employee_id="1002", name="이담당", email="lee@example.com", password_hash="-"),
+        ]
+    )
+    db.add(System(system_name="주문시스템"))
+    db.flush()
+    db.add_all([CheckItem(system_id=1, item_name=f"항목{i}", order_index=i) for i in range(1, 4)])
+    db.commit()
+
+
+def add_record(db, item_id, check_date, status, notes=None, user_id=1, hour=9):
+    db.add(
+        ChecklistRecord(
+            user_id=user_id,
+            check_item_id=item_id,
+            check_date=check_date,
+            status=status,
+            notes=notes,
+            checked_at=datetime(check_date.year, check_date.month, check_date.day, hour),
+        )
+    )
+
+
+def as_rows(records):
+    return sorted(
+        (r.id, r.user_id, r.check_item_id, r.check_date, r.status, r.notes, r.checked_at) for r in records
+    )
+
+
+def test_load_records_returns_same_rows_after_archiving(db, items, archive):
+    for day in (5, 20):
+        add_record(db, 1, date(2025, 12, day), "PASS")
+        add_record(db, 2, date(2025, 12, day), "FAIL", "디스크 부족", user_id=2, hour=10)
+    add_record(db, 1, date(2026, 1, 7), "FAIL", "응답 지연")
+    add_record(db, 1, date(2026, 1, 7), "PASS", hour=11)  # 같은 날 다시 체크
+    add_record(db, 3, date(2026, 2, 3), "PASS")  # 보관 기간 이내
+    add_record(db, 2, date(2026, 3, 2), "PASS")  # 이번 달
+    db.commit()
+
+    start, end = date(2025, 12, 1), date(2026, 3, 31)
+    before = as_rows(record_archive.load_records(db, start, end))
+
+    stats = archive()
+
+    assert stats["months"] == ["2025-12", "2026-01"]
+    assert stats["rows_archived"] == 6
+    assert record_archive.archived_months() == [date(2025, 12, 1), date(2026, 1, 1)]
+    assert {r.check_date.month for r in db.query(ChecklistRecord)} == {2, 3}
+
+    db.expire_all()
+    assert as_rows(record_archive.load_records(db, start, end)) == before
+    # 보관된 달만 조회 / 월 중간 범위 조회
+    assert as_rows(record_archive.load_records(db, date(2026, 1, 7), date(2026, 1, 7))) == [
+        row for row in before if row[3] == date(2026, 1, 7)
+    ]
+    assert len(record_archive.load_records(db, date(2025, 12, 10), date(2025, 12, 31))) == 2
+
+    # 다시 실행해도 변경 없음
+    assert archive()["rows_archived"] == 0
+    assert as_rows(record_archive.load_records(db, start, end)) == before
+
+
+def test_late_record_is_merged_into_existing_archive(db, items, archive):
+    add_record(db, 1, date(2025, 12, 5), "PASS")
+    db.commit()
+    archive()
+
+    # 보관 후 같은 달에 기록이 추가된 경우 기존 파일과 합침
+    add_record(db, 2, date(2025, 12, 6), "FAIL", "늦게 입력")
+    db.commit()
+    stats = archive()
+
+    assert stats["rows_archived"] == 1
+    assert db.query(ChecklistRecord).count() == 0
+    records = record_archive.load_records(db, date(2025, 12, 1), date(2025, 12, 31))
+    assert sorted((r.check_item_id, r.status, r.notes) for r in records) == [
+        (1, "PASS", None),
+        (2, "FAIL", "늦게 입력"),
+    ]
+
+
+def test_console_stats_reads_archived_records(db, items, archive, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import main
+    from services.database import get_db
+
+    add_record(db, 1, date(2025, 12, 5), "PASS")
+    add_record(db, 2, date(2025, 12, 5), "FAIL", "디스크 부족")
+    db.commit()
+    archive()
+
+    console_user = User(employee_id=main.CONSOLE_ACCESS_EMPLOYEE_IDS[0], name="관리자", email="-", password_hash="-")
+    monkeypatch.setitem(main.app.dependency_overrides, get_db, lambda: db)
+    monkeypatch.setitem(main.app.dependency_overrides, main.get_current_user, lambda: console_user)
+    monkeypatch.setattr(main, "get_korea_today", lambda: TODAY)
+
+    # 일 마감 스냅샷이 없는 보관된 날짜도 보관 파일의 기록으로 계산
+    response = TestClient(main.app).get("/api/console/stats", params={"target_date": "2025-12-05"})
+
+    assert response.status_code == 200
+    assert response.json() == {"pass_count": 1, "fail_count": 1, "unchecked_count": 1}
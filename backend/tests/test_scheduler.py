@@ -0,0 +1,61 @@
+"""미체크 알림 대상 그룹화 테스트"""
+from datetime import date
+
+from sqlalchemy import event
+
+from models.models import User, System, CheckItem, UserSystemAssignment
+from services.daily_slots import unchecked_items
+from services.scheduler import group_unchecked_items
+
+
+def count_queries(engine, func):
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        return func(), len(statements)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+
+def test_group_unchecked_items_uses_constant_queries(db, engine):
+    systems = 20
+    db.add_all([System(system_name=f"시스템{i:02d}") for i in range(1, systems + 1)])
+    db.add_all(
+        [
+            User(employee_id=f"{1000 + i}", name=f"담당자{i}", email=f"user{i}@example.com", password_hash="-")
+            for i in range(1, 11)
+        ]
+    )
+    db.flush()
+    db.add_all(
+        [
+            CheckItem(system_id=system_id, item_name=f" 항목{system_id}-{n} ", order_index=n)
+            for system_id in range(1, systems + 1)
+            for n in range(1, 4)
+        ]
+    )
+    # 시스템 1~19만 담당자 있음, 같은 담당자가 여러 시스템/항목에 할당
+    db.add_all(
+        [
+            UserSystemAssignment(
+                user_id=system_id % 10 + 1, user_name="-", system_id=system_id, item_name=f"항목{system_id}-{n}"
+            )
+            for system_id in range(1, systems)
+            for n in range(1, 4)
+        ]
+    )
+    db.commit()
+    items = [item for item in unchecked_items(db, date(2026, 1, 14)) if item.system_id in (1, 2, 11, 20)]
+
+    (users, system_items), queries = count_queries(engine, lambda: group_unchecked_items(db, items))
+
+    assert queries == 2
+    assert sorted(user.name for user in users) == ["담당자2", "담당자3"]
+    assert system_items == {
+        "시스템01": ["항목1-1", "항목1-2", "항목1-3"],
+        "시스템02": ["항목2-1", "항목2-2", "항목2-3"],
+        "시스템11": ["항목11-1", "항목11-2", "항목11-3"],
+        "시스템20": ["항목20-1", "항목20-2", "항목20-3"],
+    }
+    assert group_unchecked_items(db, []) == (set(), {})
@@ -0,0 +1,62 @@
+"""느린 쿼리 기록 테스트 (전체 스캔 테이블, 파라미터 형태)"""
+from datetime import date
+
+from services.slow_queries import explain, full_scan_tables, parameter_shape
+
+
+def test_full_scan_tables_resolves_sqlite_aliases():
+    statement = (
+        "SELECT * FROM checklist_records AS r JOIN check_items i ON i.id = r.check_item_id "
+        "WHERE r.notes = ?"
+    )
+    plan = ["SCAN r", "  SEARCH i USING INTEGER PRIMARY KEY (rowid=?)"]
+
+    assert full_scan_tables(plan, statement) == ["checklist_records"]
+    # 별칭을 찾을 수 없으면 실행 계획의 이름을 그대로 기록
+    assert full_scan_tables(plan) == ["r"]
+
+
+def test_full_scan_tables_ignores_index_scans_and_subqueries():
+    plan = [
+        "SCAN checklist_records USING COVERING INDEX ix_records_date",
+        "SCAN r USING INDEX ix_records_item",
+        "CO-ROUTINE s",
+        "  SCAN check_items",
+        "  USE TEMP B-TREE FOR GROUP BY",
+        "SCAN s",
+        "SCAN CONSTANT ROW",
+    ]
+
+    assert full_scan_tables(plan, "SELECT * FROM (SELECT system_id FROM check_items GROUP BY system_id) s") == [
+        "check_items"
+    ]
+
+
+def test_full_scan_tables_old_sqlite_and_postgres_formats():
+    assert full_scan_tables(["SCAN TABLE users AS u", "SCAN TABLE systems USING INDEX ix"]) == ["users"]
+    assert full_scan_tables(
+        ["Hash Join  (cost=1.00..2.00 rows=1 width=8)", "  ->  Seq Scan on checklist_records r  (cost=0.00..1.00)"]
+    ) == ["checklist_records"]
+
+
+def test_full_scan_tables_from_real_sqlite_plan(engine):
+    statement = "SELECT r.id FROM checklist_records r WHERE r.notes = ?"
+    with engine.connect() as conn:
+        plan = explain(conn, statement, ("확인",))
+
+    assert full_scan_tables(plan, statement) == ["checklist_records"]
+
+
+def test_parameter_shape_keeps_only_types():
+    assert parameter_shape({"user_id": 3, "check_date": date(2026, 1, 15), "notes": None}) == {
+        "user_id": "int",
+        "check_date": "date",
+        "notes": "NULL",
+    }
+    assert parameter_shape((3, "김담당")) == ["int", "str"]
+    assert parameter_shape(None) == []
+
+
+def test_parameter_shape_executemany():
+    assert parameter_shape([(1, "PASS"), (2, "FAIL")], executemany=True) == {"rows": 2, "row": ["int", "str"]}
+    assert parameter_shape([], executemany=True) == {"rows": 0, "row": None}
@@ -0,0 +1,143 @@
+"""체크 기록/로그 상태 컬럼 인코딩 변경 테스트 (문자열 → SMALLINT)"""
+import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.exc import IntegrityError
+
+from services.database import Base
+from models.models import ChecklistRecord, ChecklistRecordLog
+from services.status_migration import legacy_status_tables, migrate_status_encoding
+
+# 인코딩 변경 전 스키마 (상태/액션을 문자열로 저장)
+LEGACY_DDL = [
+    """
+    CREATE TABLE checklist_records (
+        id INTEGER NOT NULL PRIMARY KEY,
+        user_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+        check_item_id INTEGER NOT NULL REFERENCES check_items (id) ON DELETE CASCADE,
+        check_date DATE NOT NULL,
+        status VARCHAR(10) NOT NULL,
+        notes TEXT,
+        checked_at DATETIME DEFAULT (CURRENT_TIMESTAMP),
+        CONSTRAINT check_status CHECK (status IN ('PASS', 'FAIL'))
+    )
+    """,
+    "CREATE INDEX ix_checklist_records_id ON checklist_records (id)",
+    # 모델에 없는 인덱스 (운영 DB에서 직접 추가한 경우, 변환 후 다시 생성되어야 함)
+    "CREATE INDEX ix_records_item_date ON checklist_records (check_item_id, check_date)",
+    """
+    CREATE TABLE checklist_records_logs (
+        id INTEGER NOT NULL PRIMARY KEY,
+        user_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+        check_item_id INTEGER NOT NULL REFERENCES check_items (id) ON DELETE CASCADE,
+        check_date DATE NOT NULL,
+        status VARCHAR(10) NOT NULL,
+        notes TEXT,
+        action VARCHAR(20) NOT NULL,
+        created_at DATETIME DEFAULT (CURRENT_TIMESTAMP),
+        CONSTRAINT check_log_status CHECK (status IN ('PASS', 'FAIL')),
+        CONSTRAINT check_log_action CHECK (action IN ('CREATE', 'UPDATE', 'DELETE'))
+    )
+    """,
+    "CREATE INDEX ix_checklist_records_logs_id ON checklist_records_logs (id)",
+    """
+    CREATE VIEW checklist_records_view AS
+    SELECT cr.id, cr.user_id, cr.check_item_id, cr.check_date, cr.status, cr.notes, cr.checked_at
+    FROM checklist_records cr
+    """,
+]
+
+LEGACY_RECORDS = [
+    (1, 1, 1, "2026-01-14", "PASS", None, "2026-01-14 09:00:00"),
+    (2, 1, 2, "2026-01-14", "FAIL", "디스크 부족", "2026-01-14 09:05:00"),
+    (3, 2, 1, "2026-01-15", "PASS", "정상", "2026-01-15 09:00:00"),
+]
+LEGACY_LOGS = [
+    (1, 1, 2, "2026-01-14", "PASS", None, "CREATE", "2026-01-14 09:00:00"),
+    (2, 1, 2, "2026-01-14", "FAIL", "디스크 부족", "UPDATE", "2026-01-14 09:05:00"),
+    (3, 1, 2, "2026-01-14", "FAIL", None, "DELETE", "2026-01-14 09:10:00"),
+    (4, 2, 1, "2026-01-15", "PASS", "정상", "CREATE", "2026-01-15 09:00:00"),
+]
+
+
+@pytest.fixture
+def legacy_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{(tmp_path / 'legacy.db').as_posix()}")
+    encoded_tables = [ChecklistRecord.__table__, ChecklistRecordLog.__table__]
+    Base.metadata.create_all(engine, tables=[t for t in Base.metadata.sorted_tables if t not in encoded_tables])
+    with engine.begin() as conn:
+        for ddl in LEGACY_DDL:
+            conn.exec_driver_sql(ddl)
+        conn.exec_driver_sql("INSERT INTO checklist_records VALUES (?, ?, ?, ?, ?, ?, ?)", LEGACY_RECORDS)
+        conn.exec_driver_sql("INSERT INTO checklist_records_logs VALUES (?, ?, ?, ?, ?, ?, ?, ?)", LEGACY_LOGS)
+    yield engine
+    engine.dispose()
+
+
+def raw_rows(engine, sql):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(sql).fetchall()
+
+
+def test_migration_encodes_statuses(legacy_engine, session_factory):
+    assert legacy_status_tables(legacy_engine) == ["checklist_records", "checklist_records_logs"]
+
+    stats = migrate_status_encoding(legacy_engine)
+
+    assert stats == {
+        "tables": {"checklist_records": 3, "checklist_records_logs": 4},
+        "views_dropped": ["checklist_records_view"],
+    }
+    assert legacy_status_tables(legacy_engine) == []
+
+    # DB에는 코드, ORM에서는 기존과 같은 문자열
+    assert raw_rows(legacy_engine, "SELECT id, status FROM checklist_records ORDER BY id") == [(1, 1), (2, 2), (3, 1)]
+    assert raw_rows(legacy_engine, "SELECT status, action FROM checklist_records_logs ORDER BY id") == [
+        (1, 1),
+        (2, 2),
+        (2, 3),
+        (1, 1),
+    ]
+    db = session_factory(bind=legacy_engine)
+    try:
+        records = db.query(ChecklistRecord).order_by(ChecklistRecord.id).all()
+        assert [(r.id, r.user_id, r.check_item_id, r.status, r.notes) for r in records] == [
+            (row[0], row[1], row[2], row[4], row[5]) for row in LEGACY_RECORDS
+        ]
+        logs = db.query(ChecklistRecordLog).order_by(ChecklistRecordLog.id).all()
+        assert [(log.status, log.action, log.notes) for log in logs] == [(row[4], row[6], row[5]) for row in LEGACY_LOGS]
+    finally:
+        db.close()
+
+    inspector = inspect(legacy_engine)
+    assert "checklist_records_view" not in inspector.get_view_names()
+    assert "checklist_records_legacy" not in inspector.get_table_names()
+    assert "ix_records_item_date" in {index["name"] for index in inspector.get_indexes("checklist_records")}
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "INSERT INTO checklist_records (user_id, check_item_id, check_date, status) VALUES (1, 1, '2026-01-16', 'PASS')",
+        "INSERT INTO checklist_records (user_id, check_item_id, check_date, status) VALUES (1, 1, '2026-01-16', 3)",
+        "INSERT INTO checklist_records_logs (user_id, check_item_id, check_date, status, action) "
+        "VALUES (1, 1, '2026-01-16', 1, 4)",
+    ],
+)
+def test_check_constraints_reject_unknown_codes(legacy_engine, sql):
+    migrate_status_encoding(legacy_engine)
+
+    with pytest.raises(IntegrityError):
+        with legacy_engine.begin() as conn:
+            conn.exec_driver_sql(sql)
+
+
+def test_second_run_is_noop(legacy_engine):
+    migrate_status_encoding(legacy_engine)
+    before = raw_rows(legacy_engine, "SELECT * FROM checklist_records ORDER BY id")
+    schema = raw_rows(legacy_engine, "SELECT type, name, sql FROM sqlite_master ORDER BY name")
+
+    assert migrate_status_encoding(legacy_engine, dry_run=True) == {"tables": {}, "views_dropped": []}
+    assert migrate_status_encoding(legacy_engine) == {"tables": {}, "views_dropped": []}
+
+    assert raw_rows(legacy_engine, "SELECT * FROM checklist_records ORDER BY id") == before
+    assert raw_rows(legacy_engine, "SELECT type, name, sql FROM sqlite_master ORDER BY name") == schema
@@ -44,7 +44,7 @@ CREATE TABLE checklist_records (
     user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
     check_item_id INTEGER REFERENCES check_items(id) ON DELETE CASCADE,
     check_date DATE NOT NULL,
-    status VARCHAR(10) NOT NULL CHECK (status IN ('PASS', 'FAIL')),
+    status SMALLINT NOT NULL CHECK (status IN (1, 2)),  -- 1=PASS, 2=FAIL
     notes TEXT,
     checked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     UNIQUE(user_id, check_item_id, check_date)
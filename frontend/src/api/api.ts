@@ -184,6 +184,10 @@ export const schedulerAPI = {
     const response = await api.get("/api/scheduler/status");
     return response.data;
   },
+  getRun: async (runId: number) => {
+    const response = await api.get(`/api/scheduler/runs/${runId}`);
+    return response.data;
+  },
   cancelJob: async (jobId: string) => {
     const response = await api.delete(`/api/scheduler/jobs/${jobId}`);
     return response.data;
@@ -236,6 +240,14 @@ export const consoleAPI = {
     );
     return response.data;
   },
+  uploadImport: async (kind: "checklist" | "users", file: File) => {
+    const formData = new FormData();
+    formData.append("file", file);
+    const response = await api.post(`/api/console/import/${kind}`, formData, {
+      headers: { "Content-Type": "multipart/form-data" },
+    });
+    return response.data;
+  },
 };
 
 export default api;